@@ -0,0 +1,64 @@
+"""Benchmark of the concurrent calls performed with SHVBase.
+
+Run it with ``python -m benchmarks.calls`` from the project directory.
+"""
+
+import argparse
+import asyncio
+import time
+
+from shv import SHV_VERSION
+from shv.rpcapi import SHVBase
+from shv.rpctransport import RpcClientPipe, RpcProtocolBlock
+
+
+async def calls(count: int, inflight: int, many: bool) -> float:
+    """Perform calls with given number of requests in flight at once.
+
+    :param count: Number of calls to be performed.
+    :param inflight: Number of concurrent calls.
+    :param many: Use :meth:`SHVBase.call_many` instead of concurrent tasks.
+    :return: Number of calls per second.
+    """
+    client1, client2 = await RpcClientPipe.open_pair(RpcProtocolBlock)
+    caller = SHVBase(client1, peer_shv_version=SHV_VERSION)
+    callee = SHVBase(client2, peer_shv_version=SHV_VERSION)
+
+    async def worker(n: int) -> None:
+        for _ in range(n):
+            await caller.call(".app", "ping")
+
+    start = time.perf_counter()
+    if many:
+        requests = count * [(".app", "ping", None)]
+        async for _ in caller.call_many(requests, window=inflight):
+            pass
+        res = count / (time.perf_counter() - start)
+    else:
+        await asyncio.gather(*(worker(count // inflight) for _ in range(inflight)))
+        res = (count // inflight * inflight) / (time.perf_counter() - start)
+    await caller.disconnect()
+    await callee.disconnect()
+    return res
+
+
+def main() -> None:
+    """Run the benchmark and print calls per second for various concurrency."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", type=int, default=20000, help="Number of calls")
+    parser.add_argument(
+        "-c",
+        type=int,
+        action="append",
+        help="Number of calls in flight (can be specified multiple times)",
+    )
+    args = parser.parse_args()
+
+    for inflight in args.c or (1, 10, 100, 1000, 10000):
+        for impl, many in (("tasks", False), ("call_many", True)):
+            res = asyncio.run(calls(args.n, inflight, many))
+            print(f"{inflight:6} in flight {impl:10} {res:12.0f} calls/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark of the ChainPack coding of the typical SHV RPC messages.
+
+Run it with ``python -m benchmarks.chainpack`` from the project directory.
+"""
+
+import argparse
+import timeit
+
+from shv.chainpack import (
+    ChainPack,
+    ChainPackBufferWriter,
+    ChainPackReader,
+    ChainPackWriter,
+)
+from shv.rpcmessage import RpcMessage
+
+MESSAGES: dict[str, RpcMessage] = {
+    "request": RpcMessage.request("test/device/track/1", "get", cids=[4, 2]),
+    "signal": RpcMessage.signal("test/device/track/1", value=[1, 2, 3, 4]),
+    "response": RpcMessage.request("test/device/track", "ls").make_response([
+        {"name": str(i), "value": i * 1.5, "flags": [True, None, "some"]}
+        for i in range(64)
+    ]),
+}
+
+
+def route(msg: RpcMessage) -> bytes:
+    """Modify message the same way broker does when it routes a response."""
+    msg.caller_ids = msg.caller_ids[:-1]
+    return msg.to_chainpack()
+
+
+def forward(msg: RpcMessage) -> tuple[bytearray, bytes | bytearray | memoryview]:
+    """Variant of :func:`route` that doesn't copy body as transport does."""
+    msg.caller_ids = msg.caller_ids[:-1]
+    writer = ChainPackBufferWriter()
+    body = msg.write_chainpack_head(writer)
+    return writer.buffer, body
+
+
+def main() -> None:
+    """Run the benchmark and print messages per second for each implementation."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", type=int, default=20000, help="Number of iterations")
+    args = parser.parse_args()
+
+    for name, msg in MESSAGES.items():
+        data = msg.to_chainpack()
+        n = args.n if name != "response" else args.n // 50
+        for impl, func in (
+            ("unpack stream", lambda: ChainPackReader.unpack(data)),  # noqa: B023
+            ("unpack buffer", lambda: ChainPack.unpack(data)),  # noqa: B023
+            ("pack stream", lambda: ChainPackWriter.pack(msg.value)),  # noqa: B023
+            ("pack buffer", lambda: ChainPack.pack(msg.value)),  # noqa: B023
+            ("route eager", lambda: route(RpcMessage(ChainPack.unpack(data)))),  # noqa: B023
+            ("route lazy", lambda: route(RpcMessage.from_chainpack(data))),  # noqa: B023
+            ("forward", lambda: forward(RpcMessage.from_chainpack(data))),  # noqa: B023
+        ):
+            t = timeit.timeit(func, number=n)
+            print(f"{name:10} {len(data):6}B {impl:14} {n / t:12.0f} msg/s")
+
+
+if __name__ == "__main__":
+    main()
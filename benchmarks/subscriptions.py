@@ -0,0 +1,60 @@
+"""Benchmark of the signal lookup in the broker's subscriptions.
+
+Run it with ``python -m benchmarks.subscriptions`` from the project directory.
+"""
+
+import argparse
+import timeit
+
+from shv.rpcri import RpcRIIndex, rpcri_match
+
+SIGNALS: list[tuple[str, str, str]] = [
+    ("site/device/42/track/3", "get", "chng"),
+    ("site/device/9999/status", "get", "chng"),
+    ("other/node", "ls", "lsmod"),
+]
+
+
+def subscriptions(count: int) -> list[str]:
+    """Generate subscriptions as we would see them on a big site."""
+    res = ["**:*:lsmod", "site/**:*:fchng"]
+    for i in range(count - len(res)):
+        match i % 4:
+            case 0:
+                res.append(f"site/device/{i}/**:*:*chng")
+            case 1:
+                res.append(f"site/device/{i}/track/*:get:chng")
+            case 2:
+                res.append(f"site/device/{i}/status:*:*")
+            case 3:
+                res.append(f"site/*/{i}/**:*:*")
+    return res
+
+
+def main() -> None:
+    """Run the benchmark and print signals per second for each implementation."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", type=int, default=1000, help="Number of iterations")
+    parser.add_argument("-s", type=int, default=10000, help="Number of subscriptions")
+    args = parser.parse_args()
+
+    subs = subscriptions(args.s)
+    index = RpcRIIndex()
+    for ri in subs:
+        index.add(ri)
+
+    for path, method, signal in SIGNALS:
+        for impl, n, func in (
+            (
+                "linear",
+                max(args.n // 100, 1),
+                lambda: [s for s in subs if rpcri_match(s, path, method, signal)],  # noqa: B023
+            ),
+            ("index", args.n, lambda: list(index.match(path, method, signal))),  # noqa: B023
+        ):
+            t = timeit.timeit(func, number=n)
+            print(f"{path:24} {impl:8} {n / t:12.0f} signals/s")
+
+
+if __name__ == "__main__":
+    main()
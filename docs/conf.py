@@ -82,6 +82,7 @@ intersphinx_mapping = {
     "python": ("https://docs.python.org/3", None),
     "websockets": ("https://websockets.readthedocs.io/en/stable/", None),
     "can": ("https://python-can.readthedocs.io/en/stable/", None),
+    "numpy": ("https://numpy.org/doc/stable/", None),
 }
 nitpick_ignore = {
     # These are undocumented in upstread Python documentation
@@ -24,6 +24,7 @@
         nativeCheckInputs =
           nativeCheckInputs
           ++ optional-dependencies.canbus
+          ++ optional-dependencies.numpy
           ++ optional-dependencies.websockets;
         disabledTests = [
           "TestCAN" # These tests take a long time so let's disable them in Nix
@@ -2,15 +2,38 @@
 
 import argparse
 import asyncio
+import collections.abc
+import itertools
 import logging
+import multiprocessing
+import multiprocessing.connection
 import pathlib
+import tempfile
 
+from ..rpcurl import RpcProtocol
 from .broker import RpcBroker
 from .config import RpcBrokerConfig
 
+try:
+    import uvloop
+
+    UVLOOP_IMPORT = None
+except ImportError as exc:  # pragma: no cover
+    UVLOOP_IMPORT = exc
+
 logger = logging.getLogger(__name__)
 
 
+def _positive_int(value: str) -> int:
+    try:
+        res = int(value)
+    except ValueError:
+        res = 0
+    if res < 1:
+        raise argparse.ArgumentTypeError(f"must be positive integer: {value}")
+    return res
+
+
 def parse_args() -> argparse.Namespace:
     """Parse passed arguments and return result."""
     parser = argparse.ArgumentParser("pyshvbroker", description="Silicon Heaven broker")
@@ -47,17 +70,109 @@ def parse_args() -> argparse.Namespace:
         type=pathlib.Path,
         help="Configuration file",
     )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        action="store",
+        type=_positive_int,
+        help="Number of worker processes (overrides 'workers' in configuration)",
+    )
+    loops = [loop.value for loop in RpcBrokerConfig.EventLoop]
+    parser.add_argument(
+        "--loop",
+        action="store",
+        choices=loops,
+        help="Event loop implementation (overrides 'loop' in configuration). "
+        + f"Supported loops: {', '.join(loops)}",
+    )
     return parser.parse_args()
 
 
-async def _broker_main(config: RpcBrokerConfig) -> None:
-    broker = RpcBroker(config)
+def loop_factory(
+    config: RpcBrokerConfig,
+) -> collections.abc.Callable[[], asyncio.AbstractEventLoop] | None:
+    """Provide factory for the event loop broker should run in.
+
+    The automatic selection uses asyncio event loop also when broker should use
+    TTY because it is not supported by uvloop.
+
+    :param config: Broker configuration with requested event loop.
+    :return: Factory creating new event loop or ``None`` for the asyncio's
+      default one.
+    :raise ImportError: When uvloop is requested but not installed.
+    """
+    match config.loop:
+        case RpcBrokerConfig.EventLoop.ASYNCIO:
+            return None
+        case RpcBrokerConfig.EventLoop.UVLOOP:
+            if UVLOOP_IMPORT is not None:
+                raise UVLOOP_IMPORT
+        case RpcBrokerConfig.EventLoop.AUTO:
+            if UVLOOP_IMPORT is not None:
+                logger.debug("uvloop is not available, using asyncio event loop")
+                return None
+            if any(
+                url.protocol is RpcProtocol.TTY
+                for url in itertools.chain(
+                    config.listen, (c.url for c in config.connect)
+                )
+            ):
+                logger.debug("TTY is not supported by uvloop, using asyncio event loop")
+                return None
+    return uvloop.new_event_loop
+
+
+async def _broker_main(
+    config: RpcBrokerConfig, shard: RpcBroker.Shard | None = None
+) -> None:
+    broker = RpcBroker(config, shard)
     try:
         await broker.serve_forever()
     finally:
         await broker.terminate()
 
 
+def _run(config: RpcBrokerConfig, shard: RpcBroker.Shard | None = None) -> None:
+    with asyncio.Runner(loop_factory=loop_factory(config)) as runner:
+        runner.run(_broker_main(config, shard))
+
+
+def _worker_main(config: RpcBrokerConfig, shard: RpcBroker.Shard) -> None:
+    try:
+        _run(config, shard)
+    except KeyboardInterrupt:
+        pass
+
+
+def _sharded_main(config: RpcBrokerConfig) -> None:
+    """Run broker in multiple worker processes.
+
+    Workers are terminated once any of them exits.
+    """
+    ctx = multiprocessing.get_context("fork")
+    with tempfile.TemporaryDirectory(prefix="pyshvbroker-") as directory:
+        workers = [
+            ctx.Process(
+                target=_worker_main,
+                args=(
+                    config,
+                    RpcBroker.Shard(i, config.workers, pathlib.Path(directory)),
+                ),
+                name=f"pyshvbroker-{i}",
+            )
+            for i in range(config.workers)
+        ]
+        for worker in workers:
+            worker.start()
+        try:
+            multiprocessing.connection.wait([w.sentinel for w in workers])
+        finally:
+            for worker in workers:
+                worker.terminate()
+            for worker in workers:
+                worker.join()
+
+
 def main() -> None:
     """Application's entrypoint."""
     args = parse_args()
@@ -70,8 +185,15 @@ def main() -> None:
     )
 
     brokerconf = RpcBrokerConfig.load(args.config)
+    if args.workers is not None:
+        brokerconf.workers = args.workers
+    if args.loop is not None:
+        brokerconf.loop = RpcBrokerConfig.EventLoop(args.loop)
     try:
-        asyncio.run(_broker_main(brokerconf))
+        if brokerconf.workers > 1:
+            _sharded_main(brokerconf)
+        else:
+            _run(brokerconf)
     except KeyboardInterrupt:
         pass
 
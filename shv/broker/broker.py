@@ -4,15 +4,18 @@ from __future__ import annotations
 
 import abc
 import asyncio
-import collections
 import collections.abc
 import contextlib
+import dataclasses
+import itertools
 import logging
+import pathlib
 import secrets
 import time
 import typing
 
-from ..rpcapi import SHVBase
+from ..path import PathTree
+from ..rpcapi import RpcSendQueue, SHVBase
 from ..rpcapi.client import SHVClient
 from ..rpcdef import (
     RpcAccess,
@@ -26,8 +29,15 @@ from ..rpcdef import (
 from ..rpclogin import RpcLogin
 from ..rpcmessage import RpcMessage
 from ..rpcparam import shvargt
-from ..rpcri import rpcri_match, rpcri_relative_to
-from ..rpctransport import RpcClient, RpcServer, create_rpc_server, init_rpc_client
+from ..rpcri import RpcRIIndex, rpcri_relative_to
+from ..rpctransport import (
+    RpcClient,
+    RpcServer,
+    connect_rpc_client,
+    create_rpc_server,
+    init_rpc_client,
+)
+from ..rpcurl import RpcProtocol, RpcUrl
 from ..value import SHVType
 from .config import RpcBrokerConfigABC, RpcBrokerRoleABC
 from .utils import nmax, nmin
@@ -45,6 +55,18 @@ class RpcBroker:
     class Client(SHVBase):
         """Single client connected to the broker."""
 
+        SEND_QUEUE_LIMIT: int = 256
+        """Number of messages queued for peer at which it is congested.
+
+        Clients that propagate requests or responses to the congested peer
+        stop receiving messages until queue is at least half empty.
+        """
+        SEND_QUEUE_BYTES: int = 1 << 20
+        """Number of bytes queued for peer at which it is congested.
+
+        This works the same way as :attr:`SEND_QUEUE_LIMIT`.
+        """
+
         def __init__(
             self,
             client: RpcClient,
@@ -53,11 +75,17 @@ class RpcBroker:
             **kwargs: typing.Any,  # noqa ANN401
         ) -> None:
             super().__init__(client, *args, **kwargs)
-            self._send_queue: collections.deque[RpcMessage]
-            self._send_queue = collections.deque(maxlen=16)
+            self._send_queue = broker.config.send_queue()
             self.__broker = broker
             self.__broker_client_id: int | None = None
             self.__peer_is_broker: bool | None = None
+            self.__uncongested = asyncio.Event()
+            self.__uncongested.set()
+            self.task.add_done_callback(lambda _: self.__uncongested.set())
+            self.throttled = 0
+            """Number of times receive was paused due to the congested peer."""
+            self.throttled_time = 0.0
+            """Total number of seconds receive was paused for."""
 
         @property
         def broker(self) -> RpcBroker:
@@ -99,16 +127,63 @@ class RpcBroker:
             This provides a way for other clients to queue messages to be sent
             by this client. THis is because Broker peers are propagating
             messages from one to the other. This won't block but it also won't
-            ensure that message won't be dropped.
+            ensure that message won't be dropped (see :attr:`send_queue`). The
+            clients propagating messages to this peer are instead throttled
+            once it is :attr:`congested`.
 
             :param msg: Message to be sent.
             """
-            self._send_queue.append(msg)
-            self._idle_message_ready()
+            if self._send_queue.push(msg):
+                self._idle_message_ready()
+            if self.__uncongested.is_set() and self.congested and not self.task.done():
+                self.__uncongested.clear()
+
+        @property
+        def send_queue(self) -> RpcSendQueue:
+            """Queue of messages propagated to this peer by :meth:`send`.
+
+            Responses are sent before requests and requests before signals.
+            It also provides counters of dropped messages.
+            """
+            return self._send_queue
+
+        @property
+        def congested(self) -> bool:
+            """If there are too many messages queued for this peer.
+
+            See :attr:`SEND_QUEUE_LIMIT` and :attr:`SEND_QUEUE_BYTES`.
+            """
+            return (
+                len(self._send_queue) >= self.SEND_QUEUE_LIMIT
+                or self._send_queue.nbytes >= self.SEND_QUEUE_BYTES
+            )
+
+        async def _throttle(self, peer: RpcBroker.Client) -> None:
+            """Pause until given peer is no longer congested.
+
+            This is called after message is propagated to the peer. It is
+            called from the receive loop and thus it stops the receive from
+            this client. That propagates back-pressure to the sender instead
+            of queueing messages without a bound.
+            """
+            if peer.__uncongested.is_set():
+                return
+            logger.debug("Client %s throttled", self.broker_client_id)
+            self.throttled += 1
+            start = time.monotonic()
+            try:
+                await peer.__uncongested.wait()
+            finally:
+                self.throttled_time += time.monotonic() - start
 
         def _idle_message(self) -> RpcMessage | None:
-            if self._send_queue:
-                return self._send_queue.popleft()
+            if (msg := self._send_queue.pop()) is not None:
+                if not self.__uncongested.is_set() and (
+                    len(self._send_queue) <= self.SEND_QUEUE_LIMIT // 2
+                    and self._send_queue.nbytes <= self.SEND_QUEUE_BYTES // 2
+                ):
+                    self.__uncongested.set()
+                return msg
             return super()._idle_message()
 
         async def disconnect(self) -> None:  # noqa: D102
@@ -143,24 +218,7 @@ class RpcBroker:
                     # Append user ID
                     if msg.user_id is not None:
                         msg.user_id += (";" if msg.user_id else "") + self.local_user_id
-                    # Check if we should handle it ourself (else propagate it)
-                    if (cpath := self.__broker.client_on_path(msg.path)) is None:
-                        await super()._message(msg)
-                        return
-                    # Protect sub-broker currentClient access
-                    if cpath[1] == ".broker/currentClient" and (
-                        msg.method in {"subscribe", "unsubscribe"}
-                        or msg.rpc_access < RpcAccess.SUPER_SERVICE
-                    ):
-                        await self._send(
-                            msg.make_response(RpcMethodNotFoundError("No access"))
-                        )
-                        return
-                    # Propagate to some peer
-                    assert self.__broker_client_id is not None
-                    msg.caller_ids = [*msg.caller_ids, self.__broker_client_id]
-                    msg.path = cpath[1]
-                    cpath[0].send(msg)
+                    await self._request_forward(msg)
 
                 case (
                     RpcMessage.Type.RESPONSE
@@ -172,13 +230,40 @@ class RpcBroker:
                         await super()._message(msg)
                         return
                     cid = cids.pop()
+                    # Only caller IDs are encoded again when message is sent
+                    # and the rest is forwarded as it was received.
                     msg.caller_ids = cids
                     if (peer := self.__broker.get_client(cid)) is not None:
                         peer.send(msg)
+                        await self._throttle(peer)
 
                 case RpcMessage.Type.SIGNAL:
                     self.__broker.signal_from(msg, self)
 
+        async def _request_forward(self, msg: RpcMessage) -> None:
+            """Handle request or propagate it to the peer mounted on its path.
+
+            :param msg: Request with access level already limited.
+            """
+            # Check if we should handle it ourself (else propagate it)
+            if (cpath := self.__broker.client_on_path(msg.path)) is None:
+                await super()._message(msg)
+                return
+            # Protect sub-broker currentClient access
+            if cpath[1] == ".broker/currentClient" and (
+                msg.method in {"subscribe", "unsubscribe"}
+                or msg.rpc_access is None
+                or msg.rpc_access < RpcAccess.SUPER_SERVICE
+            ):
+                await self._send(msg.make_response(RpcMethodNotFoundError("No access")))
+                return
+            # Propagate to some peer
+            assert self.__broker_client_id is not None
+            msg.caller_ids = [*msg.caller_ids, self.__broker_client_id]
+            msg.path = cpath[1]
+            cpath[0].send(msg)
+            await self._throttle(cpath[0])
+
         def _reset(self) -> None:
             self.__peer_is_broker = None
             self._unregister()
@@ -203,11 +288,9 @@ class RpcBroker:
                     yield "currentClient"
                     yield "client"
                 case ".broker/client":
-                    yield from (
-                        str(c.broker_client_id) for c in self.__broker.clients()
-                    )
+                    yield from (str(cid) for cid in self.__broker.client_ids())
                 case _:
-                    for mnt, _ in self.broker.mounted_clients():
+                    for mnt in self.broker.mount_points():
                         if not path:
                             yield mnt.split("/", maxsplit=1)[0]
                         elif mnt.startswith(path + "/"):
@@ -264,24 +347,38 @@ class RpcBroker:
                         case "clientInfo":
                             if not isinstance(request.param, int):
                                 raise RpcInvalidParamError("Use Int")
+                            if (
+                                link := self.broker.shard_link(request.param)
+                            ) is not None:
+                                return await link.call(
+                                    ".broker", "clientInfo", request.param
+                                )
                             client = self.broker.get_client(request.param)
                             return client.infomap() if client is not None else None
                         case "mountedClientInfo":
                             if not isinstance(request.param, str):
                                 raise RpcInvalidParamError("Use String with SHV path")
                             client_pth = self.broker.client_on_path(request.param)
-                            if client_pth is not None:
-                                return client_pth[0].infomap()
-                            return None
+                            if client_pth is None:
+                                return None
+                            if isinstance(client_pth[0], RpcBroker.ShardClient):
+                                return await client_pth[0].call(
+                                    ".broker", "mountedClientInfo", request.param
+                                )
+                            return client_pth[0].infomap()
                         case "clients":
-                            return list(
-                                c.broker_client_id for c in self.broker.clients()
-                            )
+                            return list(self.broker.client_ids())
                         case "mounts":
-                            return [mnt for mnt, _ in self.broker.mounted_clients()]
+                            return list(self.broker.mount_points())
                         case "disconnectClient":
                             if not isinstance(request.param, int):
                                 raise RpcInvalidParamError("Use Int")
+                            if (
+                                link := self.broker.shard_link(request.param)
+                            ) is not None:
+                                return await link.call(
+                                    ".broker", "disconnectClient", request.param
+                                )
                             client = self.broker.get_client(request.param)
                             if client is None:
                                 raise RpcMethodCallExceptionError(
@@ -321,6 +418,11 @@ class RpcBroker:
                 "idleTimeMax": int(self.IDLE_TIMEOUT * 1000),
                 "role": self.role.name if self.role is not None else None,
                 "client": str(self.client),
+                "sendQueue": len(self._send_queue),
+                "sendQueueBytes": self._send_queue.nbytes,
+                "congested": self.congested,
+                "throttled": self.throttled,
+                "throttledTime": int(self.throttled_time * 1000),
             }
 
         def _subscriptions(self) -> dict[str, int | None]:
@@ -373,8 +475,8 @@ class RpcBroker:
                     await activity_task
 
                 self._unregister()
-            self.client.disconnect()
-            await self.client.wait_disconnect()
+                self.client.disconnect()
+                await self.client.wait_disconnect()
 
         async def _activity_loop(self) -> None:
             """Loop run alongside with :meth:`_loop`.
@@ -394,6 +496,8 @@ class RpcBroker:
                 return await super()._message(msg)
             if not msg.type == RpcMessage.Type.REQUEST:
                 return  # Ignore anything other than requests before login
+            if not self._decode_body(msg):
+                return
             match msg.path, msg.method:
                 case "", "hello":
                     if not self._nonce:
@@ -483,13 +587,152 @@ class RpcBroker:
             await super()._login()
             self._register()
 
-    def __init__(self, config: RpcBrokerConfigABC) -> None:
+    class ShardClient(Client):
+        """Broker client that links this worker with other worker of the same broker.
+
+        The link propagates requests, responses and signals between the workers
+        the same way as they are propagated between clients of a single
+        broker. On top of that the workers inform each other about their
+        clients and mount points with signals on :attr:`PATH`. The link is not
+        reported as a client of the broker.
+        """
+
+        PATH: typing.ClassVar[str] = ".broker/shard"
+        """SHV path of signals exchanged between workers about their clients."""
+
+        def __init__(self, client: RpcClient, broker: RpcBroker) -> None:
+            super().__init__(client, broker)
+            # Messages exchanged between workers must not be dropped
+            self._send_queue = RpcSendQueue(
+                dict.fromkeys(RpcSendQueue.Priority), coalesce=False
+            )
+            self.synced = asyncio.Event()
+            """Set once the other worker informed us about all its clients."""
+            self.__sync_sent = False
+            self._register()
+
+        @property
+        def role(self) -> RpcBrokerRoleABC:
+            """Role with full access as access is checked by the other worker."""
+            return _SHARD_ROLE
+
+        def sync(self) -> None:
+            """Inform the other worker about all clients of this worker."""
+            self.__sync_sent = True
+            for client in self.broker.clients():
+                self.send(
+                    RpcMessage.signal(
+                        self.PATH,
+                        "register",
+                        value=[
+                            client.broker_client_id,
+                            self.broker.client_mountpoint(client),
+                        ],
+                    )
+                )
+            self.send(RpcMessage.signal(self.PATH, "sync"))
+
+        async def _loop(self) -> None:
+            try:
+                await super()._loop()
+            finally:
+                self._unregister()
+
+        async def _message(self, msg: RpcMessage) -> None:
+            match msg.type:
+                case RpcMessage.Type.REQUEST | RpcMessage.Type.REQUEST_ABORT:
+                    # Access and user ID were handled by the other worker and
+                    # only its own requests come without access level.
+                    if msg.rpc_access is None:
+                        msg.rpc_access = RpcAccess.ADMIN
+                    await self._request_forward(msg)
+                case RpcMessage.Type.SIGNAL if msg.path == self.PATH:
+                    match msg.signal_name, msg.param:
+                        case "register", [int() as cid, (str() | None) as mount_point]:
+                            self.broker._shard_register(self, cid, mount_point)
+                        case "unregister", int() as cid:
+                            self.broker._shard_unregister(cid)
+                        case "sync", _:
+                            if not self.__sync_sent:
+                                self.sync()
+                            self.synced.set()
+                case RpcMessage.Type.SIGNAL:
+                    self.broker.signal(msg, shard=False)
+                case _:
+                    await super()._message(msg)
+
+        async def _request_forward(self, msg: RpcMessage) -> None:
+            cpath = self.broker.client_on_path(msg.path)
+            if cpath is not None and isinstance(cpath[0], RpcBroker.ShardClient):
+                # Path is not ours and thus we have outdated info
+                await self._send(
+                    msg.make_response(RpcMethodNotFoundError("No such node"))
+                )
+                return
+            await super()._request_forward(msg)
+
+    @dataclasses.dataclass(frozen=True)
+    class Shard:
+        """Identification of the worker of the broker split to multiple processes.
+
+        Workers listen on the same TCP/IP ports (``SO_REUSEPORT``) and thus
+        clients are distributed between them. Workers are linked with each
+        other over Unix sockets with :class:`RpcBroker.ShardClient` and they
+        share their clients, mount points and subscriptions. The ``.broker``
+        node provides the same info on all workers.
+        """
+
+        index: int
+        """Index of this worker (from ``0`` to ``count - 1``)."""
+        count: int
+        """Number of workers."""
+        directory: pathlib.Path
+        """Directory with Unix sockets used to link workers together."""
+
+        def socket(self, index: int) -> pathlib.Path:
+            """Path to the Unix socket the worker listens on for links.
+
+            :param index: Index of the worker.
+            :return: Path to the socket.
+            """
+            return self.directory / f"shard{index}.sock"
+
+        def listens(self, url: RpcUrl) -> bool:
+            """Check if this worker should listen on the given URL.
+
+            Only TCP/IP based servers can listen in all workers. Others are
+            served only by the first worker.
+
+            :param url: URL the broker is configured to listen on.
+            :return: ``True`` if this worker should listen on the URL.
+            """
+            return (
+                self.index == 0
+                or url.protocol
+                in {
+                    RpcProtocol.TCP,
+                    RpcProtocol.TCPS,
+                    RpcProtocol.SSL,
+                    RpcProtocol.SSLS,
+                }
+                or (url.protocol is RpcProtocol.WS and url.port != -1)
+            )
+
+    def __init__(
+        self, config: RpcBrokerConfigABC, shard: RpcBroker.Shard | None = None
+    ) -> None:
         self.config = config
         """Configuration of the RPC Broker."""
+        self.shard = shard
+        """Identification of this worker if broker is split to multiple processes."""
         self.servers: dict[str, RpcServer] = {}
         """All servers managed by Broker where keys are their configured names."""
         self._clients: dict[int, RpcBroker.Client] = {}
         self._mounts: dict[str, int] = {}
+        self._mounts_tree: PathTree[int] = PathTree()
+        """Tree with mount points of :attr:`_mounts` for fast path lookup."""
+        self._mounts_cid: dict[int, str] = {}
+        """Reverse mapping of :attr:`_mounts` from client ID to mount point."""
         self._reserved_mount_points: set[str] = set()
         self._subs: dict[str, dict[int, float | None]] = {}
         """Subscriptions.
@@ -498,9 +741,27 @@ class RpcBroker:
         subscription was requested by and specified end of the subscription
         live for that specific client.
         """
+        self._subs_index = RpcRIIndex()
+        """Index of the :attr:`_subs` keys used to lookup signal subscriptions."""
         self._subs_task: asyncio.Task | None = None
         self.__subs_changed = asyncio.Event()
-        self.__next_caller_id = 0
+        self.signal_encodes_saved = 0
+        """Number of signal encodes saved by sharing signal between clients.
+
+        Signal is encoded only once and the same data are sent to all clients
+        it is delivered to. This counts the deliveries that did not require
+        encode.
+        """
+        self._shard_server: RpcServer | None = None
+        self._shard_links: dict[int, RpcBroker.ShardClient] = {}
+        """Links to the other workers by their client IDs."""
+        self._shard_clients: dict[int, tuple[RpcBroker.ShardClient, str | None]] = {}
+        """Clients of the other workers with link and requested mount point.
+
+        The mount point is added to the :attr:`_mounts` only if it doesn't
+        conflict with some other mount point.
+        """
+        self.__next_caller_id = 0 if shard is None else shard.index
 
     def register_client(self, client: Client) -> int:
         """Register RPC peer to the broker.
@@ -519,24 +780,30 @@ class RpcBroker:
         # disconnect to the self.clients and use that to identify when we can
         # reuse caller id.
         cid = self.__next_caller_id
-        self.__next_caller_id += 1
+        # Workers use interleaved IDs and thus they are unique for all of them
+        self.__next_caller_id += 1 if self.shard is None else self.shard.count
         self._clients[cid] = client
         mount_point: str | None = None
         if mount_point := client.role.mount_point(set(self._mounts)):
             mount_point = mount_point.rstrip("/")
             if mount_point.partition("/")[0] in {"", ".app", ".broker", ".device"}:
                 raise ValueError("Mount point is not allowed")
-            if any(
-                mount_point == mnt
-                or mnt.startswith(mount_point + "/")
-                or mount_point.startswith(mnt + "/")
-                for mnt in self._mounts
-            ):
+            if self._mounts_tree.overlaps(mount_point):
                 raise ValueError("Mount point is already mounted")
             self.__lsmod_msg(mount_point, True)
             self._mounts[mount_point] = cid
+            self._mounts_tree.set(mount_point, cid)
+            self._mounts_cid[cid] = mount_point
         for ri in client.role.initial_subscriptions():
-            self._subs.setdefault(ri, {})[cid] = None
+            self._subs_add(ri)[cid] = None
+        if isinstance(client, self.ShardClient):
+            self._shard_links[cid] = client
+        else:
+            self._shard_send(
+                RpcMessage.signal(
+                    self.ShardClient.PATH, "register", value=[cid, mount_point]
+                )
+            )
         self._subs_notify()
         logger.info(
             "Client registered to broker with ID %d%s",
@@ -558,11 +825,20 @@ class RpcBroker:
             raise ValueError("Client is not registered in this broker")
         if mount_point := self.client_mountpoint(client):
             del self._mounts[mount_point]
+            self._mounts_tree.pop(mount_point)
+            del self._mounts_cid[cid]
             self.__lsmod_msg(mount_point, False)
         for subs in self._subs.values():
             subs.pop(cid, None)
-        self._subs = {n: v for n, v in self._subs.items() if v}
+        self._subs_cleanup()
         del self._clients[cid]
+        if self._shard_links.pop(cid, None) is not None:
+            for rcid in [c for c, v in self._shard_clients.items() if v[0] is client]:
+                self._shard_unregister(rcid)
+        else:
+            self._shard_send(
+                RpcMessage.signal(self.ShardClient.PATH, "unregister", value=cid)
+            )
         self._subs_notify()
         logger.info("Client with ID %d unregistered from broker", cid)
 
@@ -570,12 +846,82 @@ class RpcBroker:
         root = ""
         for node in path.split("/"):
             nroot = root + ("/" if root else "") + node
-            if any(m.startswith(nroot) for m in self._mounts):
+            if self._mounts_tree.is_node(nroot):
                 root = nroot
             else:
                 break
         self.signal(RpcMessage.signal(root, "lsmod", "ls", {node: new}))
 
+    def _shard_send(self, msg: RpcMessage) -> None:
+        """Send message to all other workers."""
+        for link in self._shard_links.values():
+            link.send(msg)
+
+    def _shard_register(
+        self, link: ShardClient, cid: int, mount_point: str | None
+    ) -> None:
+        """Add client of the other worker."""
+        if self._shard_clients.get(cid) == (link, mount_point):
+            return
+        self._shard_clients[cid] = (link, mount_point)
+        if mount_point is not None:
+            self._shard_mount(cid, mount_point)
+
+    def _shard_mount(self, cid: int, mount_point: str) -> None:
+        """Mount client of the other worker.
+
+        Clients can be mounted in parallel in multiple workers to the
+        conflicting mount points. The client of the worker with the lowest
+        index wins and the others are disconnected by their workers.
+        """
+        assert self.shard is not None
+        if self._mounts_tree.overlaps(mount_point):
+            conflicts = [
+                c
+                for mnt, c in self._mounts.items()
+                if mnt == mount_point
+                or mnt.startswith(mount_point + "/")
+                or mount_point.startswith(mnt + "/")
+            ]
+            if any(c % self.shard.count < cid % self.shard.count for c in conflicts):
+                return  # Worker with this client has to disconnect it
+            for c in conflicts:
+                if (client := self._clients.get(c)) is not None:
+                    logger.warning(
+                        "Disconnecting client %d due to mount point conflict", c
+                    )
+                    client._unregister()
+                    client.client.disconnect()
+                else:
+                    mnt = self._mounts_cid.pop(c)
+                    del self._mounts[mnt]
+                    self._mounts_tree.pop(mnt)
+        self._mounts[mount_point] = cid
+        self._mounts_tree.set(mount_point, cid)
+        self._mounts_cid[cid] = mount_point
+
+    def _shard_unregister(self, cid: int) -> None:
+        """Remove client of the other worker."""
+        if self._shard_clients.pop(cid, None) is None:
+            return
+        if (mount_point := self._mounts_cid.pop(cid, None)) is not None:
+            del self._mounts[mount_point]
+            self._mounts_tree.pop(mount_point)
+            # Mount clients that were blocked by this one
+            for c, (_, mnt) in list(self._shard_clients.items()):
+                if mnt is not None and c not in self._mounts_cid:
+                    self._shard_mount(c, mnt)
+
+    def shard_link(self, cid: int) -> ShardClient | None:
+        """Get link to the worker the client with given ID is connected to.
+
+        :param cid: ID of the client.
+        :return: Link to the other worker or ``None`` if client is not
+          connected to the other worker.
+        """
+        res = self._shard_clients.get(cid)
+        return res[0] if res is not None else None
+
     def get_client(self, cid: int | str) -> Client | None:
         """Lookup client with given ID.
 
@@ -596,23 +942,51 @@ class RpcBroker:
         """
         if path.startswith(".broker/client/"):
             pth = path.split("/")
-            client = self.get_client(pth[2])
-            return (client, "/".join(pth[3:])) if client else None
-
-        # Note: we do not allow recursive mount points and thus first match is the
-        # correct and the only client.
-        for mnt, cid in self._mounts.items():
-            if path.startswith(mnt + "/") or path == mnt:
-                return self._clients[cid], path[len(mnt) + 1 :]
+            if (client := self.get_client(pth[2])) is not None:
+                return client, "/".join(pth[3:])
+            # Client of the other worker is addressed the same way there
+            if pth[2].isdigit() and (link := self.shard_link(int(pth[2]))):
+                return link, path
+            return None
+
+        if (res := self._mounts_tree.lookup(path)) is not None:
+            if (client := self._clients.get(res[0])) is not None:
+                return client, res[1]
+            return self._shard_clients[res[0]][0], path
         return None
 
     def clients(self) -> collections.abc.Iterator[Client]:
-        """Iterate over all clients participating in the broker."""
-        yield from self._clients.values()
+        """Iterate over all clients participating in the broker.
+
+        These are only clients connected to this worker (see :attr:`shard`).
+        """
+        return (c for cid, c in self._clients.items() if cid not in self._shard_links)
+
+    def client_ids(self) -> collections.abc.Iterator[int]:
+        """Iterate over IDs of all clients including those of other workers."""
+        return iter(
+            sorted(
+                itertools.chain(
+                    (cid for cid in self._clients if cid not in self._shard_links),
+                    self._shard_clients,
+                )
+            )
+        )
 
     def mounted_clients(self) -> collections.abc.Iterator[tuple[str, Client]]:
-        """Goes through participating clients and provides those with mount point."""
-        return ((mnt, self._clients[cid]) for mnt, cid in self._mounts.items())
+        """Goes through participating clients and provides those with mount point.
+
+        These are only clients connected to this worker (see :attr:`shard`).
+        """
+        return (
+            (mnt, self._clients[cid])
+            for mnt, cid in self._mounts.items()
+            if cid in self._clients
+        )
+
+    def mount_points(self) -> collections.abc.Iterator[str]:
+        """Iterate over all mount points including those of other workers."""
+        return iter(self._mounts)
 
     def client_mountpoint(self, client: Client) -> str | None:
         """Get mount point for this client.
@@ -621,14 +995,9 @@ class RpcBroker:
         :return: The mount point of the client or ``None`` in case there is
           none.
         """
-        try:
-            return next(
-                mnt
-                for mnt, cid in self._mounts.items()
-                if cid == client.broker_client_id
-            )
-        except StopIteration:
+        if client.broker_client_id is None:
             return None
+        return self._mounts_cid.get(client.broker_client_id)
 
     def subscriptions(
         self, client: Client | None = None
@@ -661,7 +1030,7 @@ class RpcBroker:
         """
         if client.broker_client_id is None:
             raise ValueError("Client must be registered")
-        subset = self._subs.setdefault(ri, {})
+        subset = self._subs_add(ri)
         res = client.broker_client_id not in subset
         subset[client.broker_client_id] = time.time() + ttl if ttl is not None else None
         self._subs_notify()
@@ -680,26 +1049,48 @@ class RpcBroker:
         if ri not in self._subs:
             return False
         self._subs[ri].pop(client.broker_client_id, None)
-        self._subs = {n: v for n, v in self._subs.items() if v}
+        self._subs_cleanup()
         self._subs_notify()
         return True
 
-    def signal(self, msg: RpcMessage) -> None:
+    def _subs_add(self, ri: str) -> dict[int, float | None]:
+        """Get subscription for given RI and add it if it doesn't exist."""
+        if (res := self._subs.get(ri)) is None:
+            res = self._subs[ri] = {}
+            self._subs_index.add(ri)
+        return res
+
+    def _subs_cleanup(self) -> None:
+        """Remove subscriptions no longer requested by any client."""
+        for ri in [ri for ri, v in self._subs.items() if not v]:
+            del self._subs[ri]
+            self._subs_index.remove(ri)
+
+    def signal(self, msg: RpcMessage, shard: bool = True) -> None:
         """Send signal to the broker's clients.
 
         :param msg: Signal message to be sent.
+        :param shard: If signal should be propagated also to the other workers.
+          Signals received from the other worker are not propagated again.
         """
         msgaccess = msg.rpc_access or RpcAccess.READ
         cids: set[int] = set()
-        for sub, clients in self._subs.items():
-            if rpcri_match(sub, msg.path, msg.source, msg.signal_name):
-                cids |= {c for c in clients if c is not None}
+        for sub in self._subs_index.match(msg.path, msg.source, msg.signal_name):
+            cids |= {c for c in self._subs[sub] if c is not None}
+        if not shard:
+            cids -= self._shard_links.keys()
+        shared: RpcMessage | None = None
         for cid in cids:
             client = self._clients[cid]
             assert client.role is not None
             access = client.role.access_level(msg.path, msg.source)
             if access is not None and access >= msgaccess:
-                client.send(msg)
+                if shared is None:
+                    # Encode only once and share the data between clients
+                    shared = RpcMessage.from_chainpack(msg.to_chainpack())
+                else:
+                    self.signal_encodes_saved += 1
+                client.send(shared)
 
     def signal_from(self, msg: RpcMessage, client: Client) -> None:
         """Send signal to the broker's client as comming from given client.
@@ -739,7 +1130,7 @@ class RpcBroker:
                 self._subs[ri] = {
                     k: v for k, v in self._subs[ri].items() if v is None or v > now
                 }
-            self._subs = {k: v for k, v in self._subs.items() if v}
+            self._subs_cleanup()
             # Propagate subscriptions to subbrokers
             nsubbrokers: set[int] = set()
             for mnt, client in self.mounted_clients():
@@ -764,6 +1155,18 @@ class RpcBroker:
                         )
                 assert client.broker_client_id is not None
                 nsubbrokers.add(client.broker_client_id)
+            # Propagate subscriptions of our clients to the other workers
+            for cid, link in self._shard_links.items():
+                for ri, subs in self._subs.items():
+                    if (cid not in subbrokers or subsubs.get(ri, now) <= now) and (
+                        subs.keys() - self._shard_links.keys()
+                    ):
+                        link.send(
+                            RpcMessage.request(
+                                ".broker/currentClient", "subscribe", [ri, 120]
+                            )
+                        )
+                nsubbrokers.add(cid)
             subbrokers = nsubbrokers
             subsubs = {
                 ri: (now + 60)
@@ -794,6 +1197,9 @@ class RpcBroker:
         def add(client: RpcClient) -> None:
             self.LoginClient(client, self)
 
+        if self.shard is not None:
+            await self._shard_start(connect_timeout)
+
         # We create our connect clients first to ensure that they get
         # preferential setup (and also preferential error detection).
         connect_clients = []
@@ -809,8 +1215,12 @@ class RpcBroker:
         # Now start all servers so clients can connect
         for url in self.config.listens():
             surl = str(url)
-            if surl not in self.servers:
-                self.servers[surl] = await create_rpc_server(add, url)
+            if surl not in self.servers and (
+                self.shard is None or self.shard.listens(url)
+            ):
+                self.servers[surl] = await create_rpc_server(
+                    add, url, reuse_port=self.shard is not None
+                )
 
         # Lastly wait specified time for clients to connect
         async with asyncio.timeout(connect_timeout):
@@ -819,6 +1229,36 @@ class RpcBroker:
                 return_exceptions=True,
             )
 
+    async def _shard_start(self, connect_timeout: float) -> None:
+        """Listen for links from other workers and link to the previous ones."""
+        assert self.shard is not None
+
+        def add(client: RpcClient) -> None:
+            self.ShardClient(client, self)
+
+        if self._shard_server is None:
+            url = RpcUrl(
+                str(self.shard.socket(self.shard.index)), protocol=RpcProtocol.UNIX
+            )
+            self._shard_server = await create_rpc_server(add, url)
+        links = []
+        for index in range(self.shard.index):
+            url = RpcUrl(str(self.shard.socket(index)), protocol=RpcProtocol.UNIX)
+            while True:  # Previous worker might not be listening yet
+                try:
+                    client = await connect_rpc_client(url)
+                except OSError:
+                    await asyncio.sleep(0.1)
+                else:
+                    break
+            links.append(self.ShardClient(client, self))
+            links[-1].sync()
+        try:
+            async with asyncio.timeout(connect_timeout):
+                await asyncio.gather(*(link.synced.wait() for link in links))
+        except TimeoutError:
+            logger.warning("Workers not synchronized in time")
+
     async def serve_forever(self) -> None:
         """Serve all configured servers and block.
 
@@ -865,11 +1305,32 @@ class RpcBroker:
         for server in self.servers.values():
             server.terminate()
         await asyncio.gather(
-            *(client_disconnect(c) for c in self._clients.values()),
+            *(client_disconnect(c) for c in list(self.clients())),
             *(s.wait_terminated() for s in self.servers.values()),
         )
+        # Links to other workers are disconnected last to propagate disconnects
+        if self._shard_server is not None:
+            self._shard_server.terminate()
+        await asyncio.gather(
+            *(client_disconnect(c) for c in list(self._shard_links.values())),
+            *([self._shard_server.wait_terminated()] if self._shard_server else []),
+        )
         if self._subs_task is not None:
             if not self._subs_task.done():
                 self._subs_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await self._subs_task
+
+
+class _ShardRole(RpcBrokerRoleABC):
+    """Role of the link between workers of the same broker."""
+
+    @property
+    def name(self) -> str:
+        return "shard"
+
+    def access_level(self, path: str, method: str) -> RpcAccess | None:  # noqa PLR6301
+        return RpcAccess.ADMIN
+
+
+_SHARD_ROLE = _ShardRole()
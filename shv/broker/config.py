@@ -4,16 +4,19 @@ from __future__ import annotations
 
 import collections.abc
 import dataclasses
+import enum
 import fnmatch
+import functools
 import itertools
 import logging
 import pathlib
 import tomllib
 import typing
 
+from ..rpcapi.sendqueue import RpcSendQueue
 from ..rpcdef.access import RpcAccess
 from ..rpclogin import RpcLogin, RpcLoginType
-from ..rpcri import rpcri_match
+from ..rpcri import CompiledRpcRI, rpcri_compile
 from ..rpcurl import RpcUrl
 from .configabc import RpcBrokerConfigABC, RpcBrokerRoleABC
 from .utils import nmax
@@ -66,6 +69,19 @@ class NamedMap(collections.abc.Mapping[str, NamedT]):
 class RpcBrokerConfig(RpcBrokerConfigABC):
     """Configuration for the SHV RPC Broker."""
 
+    class EventLoop(enum.Enum):
+        """Event loop implementation the broker should run in.
+
+        The string values are the ones used in the configuration file.
+        """
+
+        AUTO = "auto"
+        """Use uvloop if it is installed and asyncio otherwise."""
+        ASYNCIO = "asyncio"
+        """Use the default asyncio event loop."""
+        UVLOOP = "uvloop"
+        """Use uvloop (it must be installed)."""
+
     @dataclasses.dataclass
     class Role:
         """The configured role."""
@@ -79,13 +95,26 @@ class RpcBrokerConfig(RpcBrokerConfigABC):
 
         def access_level(self, path: str, method: str) -> RpcAccess | None:
             """Deduce access level for method based on these rules."""
-            for level in sorted(RpcAccess, reverse=True):
-                if any(
-                    rpcri_match(ri, path, method) for ri in self.access.get(level, [])
-                ):
+            for level, rules in self._rules:
+                if any(rule.match(path, method) for rule in rules):
                     return level
             return None
 
+        @functools.cached_property
+        def _rules(self) -> list[tuple[RpcAccess, list[CompiledRpcRI]]]:
+            """Access rules compiled to the RPC RI matchers.
+
+            They are sorted from the highest access level. RIs for signals are
+            dropped because they never match method.
+            """
+            res = []
+            for level in sorted(self.access, reverse=True):
+                if rules := [
+                    rpcri_compile(ri) for ri in self.access[level] if ri.count(":") == 1
+                ]:
+                    res.append((level, rules))
+            return res
+
     @dataclasses.dataclass
     class Autosetup:
         """Automatic setup based on device ID for this role."""
@@ -227,10 +256,7 @@ class RpcBrokerConfig(RpcBrokerConfigABC):
                     yield from autosetup.subscriptions
 
             def access_level(self, path: str, method: str) -> RpcAccess | None:  # noqa PLR6301
-                return nmax(
-                    self.config.roles[r].access_level(path, method)
-                    for r in self.user.roles
-                )
+                return self.config.access_level(self.user.roles, path, method)
 
     @dataclasses.dataclass
     class Connect:
@@ -267,10 +293,7 @@ class RpcBrokerConfig(RpcBrokerConfigABC):
                 yield from self.connection.subscriptions
 
             def access_level(self, path: str, method: str) -> RpcAccess | None:  # noqa PLR6301
-                return nmax(
-                    self.config.roles[r].access_level(path, method)
-                    for r in self.connection.roles
-                )
+                return self.config.access_level(self.connection.roles, path, method)
 
     def __init__(
         self,
@@ -280,6 +303,10 @@ class RpcBrokerConfig(RpcBrokerConfigABC):
         roles: collections.abc.Iterable[RpcBrokerConfig.Role] = frozenset(),
         users: collections.abc.Iterable[RpcBrokerConfig.User] = frozenset(),
         autosetups: collections.abc.Iterable[RpcBrokerConfig.Autosetup] = frozenset(),
+        coalesce_signals: bool = True,
+        signal_queue_size: int = RpcSendQueue.SIZES[RpcSendQueue.Priority.SIGNAL] or 0,
+        workers: int = 1,
+        loop: RpcBrokerConfig.EventLoop = EventLoop.AUTO,
     ) -> None:
         self._name = name
         self.listen: list[RpcUrl] = list(listen)
@@ -292,6 +319,64 @@ class RpcBrokerConfig(RpcBrokerConfigABC):
         """Users available in this configuration."""
         self.autosetups: list[RpcBrokerConfig.Autosetup] = list(autosetups)
         """Sequence of autosetup rules."""
+        self.coalesce_signals = coalesce_signals
+        """If ``chng`` signals queued for slow clients should be coalesced."""
+        self.signal_queue_size = signal_queue_size
+        """Number of signals that can be queued for a single client.
+
+        The oldest signal is dropped when more signals are queued.
+        """
+        self.workers = workers
+        """Number of broker worker processes.
+
+        Workers accept TCP/IP connections on the same port and share clients,
+        mount points and subscriptions (see :class:`shv.broker.RpcBroker.Shard`).
+        """
+        self.loop = loop
+        """Event loop implementation broker runs in."""
+        self._access_cache = functools.lru_cache(maxsize=self.ACCESS_CACHE_SIZE)(
+            self._access_level
+        )
+
+    ACCESS_CACHE_SIZE: typing.ClassVar[int] = 4096
+    """Maximal number of cached results of :meth:`access_level`."""
+
+    def access_level(
+        self, roles: collections.abc.Sequence[str], path: str, method: str
+    ) -> RpcAccess | None:
+        """Deduce access level for method based on combination of roles.
+
+        The results are cached and thus :meth:`access_cache_clear` must be
+        called when roles are modified after the first use. Configuration
+        loaded again with :meth:`load` has its own empty cache.
+
+        :param roles: Names of the roles.
+        :param path: SHV path of the method.
+        :param method: Name of the method.
+        :return: The highest access level assigned by any of the roles or
+          ``None`` if no role allows access.
+        """
+        return self._access_cache(tuple(roles), path, method)
+
+    def _access_level(
+        self, roles: tuple[str, ...], path: str, method: str
+    ) -> RpcAccess | None:
+        return nmax(self.roles[r].access_level(path, method) for r in roles)
+
+    def access_cache_clear(self) -> None:
+        """Invalidate cache of the access levels.
+
+        This must be called when roles are modified.
+        """
+        self._access_cache.cache_clear()
+        for role in self.roles.values():
+            role.__dict__.pop("_rules", None)
+
+    def send_queue(self) -> RpcSendQueue:  # noqa: D102
+        return RpcSendQueue(
+            {RpcSendQueue.Priority.SIGNAL: self.signal_queue_size},
+            coalesce=self.coalesce_signals,
+        )
 
     def __eq__(self, other: object) -> bool:
         return (
@@ -302,6 +387,10 @@ class RpcBrokerConfig(RpcBrokerConfigABC):
             and self.roles == other.roles
             and self.users == other.users
             and self.autosetups == other.autosetups
+            and self.coalesce_signals == other.coalesce_signals
+            and self.signal_queue_size == other.signal_queue_size
+            and self.workers == other.workers
+            and self.loop == other.loop
         )
 
     def __repr__(self) -> str:
@@ -312,6 +401,10 @@ class RpcBrokerConfig(RpcBrokerConfigABC):
             "roles": self.roles,
             "users": self.users,
             "autosetups": self.autosetups,
+            "coalesce_signals": self.coalesce_signals,
+            "signal_queue_size": self.signal_queue_size,
+            "workers": self.workers,
+            "loop": self.loop,
         })
 
     @property
@@ -356,6 +449,28 @@ class RpcBrokerConfig(RpcBrokerConfigABC):
 
         res = cls(str(data.pop("name", "")))
         res.listen = cls._load_urls(data.pop("listen", []), "listen")
+        if (coalesce := data.pop("coalesceSignals", None)) is not None:
+            if not isinstance(coalesce, bool):
+                raise RpcBrokerConfigurationError("'coalesceSignals' must be boolean")
+            res.coalesce_signals = coalesce
+        if (queue_size := data.pop("signalQueueSize", None)) is not None:
+            if not isinstance(queue_size, int) or queue_size < 1:
+                raise RpcBrokerConfigurationError(
+                    "'signalQueueSize' must be positive integer"
+                )
+            res.signal_queue_size = queue_size
+        if (workers := data.pop("workers", None)) is not None:
+            if not isinstance(workers, int) or workers < 1:
+                raise RpcBrokerConfigurationError("'workers' must be positive integer")
+            res.workers = workers
+        if (loop := data.pop("loop", None)) is not None:
+            try:
+                res.loop = cls.EventLoop(loop)
+            except ValueError as exc:
+                raise RpcBrokerConfigurationError(
+                    "'loop' must be one of: "
+                    + ", ".join(f"'{v.value}'" for v in cls.EventLoop)
+                ) from exc
 
         if connects := data.pop("connect", {}):
             if not isinstance(connects, collections.abc.Sequence):
@@ -5,6 +5,7 @@ from __future__ import annotations
 import abc
 import collections.abc
 
+from ..rpcapi.sendqueue import RpcSendQueue
 from ..rpcdef.access import RpcAccess
 from ..rpclogin import RpcLogin
 from ..rpcurl import RpcUrl
@@ -78,6 +79,13 @@ class RpcBrokerConfigABC(abc.ABC):
         """Iterate over URLs and their setup where Broker should connect to."""
         return iter([])
 
+    def send_queue(self) -> RpcSendQueue:  # noqa PLR6301
+        """Create queue for messages propagated by Broker to its client.
+
+        The default is :class:`shv.rpcapi.RpcSendQueue` with default settings.
+        """
+        return RpcSendQueue()
+
     @abc.abstractmethod
     def login(self, login: RpcLogin, nonce: str) -> RpcBrokerRoleABC | None:
         """Check the login and provide role if login is correct."""
@@ -2,25 +2,36 @@
 
 from __future__ import annotations
 
+import collections.abc
 import datetime
 import decimal
 import enum
-import io
 import struct
 import typing
 
 from . import commonpack
 from .value import (
+    SHVBool,
+    SHVBytes,
+    SHVDatetime,
+    SHVDecimal,
+    SHVFloat,
     SHVIMap,
     SHVIMapType,
+    SHVInt,
+    SHVList,
     SHVListType,
     SHVMap,
     SHVMapType,
     SHVMeta,
     SHVMetaType,
+    SHVNull,
+    SHVStr,
     SHVType,
     SHVUInt,
     decimal_rexp,
+    is_shvbool,
+    is_shvnull,
 )
 
 
@@ -56,14 +67,16 @@ class ChainPack:
     # ChainPack.INVALID_MIN_OFFSET_FROM_UTC = (-64 * 15)
 
     @staticmethod
-    def unpack(data: bytes | str) -> SHVType:
+    def unpack(data: bytes | bytearray | memoryview | str) -> SHVType:
         """Unpack single value from given data."""
-        return ChainPackReader.unpack(data)
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        return ChainPackBufferReader(data).read()
 
     @staticmethod
     def pack(value: SHVType) -> bytes:
         """Pack given value and return bytes."""
-        return ChainPackWriter.pack(value)
+        return ChainPackBufferWriter.pack(value)
 
     @staticmethod
     def unpack_uint_data(data: bytes | bytearray) -> int:
@@ -78,10 +91,7 @@ class ChainPack:
         :return: unpacked integer.
         :raise ValueError: in case of invalid data.
         """
-        try:
-            return ChainPackReader(data).read_uint_data()
-        except EOFError as exc:
-            raise ValueError from exc
+        return ChainPackBufferReader(data).read_uint_data()
 
     @staticmethod
     def pack_uint_data(value: int) -> bytes:
@@ -94,10 +104,9 @@ class ChainPack:
         :param value: Unsigned integer to be packed.
         :return: bytes with unsigned integer.
         """
-        bio = io.BytesIO()
-        writer = ChainPackWriter(bio)
+        writer = ChainPackBufferWriter()
         writer.write_uint_data(value)
-        return bio.getvalue()
+        return bytes(writer.buffer)
 
 
 class ChainPackReader(commonpack.CommonReader):
@@ -261,6 +270,335 @@ class ChainPackReader(commonpack.CommonReader):
         return mmap
 
 
+class ChainPackBufferReader:
+    """Read data in ChainPack format directly from the bytes-like object.
+
+    This is an alternative to :class:`ChainPackReader` for the data that are
+    already completely available in the memory, which is the case for every
+    received SHV RPC message. Instead of reading the stream byte by byte it
+    indexes the buffer with an integer cursor and the value decoding is
+    selected from the lookup table based on the packing schema byte. It
+    provides the same values as :class:`ChainPackReader`.
+
+    :param data: Data to be read.
+    :param pos: Offset in the data where reading starts.
+    """
+
+    def __init__(self, data: bytes | bytearray | memoryview, pos: int = 0) -> None:
+        if isinstance(data, memoryview) and data.format != "B":
+            data = data.cast("B")
+        self.data: bytes | bytearray | memoryview = data
+        """Data values are read from."""
+        self.pos = pos
+        """Offset of the next byte to be read in :attr:`data`."""
+
+    def read(self) -> SHVType:
+        """Read next SHV value.
+
+        :raise ValueError: when unexpected byte was received or there is not
+          enough data.
+        """
+        try:
+            return self._read()
+        except IndexError as exc:
+            raise ValueError("Unexpected end of message.") from exc
+
+    def read_uint_data(self) -> int:
+        """Read unsigned integer data (without packing schema).
+
+        :raise ValueError: when there is not enough data.
+        """
+        try:
+            return self._read_uint_data_helper()[0]
+        except IndexError as exc:
+            raise ValueError("Unexpected end of message.") from exc
+
+    def read_meta(self) -> SHVMetaType:
+        """Read meta of the next value but not the value itself.
+
+        :return: Meta of the next value or empty dictionary if it has none.
+        :raise ValueError: when unexpected byte was received or there is not
+          enough data.
+        """
+        try:
+            if self.data[self.pos] != ChainPack.Schema.CP_MetaMap:
+                return {}
+            self.pos += 1
+            return self._read_map_items()
+        except IndexError as exc:
+            raise ValueError("Unexpected end of message.") from exc
+
+    def peek(self) -> int:
+        """Get the packing schema byte of the next value without reading it.
+
+        :return: The next byte or ``-1`` if there are no more data.
+        """
+        return self.data[self.pos] if self.pos < len(self.data) else -1
+
+    def skip(self) -> None:
+        """Skip the next value without decoding it.
+
+        This only walks through the data to locate the end of the value and is
+        thus much cheaper than :meth:`read` especially for Blobs and Strings.
+
+        :raise ValueError: when unexpected byte was received or there is not
+          enough data.
+        """
+        try:
+            self._skip()
+        except IndexError as exc:
+            raise ValueError("Unexpected end of message.") from exc
+
+    def _skip(self) -> None:
+        schema = self.data[self.pos]
+        self.pos += 1
+        self._SKIP[schema](self, schema)
+
+    def _skip_none(self, _: int) -> None:
+        pass
+
+    def _skip_invalid(self, schema: int) -> None:
+        self._read_invalid(schema)
+
+    def _skip_uint_data(self, _: int) -> None:
+        self._read_uint_data_helper()
+
+    def _skip_decimal(self, _: int) -> None:
+        self._read_uint_data_helper()
+        self._read_uint_data_helper()
+
+    def _skip_double(self, _: int) -> None:
+        self._skip_bytes(8)
+
+    def _skip_blob(self, _: int) -> None:
+        self._skip_bytes(self._read_uint_data_helper()[0])
+
+    def _skip_bytes(self, size: int) -> None:
+        self.pos += size
+        if self.pos > len(self.data):
+            raise IndexError("Not enough data")
+
+    def _skip_cstring(self, _: int) -> None:
+        data = self.data
+        while (b := data[self.pos]) != 0:
+            self.pos += 2 if b == ord("\\") else 1
+        self.pos += 1
+
+    def _skip_list(self, _: int) -> None:
+        data = self.data
+        skip = self._SKIP
+        while (schema := data[self.pos]) != 0xFF:
+            self.pos += 1
+            skip[schema](self, schema)
+        self.pos += 1
+
+    def _skip_map(self, schema: int) -> None:
+        data = self.data
+        skip = self._SKIP
+        while (key := data[self.pos]) != 0xFF:
+            if not (64 <= key < 128 or key in self._KEY_SCHEMA):
+                raise ValueError(f"Invalid Map key: {key}")
+            self.pos += 1
+            skip[key](self, key)
+            self._skip()
+        self.pos += 1
+        if schema == ChainPack.Schema.CP_MetaMap:
+            self._skip()
+
+    _KEY_SCHEMA: typing.Final = frozenset((
+        ChainPack.Schema.CP_Int.value,
+        ChainPack.Schema.CP_String.value,
+        ChainPack.Schema.CP_CString.value,
+    ))
+
+    def _read(self) -> SHVType:
+        schema = self.data[self.pos]
+        self.pos += 1
+        return self._SCHEMA[schema](self, schema)
+
+    def _read_bytes(self, size: int) -> bytes | bytearray | memoryview:
+        pos = self.pos
+        end = pos + size
+        if end > len(self.data):
+            raise IndexError("Not enough data")
+        self.pos = end
+        return self.data[pos:end]
+
+    def _read_uint_data_helper(self) -> tuple[int, int]:
+        data = self.data
+        pos = self.pos
+        head = data[pos]
+        if head < 0x80:
+            self.pos = pos + 1
+            return head, 7
+        if head < 0xC0:
+            cnt, num, bitlen = 1, head & 0x3F, 6 + 8
+        elif head < 0xE0:
+            cnt, num, bitlen = 2, head & 0x1F, 5 + 2 * 8
+        elif head < 0xF0:
+            cnt, num, bitlen = 3, head & 0x0F, 4 + 3 * 8
+        else:
+            cnt = (head & 0x0F) + 4
+            num, bitlen = 0, cnt * 8
+        end = pos + 1 + cnt
+        if end > len(data):
+            raise IndexError("Not enough data")
+        self.pos = end
+        return (num << (cnt * 8)) | int.from_bytes(data[pos + 1 : end], "big"), bitlen
+
+    def _read_int_data(self) -> int:
+        num, bitlen = self._read_uint_data_helper()
+        sign_bit_mask = 1 << (bitlen - 1)
+        if num & sign_bit_mask:
+            return -(num & ~sign_bit_mask)
+        return num
+
+    def _read_invalid(self, schema: int) -> SHVType:  # noqa: PLR6301
+        raise ValueError(f"ChainPack - Invalid type: {schema}")
+
+    def _read_tiny_uint(self, schema: int) -> SHVType:  # noqa: PLR6301
+        return SHVUInt(schema)
+
+    def _read_tiny_int(self, schema: int) -> SHVType:  # noqa: PLR6301
+        return schema - 64
+
+    def _read_null(self, _: int) -> SHVType:  # noqa: PLR6301
+        return None
+
+    def _read_true(self, _: int) -> SHVType:  # noqa: PLR6301
+        return True
+
+    def _read_false(self, _: int) -> SHVType:  # noqa: PLR6301
+        return False
+
+    def _read_int(self, _: int) -> SHVType:
+        return self._read_int_data()
+
+    def _read_uint(self, _: int) -> SHVType:
+        return SHVUInt(self._read_uint_data_helper()[0])
+
+    def _read_double(self, _: int) -> SHVType:
+        res = struct.unpack("<d", self._read_bytes(8))  # little endian
+        return typing.cast(float, res[0])
+
+    def _read_decimal(self, _: int) -> SHVType:
+        mant = self._read_int_data()
+        exp = self._read_int_data()
+        return decimal.Decimal(f"{mant}e{exp}")
+
+    def _read_datetime(self, _: int) -> SHVType:
+        d = self._read_int_data()
+        offset = 0
+        has_tz_offset = d & 1
+        has_not_msec = d & 2
+        d >>= 2
+        if has_tz_offset:
+            offset = d & 0x7F
+            if offset >= 128:
+                offset -= 128  # sign extension
+            d >>= 7
+        f: float = d if has_not_msec else d / 1000
+        f += ChainPack.SHV_EPOCH_SEC
+        tzone = datetime.timezone(datetime.timedelta(minutes=offset * 15))
+        return datetime.datetime.fromtimestamp(f, tzone)
+
+    def _read_blob(self, _: int) -> SHVType:
+        return bytes(self._read_bytes(self._read_uint_data_helper()[0]))
+
+    def _read_string(self, _: int) -> SHVType:
+        return str(self._read_bytes(self._read_uint_data_helper()[0]), "utf-8")
+
+    def _read_cstring(self, _: int) -> SHVType:
+        data = self.data
+        res = ""
+        while (b := data[self.pos]) != 0:
+            self.pos += 1
+            if b == ord("\\"):
+                b = data[self.pos]
+                self.pos += 1
+                res += "\0" if b == ord("0") else chr(b)
+            else:
+                res += chr(b)
+        self.pos += 1
+        return res
+
+    def _read_list(self, _: int) -> SHVType:
+        data = self.data
+        lst = []
+        while data[self.pos] != 0xFF:
+            lst.append(self._read())
+        self.pos += 1
+        return lst
+
+    def _read_map_items(self) -> dict[str | int, SHVType]:
+        data = self.data
+        mmap: dict[str | int, SHVType] = {}
+        while data[self.pos] != 0xFF:
+            key = self._read()
+            if not isinstance(key, str | int) or isinstance(key, SHVUInt):
+                raise ValueError(f"Invalid Map key: {type(key)}")
+            mmap[key] = self._read()
+        self.pos += 1
+        return mmap
+
+    def _read_map(self, _: int) -> SHVType:
+        if mvalue := typing.cast(SHVMapType, self._read_map_items()):
+            return mvalue
+        return SHVMap()  # Remove confusin between map and imap
+
+    def _read_imap(self, _: int) -> SHVType:
+        if imvalue := typing.cast(SHVIMapType, self._read_map_items()):
+            return imvalue
+        return SHVIMap()  # Remove confusin between map and imap
+
+    def _read_meta(self, _: int) -> SHVType:
+        meta = self._read_map_items()
+        return SHVMeta.new(self._read(), meta)
+
+    _SCHEMA: typing.ClassVar[
+        list[collections.abc.Callable[[ChainPackBufferReader, int], SHVType]]
+    ]
+    _SCHEMA = [_read_invalid] * 256
+    _SCHEMA[0:64] = [_read_tiny_uint] * 64
+    _SCHEMA[64:128] = [_read_tiny_int] * 64
+    _SCHEMA[ChainPack.Schema.CP_Null] = _read_null
+    _SCHEMA[ChainPack.Schema.CP_UInt] = _read_uint
+    _SCHEMA[ChainPack.Schema.CP_Int] = _read_int
+    _SCHEMA[ChainPack.Schema.CP_Double] = _read_double
+    _SCHEMA[ChainPack.Schema.CP_Blob] = _read_blob
+    _SCHEMA[ChainPack.Schema.CP_String] = _read_string
+    _SCHEMA[ChainPack.Schema.CP_List] = _read_list
+    _SCHEMA[ChainPack.Schema.CP_Map] = _read_map
+    _SCHEMA[ChainPack.Schema.CP_IMap] = _read_imap
+    _SCHEMA[ChainPack.Schema.CP_MetaMap] = _read_meta
+    _SCHEMA[ChainPack.Schema.CP_Decimal] = _read_decimal
+    _SCHEMA[ChainPack.Schema.CP_DateTime] = _read_datetime
+    _SCHEMA[ChainPack.Schema.CP_CString] = _read_cstring
+    _SCHEMA[ChainPack.Schema.CP_FALSE] = _read_false
+    _SCHEMA[ChainPack.Schema.CP_TRUE] = _read_true
+
+    _SKIP: typing.ClassVar[
+        list[collections.abc.Callable[[ChainPackBufferReader, int], None]]
+    ]
+    _SKIP = [_skip_invalid] * 256
+    _SKIP[0:128] = [_skip_none] * 128
+    _SKIP[ChainPack.Schema.CP_Null] = _skip_none
+    _SKIP[ChainPack.Schema.CP_UInt] = _skip_uint_data
+    _SKIP[ChainPack.Schema.CP_Int] = _skip_uint_data
+    _SKIP[ChainPack.Schema.CP_Double] = _skip_double
+    _SKIP[ChainPack.Schema.CP_Blob] = _skip_blob
+    _SKIP[ChainPack.Schema.CP_String] = _skip_blob
+    _SKIP[ChainPack.Schema.CP_List] = _skip_list
+    _SKIP[ChainPack.Schema.CP_Map] = _skip_map
+    _SKIP[ChainPack.Schema.CP_IMap] = _skip_map
+    _SKIP[ChainPack.Schema.CP_MetaMap] = _skip_map
+    _SKIP[ChainPack.Schema.CP_Decimal] = _skip_decimal
+    _SKIP[ChainPack.Schema.CP_DateTime] = _skip_uint_data
+    _SKIP[ChainPack.Schema.CP_CString] = _skip_cstring
+    _SKIP[ChainPack.Schema.CP_FALSE] = _skip_none
+    _SKIP[ChainPack.Schema.CP_TRUE] = _skip_none
+
+
 class ChainPackWriter(commonpack.CommonWriter):
     """Write data in ChainPack format."""
 
@@ -424,3 +762,242 @@ class ChainPackWriter(commonpack.CommonWriter):
         if ms:
             res |= 2
         self.write_int_data(res)
+
+
+class ChainPackBufferWriter:
+    """Write data in ChainPack format to the :class:`bytearray`.
+
+    This is an alternative to :class:`ChainPackWriter` for the case when the
+    whole value is packed to the memory (which is the case for every sent SHV
+    RPC message). Bytes are appended directly to the buffer instead of being
+    written to the stream one by one and the value encoding is selected by its
+    type where possible. The produced data are the same as the ones provided by
+    :class:`ChainPackWriter`.
+
+    :param buffer: Buffer data are appended to. The new empty one is created if
+      not provided.
+    """
+
+    _CP_NULL: typing.Final = ChainPack.Schema.CP_Null.value
+    _CP_UINT: typing.Final = ChainPack.Schema.CP_UInt.value
+    _CP_INT: typing.Final = ChainPack.Schema.CP_Int.value
+    _CP_DOUBLE: typing.Final = ChainPack.Schema.CP_Double.value
+    _CP_BLOB: typing.Final = ChainPack.Schema.CP_Blob.value
+    _CP_STRING: typing.Final = ChainPack.Schema.CP_String.value
+    _CP_LIST: typing.Final = ChainPack.Schema.CP_List.value
+    _CP_MAP: typing.Final = ChainPack.Schema.CP_Map.value
+    _CP_IMAP: typing.Final = ChainPack.Schema.CP_IMap.value
+    _CP_METAMAP: typing.Final = ChainPack.Schema.CP_MetaMap.value
+    _CP_DECIMAL: typing.Final = ChainPack.Schema.CP_Decimal.value
+    _CP_DATETIME: typing.Final = ChainPack.Schema.CP_DateTime.value
+    _CP_CSTRING: typing.Final = ChainPack.Schema.CP_CString.value
+    _CP_FALSE: typing.Final = ChainPack.Schema.CP_FALSE.value
+    _CP_TRUE: typing.Final = ChainPack.Schema.CP_TRUE.value
+    _CP_TERM: typing.Final = ChainPack.Schema.CP_TERM.value
+
+    def __init__(self, buffer: bytearray | None = None) -> None:
+        self.buffer = bytearray() if buffer is None else buffer
+        """Buffer data are written to."""
+
+    @classmethod
+    def pack(cls, value: SHVType) -> bytes:
+        """Pack given value and return bytes."""
+        self = cls()
+        self.write(value)
+        return bytes(self.buffer)
+
+    def write(self, value: SHVType) -> None:
+        """Write generic SHV value."""
+        if isinstance(value, SHVMeta) and value.meta:
+            self.write_meta(value.meta)
+        if (func := self._TYPES.get(type(value))) is not None:
+            func(self, value)
+        elif is_shvnull(value):
+            self.write_null()
+        elif is_shvbool(value):
+            self.write_bool(bool(value))
+        elif isinstance(value, SHVUInt):
+            self.write_uint(value)
+        elif isinstance(value, int):
+            self.write_int(value)
+        elif isinstance(value, float):
+            self.write_double(value)
+        elif isinstance(value, decimal.Decimal):
+            self.write_decimal(value)
+        elif isinstance(value, bytes):
+            self.write_blob(value)
+        elif isinstance(value, str):
+            self.write_string(value)
+        elif isinstance(value, datetime.datetime):
+            self.write_datetime(value)
+        elif isinstance(value, collections.abc.Sequence):
+            self.write_list(value)
+        elif isinstance(value, collections.abc.Mapping):
+            self._write_mapping(value)
+        else:
+            raise ValueError(f"Invalid value for SHV: {value!r}")
+
+    def write_meta(self, meta: SHVMetaType) -> None:  # noqa: D102
+        self.buffer.append(self._CP_METAMAP)
+        for k, v in meta.items():
+            self.write(k)
+            self.write(v)
+        self.buffer.append(self._CP_TERM)
+
+    def write_null(self) -> None:  # noqa: D102
+        self.buffer.append(self._CP_NULL)
+
+    def write_bool(self, value: bool) -> None:  # noqa: D102
+        self.buffer.append(self._CP_TRUE if value else self._CP_FALSE)
+
+    def write_blob(self, value: bytes | bytearray) -> None:  # noqa: D102
+        self.buffer.append(self._CP_BLOB)
+        self.write_uint_data(len(value))
+        self.buffer += value
+
+    def write_string(self, value: str) -> None:  # noqa: D102
+        bstring = value.encode("utf-8")
+        self.buffer.append(self._CP_STRING)
+        self.write_uint_data(len(bstring))
+        self.buffer += bstring
+
+    def write_cstring(self, value: str) -> None:  # noqa: D102
+        self.buffer.append(self._CP_CSTRING)
+        self.buffer += value.encode("utf-8")
+        self.buffer.append(0)
+
+    def write_uint(self, value: int) -> None:  # noqa: D102
+        if value < 64:
+            self.buffer.append(value)
+        else:
+            self.buffer.append(self._CP_UINT)
+            self.write_uint_data(value)
+
+    def write_uint_data(self, value: int) -> None:  # noqa: D102
+        if value < 128:
+            self.buffer.append(value)
+        else:
+            self._write_uint_data_helper(value, value.bit_length())
+
+    def write_int(self, value: int) -> None:  # noqa: D102
+        if 0 <= value < 64:
+            self.buffer.append(value + 64)
+        else:
+            self.buffer.append(self._CP_INT)
+            self.write_int_data(value)
+
+    def write_int_data(self, value: int) -> None:  # noqa: D102
+        num = abs(value)
+        bitlen = num.bit_length() + 1  # add sign bit
+        if value < 0:
+            num |= 1 << ChainPackWriter._expand_bit_len(bitlen)
+        self._write_uint_data_helper(num, bitlen)
+
+    def _write_uint_data_helper(self, num: int, bit_len: int) -> None:
+        byte_cnt = ChainPackWriter._bytes_needed(bit_len)
+        data = bytearray((num & ((1 << (byte_cnt * 8)) - 1)).to_bytes(byte_cnt, "big"))
+        if bit_len <= 28:
+            mask = 0xF0 << (4 - byte_cnt)
+            data[0] &= ~mask & 0xFF
+            data[0] |= (mask << 1) & 0xFF
+        else:
+            data[0] = 0xF0 | (byte_cnt - 5)
+        self.buffer += data
+
+    def write_double(self, value: float) -> None:  # noqa: D102
+        self.buffer.append(self._CP_DOUBLE)
+        self.buffer += struct.pack("<d", value)  # little endian
+
+    def write_decimal(self, value: decimal.Decimal) -> None:  # noqa: D102
+        mantissa, exponent = decimal_rexp(value)
+        self.buffer.append(self._CP_DECIMAL)
+        self.write_int_data(mantissa)
+        self.write_int_data(exponent)
+
+    def write_list(self, value: SHVListType) -> None:  # noqa: D102
+        self.buffer.append(self._CP_LIST)
+        for val in value:
+            self.write(val)
+        self.buffer.append(self._CP_TERM)
+
+    def write_map(self, value: SHVMapType) -> None:  # noqa: D102
+        self.buffer.append(self._CP_MAP)
+        for k, v in value.items():
+            self.write(k)
+            self.write(v)
+        self.buffer.append(self._CP_TERM)
+
+    def write_imap(self, value: SHVIMapType) -> None:  # noqa: D102
+        self.buffer.append(self._CP_IMAP)
+        for k, v in value.items():
+            self.write(k)
+            self.write(v)
+        self.buffer.append(self._CP_TERM)
+
+    def _write_mapping(self, value: collections.abc.Mapping) -> None:
+        # The generic mapping is IMap or Map based on the keys (empty is IMap)
+        if all(isinstance(k, int) for k in value):
+            self.write_imap(value)
+        elif all(isinstance(k, str) for k in value):
+            self.write_map(value)
+        else:
+            raise ValueError(f"Invalid value for SHV: {value!r}")
+
+    def _write_shvmap(self, value: SHVMap) -> None:
+        if not all(isinstance(k, str) for k in value):
+            raise ValueError(f"Invalid value for SHV: {value!r}")
+        self.write_map(value)
+
+    def _write_shvimap(self, value: SHVIMap) -> None:
+        if not all(isinstance(k, int) for k in value):
+            raise ValueError(f"Invalid value for SHV: {value!r}")
+        self.write_imap(value)
+
+    def write_datetime(self, value: datetime.datetime) -> None:  # noqa: D102
+        self.buffer.append(self._CP_DATETIME)
+        res = int(value.timestamp() * 1000) - (ChainPack.SHV_EPOCH_SEC * 1000)
+        tzdelta = value.utcoffset()
+        tzoff = int(tzdelta.total_seconds() // 60 // 15) if tzdelta is not None else 0
+        if not -63 <= tzoff <= 63:
+            raise ValueError(f"Invalid UTC offset value: {tzoff}")
+        ms = res % 1000 == 0
+        if ms:
+            res //= 1000
+        if tzoff != 0:
+            res <<= 7
+            res |= tzoff & 0x7F
+        res <<= 2
+        if tzoff != 0:
+            res |= 1
+        if ms:
+            res |= 2
+        self.write_int_data(res)
+
+    _TYPES: typing.ClassVar[
+        dict[type, collections.abc.Callable[[ChainPackBufferWriter, typing.Any], None]]
+    ] = {
+        type(None): lambda self, _: self.write_null(),
+        SHVNull: lambda self, _: self.write_null(),
+        bool: write_bool,
+        SHVBool: lambda self, value: self.write_bool(bool(value)),
+        int: write_int,
+        SHVInt: write_int,
+        SHVUInt: write_uint,
+        float: write_double,
+        SHVFloat: write_double,
+        decimal.Decimal: write_decimal,
+        SHVDecimal: write_decimal,
+        bytes: write_blob,
+        SHVBytes: write_blob,
+        str: write_string,
+        SHVStr: write_string,
+        datetime.datetime: write_datetime,
+        SHVDatetime: write_datetime,
+        list: write_list,
+        tuple: write_list,
+        SHVList: write_list,
+        SHVMap: _write_shvmap,
+        SHVIMap: _write_shvimap,
+        dict: _write_mapping,
+    }
+    """Writers for the exact types that do not need additional type checks."""
@@ -0,0 +1,18 @@
+"""Recording of the SHV RPC signals and access to them."""
+
+from .columns import HistoryColumns
+from .log import HistoryLog
+from .provider import SHVHistory
+from .reader import HistoryCursor, HistoryReader
+from .record import HistoryRecord, datetime_to_msec, msec_to_datetime
+
+__all__ = [
+    "HistoryColumns",
+    "HistoryCursor",
+    "HistoryLog",
+    "HistoryReader",
+    "HistoryRecord",
+    "SHVHistory",
+    "datetime_to_msec",
+    "msec_to_datetime",
+]
@@ -0,0 +1,230 @@
+"""Columnar representation of the history records for vectorized processing.
+
+This requires :mod:`numpy` that is an optional dependency of this package.
+"""
+
+from __future__ import annotations
+
+import array
+import collections.abc
+import dataclasses
+import decimal
+import os
+import pathlib
+import typing
+
+from ..chainpack import ChainPack
+from ..cpon import Cpon
+from ..value import SHVType, is_shvimap
+from .record import HistoryRecord, datetime_to_msec
+
+try:
+    import numpy
+
+    NUMPY_IMPORT = None
+except ImportError as exc:
+    NUMPY_IMPORT = exc
+
+
+class HistoryColumns:
+    """Records split by their path to the columns of NumPy arrays.
+
+    Records are collected with :meth:`add` (or :meth:`add_getlog` and
+    :meth:`add_history_records` for the SHV RPC representation) and arrays are
+    created on request with :meth:`columns`. The columns for every path are:
+
+    ``timestamp``
+      Timestamps as int64 milliseconds since SHV epoch.
+    ``value``
+      Values as int64 if all of them are integers, float64 if all of them are
+      numbers (where Null is NaN), or dictionary encoded int32 codes otherwise.
+      The dictionary with strings is in ``value_dict`` and Null has code -1.
+      Values are converted to CPON for dictionary unless all of them are
+      strings.
+    ``signal``, ``source``, ``user_id``
+      Dictionary encoded int32 codes with dictionaries in ``signal_dict``,
+      ``source_dict``, and ``user_id_dict``.
+
+    :raise ImportError: if NumPy is not installed.
+    """
+
+    EPOCH_MSEC: typing.Final = ChainPack.SHV_EPOCH_SEC * 1000
+    """SHV epoch in milliseconds since Unix epoch."""
+
+    def __init__(self) -> None:
+        if NUMPY_IMPORT is not None:
+            raise NUMPY_IMPORT
+        self._paths: dict[str, _PathRecords] = {}
+
+    def __len__(self) -> int:
+        return sum(len(r.timestamps) for r in self._paths.values())
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._paths
+
+    @property
+    def paths(self) -> collections.abc.KeysView[str]:
+        """Paths with at least one record."""
+        return self._paths.keys()
+
+    def add(self, record: HistoryRecord) -> None:
+        """Add the record.
+
+        :param record: The record to be added.
+        """
+        if (precords := self._paths.get(record.path)) is None:
+            precords = self._paths[record.path] = _PathRecords()
+        precords.timestamps.append(datetime_to_msec(record.timestamp) - self.EPOCH_MSEC)
+        precords.values.append(record.value)
+        precords.signals.append(record.signal)
+        precords.sources.append(record.source)
+        precords.user_ids.append(record.user_id)
+
+    def extend(self, records: collections.abc.Iterable[HistoryRecord]) -> None:
+        """Add all records.
+
+        :param records: Records to be added.
+        """
+        for record in records:
+            self.add(record)
+
+    def add_getlog(self, records: SHVType, path: str = "") -> None:
+        """Add records in the ``getLog`` result.
+
+        :param records: List of ``!getLogR`` items.
+        :param path: Path of the node ``getLog`` was called on.
+        :raise ValueError: if records are not valid.
+        """
+        if not isinstance(records, collections.abc.Sequence):
+            raise ValueError(f"Expected List but got {type(records)}")
+        result: list[HistoryRecord] = []
+        for value in records:
+            iref = value.get(HistoryRecord.LogKey.REF) if is_shvimap(value) else None
+            if iref is not None and not (
+                isinstance(iref, int) and 0 <= iref < len(result)
+            ):
+                raise ValueError(f"Invalid reference: {iref!r}")
+            record = HistoryRecord.from_getlog(
+                value, path, None if iref is None else result[iref]
+            )
+            result.append(record)
+            self.add(record)
+
+    def add_history_records(self, records: SHVType) -> None:
+        """Add records in the ``!historyRecords`` list.
+
+        :param records: List of ``!historyRecords`` items.
+        :raise ValueError: if records are not valid.
+        """
+        if not isinstance(records, collections.abc.Sequence):
+            raise ValueError(f"Expected List but got {type(records)}")
+        self.extend(HistoryRecord.from_shv(value) for value in records)
+
+    def columns(self, path: str) -> dict[str, numpy.ndarray]:
+        """Get columns for the given path.
+
+        :param path: SHV path the records are associated with.
+        :return: Mapping of column name to its array.
+        :raise KeyError: if there is no record for the given path.
+        """
+        precords = self._paths[path]
+        res = {
+            "timestamp": numpy.array(precords.timestamps, dtype=numpy.int64),
+        }
+        res.update(_values("value", precords.values))
+        res.update(_dictionary("signal", precords.signals))
+        res.update(_dictionary("source", precords.sources))
+        res.update(_dictionary("user_id", precords.user_ids))
+        return res
+
+    def items(self) -> collections.abc.Iterator[tuple[str, dict[str, numpy.ndarray]]]:
+        """Iterate over paths and their columns.
+
+        :return: Iterator over tuples with path and its columns.
+        """
+        for path in self._paths:
+            yield path, self.columns(path)
+
+    def save_npz(self, file: str | os.PathLike | typing.BinaryIO) -> None:
+        """Write all columns to the NumPy NPZ file.
+
+        Arrays are stored under the ``path:column`` name (such as
+        ``test/device/temperature:value``).
+
+        :param file: File name or file object the data are written to.
+        """
+        arrays: dict[str, typing.Any] = {
+            f"{path}:{name}": column
+            for path, columns in self.items()
+            for name, column in columns.items()
+        }
+        numpy.savez(file, **arrays)
+
+    def save_columns(self, directory: str | os.PathLike) -> None:
+        """Write every column to its own NumPy NPY file.
+
+        Files are placed in the subdirectories following the path and thus
+        ``test/device/temperature:value`` column is stored to the
+        ``test/device/temperature/value.npy`` file. Such files can be memory
+        mapped with :func:`numpy.load`.
+
+        :param directory: Directory where columns are stored.
+        :raise ValueError: if some path can't be used as a file path (it is
+          absolute or contains empty, ``.`` or ``..`` node). Nothing is written
+          in such case.
+        """
+        for path in self._paths:
+            if path and any(node in {"", ".", ".."} for node in path.split("/")):
+                raise ValueError(f"Path can't be stored as file: {path!r}")
+        for path, columns in self.items():
+            pdir = pathlib.Path(directory, path)
+            pdir.mkdir(parents=True, exist_ok=True)
+            for name, column in columns.items():
+                numpy.save(pdir / f"{name}.npy", column)
+
+
+@dataclasses.dataclass
+class _PathRecords:
+    timestamps: array.array[int] = dataclasses.field(
+        default_factory=lambda: array.array("q")
+    )
+    values: list[SHVType] = dataclasses.field(default_factory=list)
+    signals: list[str] = dataclasses.field(default_factory=list)
+    sources: list[str] = dataclasses.field(default_factory=list)
+    user_ids: list[str | None] = dataclasses.field(default_factory=list)
+
+
+_INT64_MIN: typing.Final = -(1 << 63)
+_INT64_MAX: typing.Final = (1 << 63) - 1
+
+
+def _values(name: str, values: list[SHVType]) -> dict[str, numpy.ndarray]:
+    if all(isinstance(v, int) and _INT64_MIN <= v <= _INT64_MAX for v in values):
+        return {name: numpy.array(values, dtype=numpy.int64)}
+    if all(isinstance(v, int | float | decimal.Decimal | None) for v in values):
+        return {
+            name: numpy.fromiter(
+                (
+                    numpy.nan if v is None else float(typing.cast(float, v))
+                    for v in values
+                ),
+                dtype=numpy.float64,
+                count=len(values),
+            )
+        }
+    if all(isinstance(v, str | None) for v in values):
+        return _dictionary(name, typing.cast(list[str | None], values))
+    # Strings are packed as well to not mix them with CPON of other values
+    return _dictionary(name, [None if v is None else Cpon.pack(v) for v in values])
+
+
+def _dictionary(
+    name: str, values: collections.abc.Sequence[str | None]
+) -> dict[str, numpy.ndarray]:
+    index: dict[str, int] = {}
+    codes = numpy.fromiter(
+        (-1 if v is None else index.setdefault(v, len(index)) for v in values),
+        dtype=numpy.int32,
+        count=len(values),
+    )
+    return {name: codes, f"{name}_dict": numpy.array(list(index), dtype=numpy.str_)}
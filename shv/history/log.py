@@ -0,0 +1,293 @@
+"""Segmented append-only storage of the recorded signals."""
+
+from __future__ import annotations
+
+import bisect
+import collections.abc
+import dataclasses
+import datetime
+import logging
+import os
+import pathlib
+import struct
+import typing
+
+from ..chainpack import ChainPack, ChainPackBufferReader
+from .reader import HistoryReader
+from .record import HistoryRecord, datetime_to_msec, msec_to_datetime
+
+logger = logging.getLogger(__name__)
+
+
+class HistoryLog:
+    """Storage of the records in the segmented append-only ChainPack log.
+
+    Records are appended to the segment files in the directory. Every segment
+    is sequence of ChainPack encoded :class:`HistoryRecord`. The new segment is
+    started once the current one reaches the :attr:`segment_size`. Timestamps
+    are kept non-decreasing over the whole log and thus segments are sorted by
+    time as well as records in them.
+
+    Every segment has sparse index with timestamp and offset of the record
+    added every :attr:`INDEX_STEP` bytes. The index is kept in memory and
+    records are located with binary search over segments and then over the
+    index. Only the data between two index entries are read at once and thus
+    memory used for reading is bounded no matter the size of the log.
+
+    :param directory: Directory where segments are stored. It is created if it
+      doesn't exist.
+    :param segment_size: Size in bytes when a new segment is started.
+    :param max_size: Maximal size of all segments in bytes. The oldest segments
+      are removed to keep the size under this limit when a new segment is
+      started. ``None`` is for no limit.
+    """
+
+    INDEX_STEP: int = 1 << 16
+    """Number of bytes between two sparse index entries."""
+
+    _INDEX: typing.Final = struct.Struct("<qq")
+    _SUFFIX: typing.Final = ".chainpack"
+    _ISUFFIX: typing.Final = ".index"
+    _PATHS: typing.Final = "paths"
+
+    def __init__(
+        self,
+        directory: pathlib.Path | str,
+        segment_size: int = 1 << 24,
+        max_size: int | None = None,
+    ) -> None:
+        self.directory = pathlib.Path(directory)
+        """Directory with segments."""
+        self.segment_size = segment_size
+        """Size in bytes when a new segment is started."""
+        self.max_size = max_size
+        """Maximal size of all segments in bytes."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._segments: list[_Segment] = []
+        self._last_msec = -(1 << 63)
+        self._file: typing.BinaryIO | None = None
+        self._ifile: typing.BinaryIO | None = None
+        self.paths: set[str] = set()
+        """Set of all paths that were recorded in the log."""
+        if (ppath := self.directory / self._PATHS).exists():
+            self.paths.update(
+                line for line in ppath.read_text("utf-8").splitlines() if line
+            )
+        self._pfile = (self.directory / self._PATHS).open("a", encoding="utf-8")
+        self._load()
+
+    def _load(self) -> None:
+        for path in sorted(self.directory.glob(f"*{self._SUFFIX}")):
+            try:
+                seq = int(path.stem)
+            except ValueError:
+                continue
+            segment = _Segment(seq, path, path.with_suffix(self._ISUFFIX))
+            segment.size = path.stat().st_size
+            self._load_index(segment)
+            if segment.size == 0:
+                path.unlink()
+                segment.ipath.unlink(missing_ok=True)
+                continue
+            self._segments.append(segment)
+        if self._segments:
+            segment = self._segments[-1]
+            self._last_msec = segment.last_msec
+            self._file = segment.path.open("ab")
+            self._ifile = segment.ipath.open("ab")
+
+    def _load_index(self, segment: _Segment) -> None:
+        raw = segment.ipath.read_bytes() if segment.ipath.exists() else b""
+        for msec, offset in self._INDEX.iter_unpack(
+            raw[: len(raw) - len(raw) % self._INDEX.size]
+        ):
+            if offset >= segment.size:
+                break
+            segment.msecs.append(msec)
+            segment.offsets.append(offset)
+        # Scan the tail after the last index entry to recover entries that were
+        # not written and to drop partially written record.
+        while not self._scan_tail(segment):
+            segment.msecs.pop()
+            segment.offsets.pop()
+        index = b"".join(
+            self._INDEX.pack(msec, offset)
+            for msec, offset in zip(segment.msecs, segment.offsets, strict=True)
+        )
+        if index != raw:
+            segment.ipath.write_bytes(index)
+
+    def _scan_tail(self, segment: _Segment) -> bool:
+        offset = segment.offsets[-1] if segment.offsets else 0
+        with segment.path.open("rb") as file:
+            file.seek(offset)
+            data = file.read(segment.size - offset)
+        reader = ChainPackBufferReader(data)
+        while reader.pos < len(data):
+            pos = reader.pos
+            try:
+                record = HistoryRecord.from_shv(reader.read())
+            except ValueError:
+                logger.warning(
+                    "Dropping invalid data at %d in %s", offset + pos, segment.path
+                )
+                segment.size = offset + pos
+                os.truncate(segment.path, segment.size)
+                return pos > 0 or not segment.offsets
+            if not segment.offsets or (
+                offset + pos - segment.offsets[-1] >= self.INDEX_STEP
+            ):
+                segment.msecs.append(record.msec)
+                segment.offsets.append(offset + pos)
+            segment.last_msec = record.msec
+        return True
+
+    @property
+    def size(self) -> int:
+        """Size of all segments in bytes."""
+        return sum(s.size for s in self._segments)
+
+    def append(self, record: HistoryRecord) -> None:
+        """Append the record to the log.
+
+        Timestamp of the record is changed to the latest timestamp in the log if
+        it is older (timestamps are kept non-decreasing).
+
+        :param record: The record to be appended.
+        """
+        msec = record.msec
+        if msec < self._last_msec:
+            msec = self._last_msec
+            record = dataclasses.replace(record, timestamp=msec_to_datetime(msec))
+        data = ChainPack.pack(record.to_shv())
+        if not self._segments or (
+            self._segments[-1].size + len(data) > self.segment_size
+        ):
+            self._rotate()
+        assert self._file is not None and self._ifile is not None
+        segment = self._segments[-1]
+        if not segment.offsets or segment.size - segment.offsets[-1] >= self.INDEX_STEP:
+            segment.msecs.append(msec)
+            segment.offsets.append(segment.size)
+            self._ifile.write(self._INDEX.pack(msec, segment.size))
+        self._file.write(data)
+        segment.size += len(data)
+        segment.last_msec = msec
+        self._last_msec = msec
+        if record.path not in self.paths:
+            self.paths.add(record.path)
+            self._pfile.write(f"{record.path}\n")
+
+    def _rotate(self) -> None:
+        self._close_files()
+        seq = self._segments[-1].seq + 1 if self._segments else 0
+        path = self.directory / f"{seq:010d}{self._SUFFIX}"
+        segment = _Segment(seq, path, path.with_suffix(self._ISUFFIX))
+        self._segments.append(segment)
+        self._file = segment.path.open("ab")
+        self._ifile = segment.ipath.open("ab")
+        if self.max_size is not None:
+            size = self.size
+            while len(self._segments) > 1 and size > self.max_size:
+                old = self._segments.pop(0)
+                size -= old.size
+                logger.debug("Removing old segment %s", old.path)
+                old.path.unlink(missing_ok=True)
+                old.ipath.unlink(missing_ok=True)
+
+    def flush(self) -> None:
+        """Flush all written records to the files."""
+        for file in (self._file, self._ifile, self._pfile):
+            if file is not None and not file.closed:
+                file.flush()
+
+    def _close_files(self) -> None:
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._ifile is not None:
+            self._ifile.close()
+            self._ifile = None
+
+    def close(self) -> None:
+        """Flush and close all files."""
+        self._close_files()
+        self._pfile.close()
+
+    def records(
+        self,
+        since: datetime.datetime | None = None,
+        until: datetime.datetime | None = None,
+        path: str = "",
+    ) -> collections.abc.Iterator[HistoryRecord]:
+        """Iterate over records in the given time range.
+
+        Records with timestamp in range from ``since`` (inclusive) to ``until``
+        (exclusive) are provided in the order they were recorded. If ``since``
+        is after ``until`` then records with timestamp from ``until``
+        (inclusive) to ``since`` (exclusive) are provided in the reverse order.
+
+        Records are read lazily with :class:`HistoryReader` and it is not
+        allowed to append records while iterating.
+
+        :param since: Start of the range. ``None`` is for the oldest record.
+        :param until: End of the range. ``None`` is for the newest record.
+        :param path: Only records for this path and paths bellow it are
+          provided. The empty path is for all records.
+        :return: Iterator over records.
+        """
+        self.flush()
+        smsec = -(1 << 63) if since is None else datetime_to_msec(since)
+        umsec = 1 << 63 if until is None else datetime_to_msec(until)
+        if smsec <= umsec:
+            return self._records_forward(smsec, umsec, path)
+        return self._records_backward(umsec, smsec, path)
+
+    def _records_forward(
+        self, lower: int, upper: int, path: str
+    ) -> collections.abc.Iterator[HistoryRecord]:
+        segments = list(self._segments)
+        sindex = bisect.bisect_left([s.msecs[0] for s in segments], lower)
+        for segment in segments[max(sindex - 1, 0) :]:
+            if segment.msecs[0] >= upper:
+                return
+            bindex = max(bisect.bisect_left(segment.msecs, lower) - 1, 0)
+            with HistoryReader(segment.path) as reader:
+                for cursor in reader.scan(
+                    segment.offsets[bindex], segment.size, lower, upper, path
+                ):
+                    yield cursor.record()
+
+    def _records_backward(
+        self, lower: int, upper: int, path: str
+    ) -> collections.abc.Iterator[HistoryRecord]:
+        segments = list(self._segments)
+        sindex = bisect.bisect_left([s.msecs[0] for s in segments], upper)
+        for segment in reversed(segments[:sindex]):
+            bindex = bisect.bisect_left(segment.msecs, upper)
+            with HistoryReader(segment.path) as reader:
+                for block in reversed(range(bindex)):
+                    end = (
+                        segment.offsets[block + 1]
+                        if block + 1 < len(segment.offsets)
+                        else segment.size
+                    )
+                    cursors = list(
+                        reader.scan(segment.offsets[block], end, lower, upper, path)
+                    )
+                    for cursor in reversed(cursors):
+                        yield cursor.record()
+                    if segment.msecs[block] < lower:
+                        return
+
+
+@dataclasses.dataclass
+class _Segment:
+    seq: int
+    path: pathlib.Path
+    ipath: pathlib.Path
+    size: int = 0
+    msecs: list[int] = dataclasses.field(default_factory=list)
+    offsets: list[int] = dataclasses.field(default_factory=list)
+    last_msec: int = -(1 << 63)
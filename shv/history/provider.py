@@ -0,0 +1,143 @@
+"""SHV client recording signals and providing them with ``getLog``."""
+
+from __future__ import annotations
+
+import asyncio
+import collections.abc
+import datetime
+import typing
+
+from ..rpcapi.base import SHVBase
+from ..rpcapi.client import SHVClient
+from ..rpcdef import RpcAccess, RpcDir, RpcInvalidParamError
+from ..rpclogin import RpcLogin
+from ..rpcparam import SHVGetKey, shvget, shvgett
+from ..rpcri import rpcri_compile
+from ..rpctransport import RpcClient
+from ..value import SHVType
+from .log import HistoryLog
+from .record import HistoryRecord
+
+
+class SHVHistory(SHVClient):
+    """SHV client that records signals to the :class:`HistoryLog`.
+
+    Every received signal is appended to the log. Use :meth:`subscribe` to
+    select signals to be recorded (or let the SHV RPC Broker to subscribe them
+    for this client with its autosetup). The recorded signals are provided with
+    ``getLog`` method on the node with the same path as the signal has (thus
+    nodes mirror the tree of recorded paths) and on all its parent nodes.
+
+    :param client: Connection to the broker.
+    :param login: Login to the broker.
+    :param log: Log records are stored to.
+    """
+
+    APP_NAME: str = "pyshv-history"
+
+    GETLOG_COUNT_LIMIT: int = 10000
+    """Maximal number of records provided by a single ``getLog`` call.
+
+    This is also used if ``count`` is not specified.
+    """
+
+    GETLOG_YIELD_STEP: int = 1000
+    """Number of scanned records after which ``getLog`` yields to the event loop.
+
+    The scan can go over a large part of the log when records are filtered out
+    and this prevents it from blocking the other work. Signals received during
+    the scan are recorded once it completes.
+    """
+
+    def __init__(
+        self,
+        client: RpcClient,
+        login: RpcLogin,
+        log: HistoryLog,
+        *args: typing.Any,  # noqa ANN401
+        **kwargs: typing.Any,  # noqa ANN401
+    ) -> None:
+        super().__init__(client, login, *args, **kwargs)
+        self.log = log
+        """Log signals are recorded to."""
+        self._scans = 0
+        self._pending: list[HistoryRecord] = []
+
+    async def _got_signal(self, signal: SHVBase.Signal) -> None:
+        record = HistoryRecord(
+            timestamp=datetime.datetime.now(datetime.UTC),
+            path=signal.path,
+            signal=signal.signal,
+            source=signal.source,
+            value=signal.param,
+            access=signal.access,
+            user_id=signal.user_id,
+        )
+        if self._scans:
+            self._pending.append(record)  # Log can't be appended while read
+        else:
+            self.log.append(record)
+
+    async def _method_call(self, request: SHVBase.Request) -> SHVType:
+        if (
+            request.method == "getLog"
+            and request.access >= RpcAccess.READ
+            and not self._app_path(request.path)
+        ):
+            return await self._getlog(request.path, request.param, request.access)
+        return await super()._method_call(request)
+
+    async def _getlog(self, path: str, param: SHVType, access: RpcAccess) -> SHVType:
+        since = shvget(param, SHVGetKey("since", 1), None)
+        until = shvget(param, SHVGetKey("until", 2), None)
+        if not isinstance(since, datetime.datetime | None) or not isinstance(
+            until, datetime.datetime | None
+        ):
+            raise RpcInvalidParamError("'since' and 'until' must be DateTime")
+        count = shvgett(param, SHVGetKey("count", 3), int, self.GETLOG_COUNT_LIMIT)
+        if count < 0:
+            raise RpcInvalidParamError("'count' must be non-negative")
+        ri = rpcri_compile(shvgett(param, SHVGetKey("ri", 4), str, "**:*:*"))
+        prefix = f"{path}/" if path else ""
+        limit = min(count, self.GETLOG_COUNT_LIMIT)
+        res: list[SHVType] = []
+        if not limit:
+            return res
+        self._scans += 1
+        try:
+            for i, r in enumerate(self.log.records(since, until, path), 1):
+                if r.access <= access and ri.match(
+                    r.path[len(prefix) :], r.source, r.signal
+                ):
+                    res.append(r.to_getlog(path))
+                    if len(res) >= limit:
+                        break
+                if i % self.GETLOG_YIELD_STEP == 0:
+                    await asyncio.sleep(0)
+        finally:
+            self._scans -= 1
+            if not self._scans:
+                for record in self._pending:
+                    self.log.append(record)
+                self._pending.clear()
+        return res
+
+    @staticmethod
+    def _app_path(path: str) -> bool:
+        return path == ".app" or path.startswith(".app/")
+
+    def _ls(self, path: str) -> collections.abc.Iterator[str]:
+        yield from super()._ls(path)
+        if not self._app_path(path):
+            yield from self._ls_node_for_path(path, iter(self.log.paths))
+
+    def _dir(self, path: str) -> collections.abc.Iterator[RpcDir]:
+        yield from super()._dir(path)
+        if not self._app_path(path):
+            yield RpcDir(
+                "getLog",
+                RpcDir.Flag.LARGE_RESULT_HINT,
+                param="!getLogP",
+                result="!getLogR",
+                access=RpcAccess.READ,
+            )
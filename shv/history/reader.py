@@ -0,0 +1,235 @@
+"""Memory mapped reader of the ChainPack record files."""
+
+from __future__ import annotations
+
+import collections.abc
+import datetime
+import mmap
+import os
+import pathlib
+import types
+import typing
+
+from ..chainpack import ChainPack, ChainPackBufferReader
+from ..path import SHVPath
+from .record import HistoryRecord, datetime_to_msec, msec_to_datetime
+
+
+class HistoryCursor:
+    """Single record located in the :class:`HistoryReader` data.
+
+    Only the timestamp and path are decoded when record is located. The rest of
+    the record stays in the memory mapped file and is decoded only when
+    :meth:`record` is called. The cursor is valid only until the reader is
+    closed.
+    """
+
+    __slots__ = ("_data", "_path_end", "_path_start", "msec", "offset", "size")
+
+    def __init__(
+        self,
+        data: memoryview,
+        offset: int,
+        size: int,
+        msec: int,
+        path_start: int,
+        path_end: int,
+    ) -> None:
+        self._data = data
+        self._path_start = path_start
+        self._path_end = path_end
+        self.offset = offset
+        """Offset of the record in the file."""
+        self.size = size
+        """Size of the record in bytes."""
+        self.msec = msec
+        """Timestamp as number of milliseconds since Unix epoch."""
+
+    def __repr__(self) -> str:
+        return f"<HistoryCursor {self.offset}: {self.timestamp} {self.path!r}>"
+
+    @property
+    def timestamp(self) -> datetime.datetime:
+        """Time when signal was recorded."""
+        return msec_to_datetime(self.msec)
+
+    @property
+    def path(self) -> str:
+        """SHV path the signal is associated with."""
+        return str(self._data[self._path_start : self._path_end], "utf-8")
+
+    @property
+    def raw(self) -> memoryview:
+        """ChainPack data of the record without copy."""
+        return self._data[self.offset : self.offset + self.size]
+
+    def record(self) -> HistoryRecord:
+        """Decode the whole record.
+
+        :return: The record.
+        :raise ValueError: if record is not valid.
+        """
+        return HistoryRecord.from_shv(ChainPackBufferReader(self.raw).read())
+
+
+class HistoryReader:
+    """Memory mapped reader of the ChainPack record files.
+
+    The file must contain either sequence of ``!historyRecords`` items (that is
+    the format of :class:`HistoryLog` segments) or a single ``!historyRecords``
+    list. Records are expected to be ordered by time.
+
+    Records are iterated as :class:`HistoryCursor` that references data in the
+    memory mapped file. Only the timestamp and path of the record are decoded
+    and the rest of the record is skipped over without being decoded and thus
+    filtering by time and path is cheap even for records with large values.
+
+    The reader can be used as context manager that closes it on exit.
+
+    :param path: Path to the file with records.
+    """
+
+    def __init__(self, path: pathlib.Path | str) -> None:
+        self.path = pathlib.Path(path)
+        """Path to the file with records."""
+        self._mmap: mmap.mmap | None = None
+        with self.path.open("rb") as file:
+            if os.fstat(file.fileno()).st_size > 0:
+                self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._data = memoryview(self._mmap if self._mmap is not None else b"")
+        self._start = int(self._data[:1] == bytes((ChainPack.Schema.CP_List,)))
+
+    def __enter__(self) -> typing.Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __iter__(self) -> collections.abc.Iterator[HistoryCursor]:
+        return self.records()
+
+    def close(self) -> None:
+        """Close the memory mapped file.
+
+        :raise BufferError: if there is still :attr:`HistoryCursor.raw` in use.
+        """
+        self._data.release()
+        if self._mmap is not None:
+            self._mmap.close()
+
+    def records(
+        self,
+        since: datetime.datetime | None = None,
+        until: datetime.datetime | None = None,
+        path: SHVPath | str = "",
+    ) -> collections.abc.Iterator[HistoryCursor]:
+        """Iterate over records in the given time range and path.
+
+        :param since: Only records with this or later timestamp are provided.
+          ``None`` is for the first record.
+        :param until: Only records with timestamp before this one are provided.
+          ``None`` is for the last record.
+        :param path: Only records for this path and paths bellow it are
+          provided. The empty path is for all records.
+        :return: Iterator over records.
+        :raise ValueError: if file contains invalid data.
+        """
+        return self.scan(
+            self._start,
+            len(self._data),
+            -(1 << 63) if since is None else datetime_to_msec(since),
+            1 << 63 if until is None else datetime_to_msec(until),
+            str(path),
+        )
+
+    def scan(
+        self, start: int, end: int, lower: int, upper: int, path: str = ""
+    ) -> collections.abc.Iterator[HistoryCursor]:
+        """Iterate over records in the given data range.
+
+        This is the low level variant of :meth:`records`.
+
+        :param start: Offset of the first record.
+        :param end: Offset after the last record.
+        :param lower: Minimal timestamp in milliseconds since Unix epoch.
+        :param upper: Timestamp in milliseconds since Unix epoch that is
+          after the last provided record. The iteration stops on the first
+          record with this or later timestamp.
+        :param path: Only records for this path and paths bellow it are
+          provided. The empty path is for all records.
+        :return: Iterator over records.
+        :raise ValueError: if data in the range are not valid.
+        """
+        return _RecordScanner(self._data, start).scan(
+            min(end, len(self._data)), lower, upper, path.encode("utf-8")
+        )
+
+
+class _RecordScanner(ChainPackBufferReader):
+    _CP_STRING: typing.Final = ChainPack.Schema.CP_String.value
+    _CP_IMAP: typing.Final = ChainPack.Schema.CP_IMap.value
+    _CP_DATETIME: typing.Final = ChainPack.Schema.CP_DateTime.value
+    _CP_TERM: typing.Final = ChainPack.Schema.CP_TERM.value
+    _TIMESTAMP: typing.Final = HistoryRecord.Key.TIMESTAMP.value
+    _PATH: typing.Final = HistoryRecord.Key.PATH.value
+    _EPOCH_MSEC: typing.Final = ChainPack.SHV_EPOCH_SEC * 1000
+
+    def scan(
+        self, end: int, lower: int, upper: int, prefix: bytes
+    ) -> collections.abc.Iterator[HistoryCursor]:
+        try:
+            yield from self._scan(end, lower, upper, prefix)
+        except IndexError as exc:
+            raise ValueError("Unexpected end of data.") from exc
+
+    def _scan(
+        self, end: int, lower: int, upper: int, prefix: bytes
+    ) -> collections.abc.Iterator[HistoryCursor]:
+        data = typing.cast(memoryview, self.data)
+        plen = len(prefix)
+        while self.pos < end and data[self.pos] != self._CP_TERM:
+            offset = self.pos
+            if data[offset] != self._CP_IMAP:
+                raise ValueError(f"Record expected at {offset}")
+            self.pos += 1
+            msec: int | None = None
+            pstart = pend = 0
+            while data[self.pos] != self._CP_TERM:
+                key = self._read()
+                schema = data[self.pos]
+                if key == self._TIMESTAMP and schema == self._CP_DATETIME:
+                    self.pos += 1
+                    msec = self._read_msec()
+                elif key == self._PATH and schema == self._CP_STRING:
+                    self.pos += 1
+                    size = self._read_uint_data_helper()[0]
+                    pstart = self.pos
+                    pend = self.pos = pstart + size
+                else:
+                    self._skip()
+            self.pos += 1
+            if msec is None:
+                raise ValueError(f"Record without timestamp at {offset}")
+            if msec >= upper:
+                return
+            if msec < lower:
+                continue
+            if plen and not (
+                pend - pstart >= plen
+                and data[pstart : pstart + plen] == prefix
+                and (pend - pstart == plen or data[pstart + plen] == 0x2F)  # "/"
+            ):
+                continue
+            yield HistoryCursor(data, offset, self.pos - offset, msec, pstart, pend)
+
+    def _read_msec(self) -> int:
+        d = self._read_int_data()
+        has_tz_offset = d & 1
+        has_not_msec = d & 2
+        d >>= 9 if has_tz_offset else 2
+        return (d * 1000 if has_not_msec else d) + self._EPOCH_MSEC
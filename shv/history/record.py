@@ -0,0 +1,198 @@
+"""Record of the single signal in the history."""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import enum
+import typing
+
+from ..rpcdef.access import RpcAccess
+from ..value import SHVIMapType, SHVType, is_shvimap
+
+_EPOCH: typing.Final = datetime.datetime(1970, 1, 1, tzinfo=datetime.UTC)
+_MSEC: typing.Final = datetime.timedelta(milliseconds=1)
+
+
+def datetime_to_msec(value: datetime.datetime) -> int:
+    """Convert datetime to the number of milliseconds since Unix epoch.
+
+    :param value: Datetime to be converted. Naive datetime is considered to be
+      in the local time.
+    :return: Number of milliseconds.
+    """
+    return (value.astimezone() - _EPOCH) // _MSEC
+
+
+def msec_to_datetime(value: int) -> datetime.datetime:
+    """Convert number of milliseconds since Unix epoch to the datetime.
+
+    :param value: Number of milliseconds.
+    :return: Datetime in UTC.
+    """
+    return _EPOCH + value * _MSEC
+
+
+@dataclasses.dataclass
+class HistoryRecord:
+    """Single recorded signal.
+
+    This is stored in the log in the format of ``!historyRecords`` item
+    (:data:`shv.rpctypes.rpctype_history_records`).
+    """
+
+    class Key(enum.IntEnum):
+        """Key in the ``!historyRecords`` item IMap."""
+
+        TYPE = 0
+        TIMESTAMP = 1
+        PATH = 2
+        SIGNAL = 3
+        SOURCE = 4
+        VALUE = 5
+        ACCESS_LEVEL = 6
+        USER_ID = 7
+
+    class LogKey(enum.IntEnum):
+        """Key in the ``!getLogR`` item IMap."""
+
+        TIMESTAMP = 1
+        REF = 2
+        PATH = 3
+        SIGNAL = 4
+        SOURCE = 5
+        VALUE = 6
+        USER_ID = 7
+        REPEAT = 8
+
+    timestamp: datetime.datetime
+    """Time when signal was recorded."""
+    path: str
+    """SHV path the signal is associated with."""
+    signal: str = "chng"
+    """Signal name."""
+    source: str = "get"
+    """Name of the method the signal is associated with."""
+    value: SHVType = None
+    """Value carried by the signal."""
+    access: RpcAccess = RpcAccess.READ
+    """Access level of the signal."""
+    user_id: str | None = None
+    """User's ID recorded in the signal."""
+
+    @property
+    def msec(self) -> int:
+        """Timestamp as number of milliseconds since Unix epoch."""
+        return datetime_to_msec(self.timestamp)
+
+    def to_shv(self) -> SHVIMapType:
+        """Convert to SHV RPC representation (``!historyRecords`` item)."""
+        res: dict[int, SHVType] = {
+            self.Key.TYPE: 1,  # normal
+            self.Key.TIMESTAMP: self.timestamp,
+            self.Key.PATH: self.path,
+            self.Key.SIGNAL: self.signal,
+            self.Key.SOURCE: self.source,
+            self.Key.VALUE: self.value,
+            self.Key.ACCESS_LEVEL: self.access,
+        }
+        if self.user_id is not None:
+            res[self.Key.USER_ID] = self.user_id
+        return res
+
+    @classmethod
+    def from_shv(cls, value: SHVType) -> HistoryRecord:
+        """Create from SHV RPC representation (``!historyRecords`` item).
+
+        :param value: IMap with record.
+        :return: The record.
+        :raise ValueError: if value is not valid record.
+        """
+        if not is_shvimap(value):
+            raise ValueError(f"Expected IMap but got {type(value)}")
+        timestamp = value.get(cls.Key.TIMESTAMP)
+        if not isinstance(timestamp, datetime.datetime):
+            raise ValueError(f"Invalid timestamp: {timestamp!r}")
+        path = value.get(cls.Key.PATH, "")
+        signal = value.get(cls.Key.SIGNAL, "chng")
+        source = value.get(cls.Key.SOURCE, "get")
+        access = value.get(cls.Key.ACCESS_LEVEL, RpcAccess.READ)
+        user_id = value.get(cls.Key.USER_ID)
+        if (
+            not isinstance(path, str)
+            or not isinstance(signal, str)
+            or not isinstance(source, str)
+            or not isinstance(access, int)
+            or not isinstance(user_id, str | None)
+        ):
+            raise ValueError(f"Invalid record: {value!r}")
+        return cls(
+            timestamp=timestamp,
+            path=path,
+            signal=signal,
+            source=source,
+            value=value.get(cls.Key.VALUE),
+            access=RpcAccess(access),
+            user_id=user_id,
+        )
+
+    def to_getlog(self, path: str = "") -> SHVIMapType:
+        """Convert to ``!getLogR`` item.
+
+        :param path: Path the record path is made relative to.
+        :return: IMap with record.
+        """
+        res: dict[int, SHVType] = {self.LogKey.TIMESTAMP: self.timestamp}
+        if rpath := self.path[len(path) + 1 :] if path else self.path:
+            res[self.LogKey.PATH] = rpath
+        if self.signal != "chng":
+            res[self.LogKey.SIGNAL] = self.signal
+        if self.source != "get":
+            res[self.LogKey.SOURCE] = self.source
+        res[self.LogKey.VALUE] = self.value
+        if self.user_id is not None:
+            res[self.LogKey.USER_ID] = self.user_id
+        return res
+
+    @classmethod
+    def from_getlog(
+        cls, value: SHVType, path: str = "", ref: HistoryRecord | None = None
+    ) -> HistoryRecord:
+        """Create from ``!getLogR`` item.
+
+        :param value: IMap with record.
+        :param path: Path of the node ``getLog`` was called on.
+        :param ref: The record referenced by ``ref`` field of this one. Path,
+          signal, source and user's ID not present in the value are taken from
+          it.
+        :return: The record.
+        :raise ValueError: if value is not valid record.
+        """
+        if not is_shvimap(value):
+            raise ValueError(f"Expected IMap but got {type(value)}")
+        timestamp = value.get(cls.LogKey.TIMESTAMP)
+        if not isinstance(timestamp, datetime.datetime):
+            raise ValueError(f"Invalid timestamp: {timestamp!r}")
+        rpath = value.get(cls.LogKey.PATH)
+        signal = value.get(cls.LogKey.SIGNAL, "chng" if ref is None else ref.signal)
+        source = value.get(cls.LogKey.SOURCE, "get" if ref is None else ref.source)
+        user_id = value.get(cls.LogKey.USER_ID, None if ref is None else ref.user_id)
+        if (
+            not isinstance(rpath, str | None)
+            or not isinstance(signal, str)
+            or not isinstance(source, str)
+            or not isinstance(user_id, str | None)
+        ):
+            raise ValueError(f"Invalid record: {value!r}")
+        if rpath is None:
+            fpath = path if ref is None else ref.path
+        else:
+            fpath = f"{path}/{rpath}" if path and rpath else rpath or path
+        return cls(
+            timestamp=timestamp,
+            path=fpath,
+            signal=signal,
+            source=source,
+            value=value.get(cls.LogKey.VALUE),
+            user_id=user_id,
+        )
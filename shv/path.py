@@ -226,3 +226,158 @@ class SHVPathParents(collections.abc.Sequence[SHVPath]):
 
     def __len__(self) -> int:
         return len(self._path.parts)
+
+
+V = typing.TypeVar("V")
+
+
+class _PathTreeNode(typing.Generic[V]):
+    __slots__ = ("children", "value")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _PathTreeNode[V]] = {}
+        self.value: V | None = None
+
+
+class PathTree(typing.Generic[V]):
+    """Tree of SHV path nodes with values assigned to some of the paths.
+
+    This provides lookup of the value assigned to the path or to any of its
+    parents without comparing path to all paths in the tree.
+    """
+
+    def __init__(self) -> None:
+        self._root: _PathTreeNode[V] = _PathTreeNode()
+
+    @staticmethod
+    def _nodes(path: str) -> list[str]:
+        return path.split("/") if path else []
+
+    def set(self, path: str, value: V) -> None:
+        """Assign value to the given path.
+
+        :param path: SHV path value should be assigned to.
+        :param value: The value to be assigned.
+        """
+        node = self._root
+        for pnode in self._nodes(path):
+            if (child := node.children.get(pnode)) is None:
+                child = node.children[pnode] = _PathTreeNode()
+            node = child
+        node.value = value
+
+    def pop(self, path: str) -> V | None:
+        """Remove value assigned to the given path.
+
+        :param path: SHV path value should be removed from.
+        :return: Value that was assigned to the path or ``None``.
+        """
+        trail: list[tuple[_PathTreeNode[V], str]] = []
+        node = self._root
+        for pnode in self._nodes(path):
+            if (child := node.children.get(pnode)) is None:
+                return None
+            trail.append((node, pnode))
+            node = child
+        res, node.value = node.value, None
+        for parent, pnode in reversed(trail):
+            if node.value is not None or node.children:
+                break
+            del parent.children[pnode]
+            node = parent
+        return res
+
+    def lookup(self, path: str) -> tuple[V, str] | None:
+        """Get value assigned to the path or to the closest of its parents.
+
+        :param path: SHV path value should be located for.
+        :return: Value and path relative to the path value is assigned to or
+          ``None`` if there is no value for this path or its parents.
+        """
+        nodes = self._nodes(path)
+        node = self._root
+        res: tuple[V, int] | None = None
+        if node.value is not None:
+            res = node.value, 0
+        for i, pnode in enumerate(nodes, start=1):
+            if (child := node.children.get(pnode)) is None:
+                break
+            node = child
+            if node.value is not None:
+                res = node.value, i
+        if res is None:
+            return None
+        return res[0], "/".join(nodes[res[1] :])
+
+    def closest(self, path: str) -> V | None:
+        """Get value assigned to the path or to the closest of its parents.
+
+        Compared to the :meth:`lookup` this only walks the tree and doesn't
+        build the relative path.
+
+        :param path: SHV path value should be located for.
+        :return: Value or ``None`` if there is no value for this path or its
+          parents.
+        """
+        node = self._root
+        res = node.value
+        for pnode in self._nodes(path):
+            if (child := node.children.get(pnode)) is None:
+                break
+            node = child
+            if node.value is not None:
+                res = node.value
+        return res
+
+    def get(self, path: str) -> V | None:
+        """Get value assigned exactly to the given path.
+
+        :param path: SHV path value should be provided for.
+        :return: Value or ``None`` if there is no value for this path.
+        """
+        node = self._root
+        for pnode in self._nodes(path):
+            if (child := node.children.get(pnode)) is None:
+                return None
+            node = child
+        return node.value
+
+    def values(self, path: str = "") -> collections.abc.Iterator[V]:
+        """Iterate over values assigned to the path and all its children.
+
+        :param path: SHV path to the subtree.
+        :return: Iterator over values in the subtree.
+        """
+        node = self._root
+        for pnode in self._nodes(path):
+            if (child := node.children.get(pnode)) is None:
+                return
+            node = child
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node.value is not None:
+                yield node.value
+            stack.extend(node.children.values())
+
+    def is_node(self, path: str) -> bool:
+        """Check if path leads to some value.
+
+        :param path: SHV path to be checked.
+        :return: ``True`` if value is assigned to this path or any of its
+          children.
+        """
+        node = self._root
+        for pnode in self._nodes(path):
+            if (child := node.children.get(pnode)) is None:
+                return False
+            node = child
+        return node.value is not None or bool(node.children)
+
+    def overlaps(self, path: str) -> bool:
+        """Check if value is assigned to the path, its parents or its children.
+
+        :param path: SHV path to be checked.
+        :return: ``True`` if path overlaps with some path in the tree.
+        """
+        return self.lookup(path) is not None or self.is_node(path)
@@ -1,5 +1,6 @@
 """The high level API interface."""
 
 from .base import SHVBase
+from .sendqueue import RpcSendQueue
 
-__all__ = ["SHVBase"]
+__all__ = ["RpcSendQueue", "SHVBase"]
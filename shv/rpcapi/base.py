@@ -8,7 +8,9 @@ import collections.abc
 import contextlib
 import datetime
 import functools
+import heapq
 import logging
+import math
 import time
 
 from ..__version__ import VERSION
@@ -58,6 +60,8 @@ class SHVBase:
 
     IDLE_TIMEOUT: float = 180
     """Number of seconds before we are disconnected from the broker automatically."""
+    SEND_BATCH_MAX: int = 64
+    """Maximum number of messages sent together in a single batch."""
 
     APP_NAME: str = "pyshv"
     """Name of the application reported to the SHV.
@@ -102,12 +106,14 @@ class SHVBase:
         time. Any response on query on voluntary one extends this timeout.
         """
         self._requests: dict[tuple[int, ...], tuple[asyncio.Task, SHVBase.Request]] = {}
-        self._responses: dict[int, asyncio.Queue[RpcMessage | None]] = {}
+        self._progress_dirty: collections.deque[SHVBase.Request] = collections.deque()
+        self._responses: dict[int, _PendingCall] = {}
         self._peer_shv_version = peer_shv_version
         self.__initial_peer_shv_version = peer_shv_version
         self.__send_semaphore = asyncio.Semaphore()
         self.__send_queue: collections.deque[tuple[RpcMessage, asyncio.Future]]
         self.__send_queue = collections.deque()
+        self.__timers = _TimerWheel()
 
     async def disconnect(self) -> None:
         """Disconnect an existing connection.
@@ -159,9 +165,8 @@ class SHVBase:
         self._peer_shv_version = self.__initial_peer_shv_version
         for request_task, _ in self._requests.values():
             request_task.cancel()
-        for queue in self._responses.values():
-            with contextlib.suppress(asyncio.QueueFull):
-                queue.put_nowait(None)
+        for pending in self._responses.values():
+            pending.put(None)
 
     async def reset(self) -> None:
         """Reset the client and connection.
@@ -253,7 +258,7 @@ class SHVBase:
         if extra_access:
             request.access = [*request.access, *extra_access]
         assert request.request_id not in self._responses
-        queue = self._responses[request.request_id] = asyncio.Queue()
+        pending = self._responses[request.request_id] = _PendingCall()
         try:
             while True:
                 await self._send(request)
@@ -261,8 +266,7 @@ class SHVBase:
                 while True:
                     try:
                         tm = min(query_timeout, retry_timeout + last - time.monotonic())
-                        async with asyncio.timeout(tm):
-                            msg = await queue.get()
+                        msg = await pending.get(self.__timers, tm)
                         if msg is None:  # The communication reset
                             break  # We need to send request again
                         match msg.type:
@@ -273,13 +277,13 @@ class SHVBase:
                                     case RpcUserIDRequiredError():
                                         request.user_id = self.user_id
                                         rid = request.new_request_id()
-                                        self._responses[rid] = queue
+                                        self._responses[rid] = pending
                                     case RpcRequestInvalidError():
-                                        self._responses[request.request_id] = queue
+                                        self._responses[request.request_id] = pending
                                     case RpcTryAgainLaterError():
                                         await callback_progress(None)
                                         rid = request.new_request_id()
-                                        self._responses[rid] = queue
+                                        self._responses[rid] = pending
                                         tm = retry_timeout + last - time.monotonic()
                                         if tm > 0:
                                             await asyncio.sleep(tm)
@@ -302,6 +306,92 @@ class SHVBase:
                     await self._send(request.make_abort(True))
                 del self._responses[request.request_id]
 
+    async def call_many(
+        self,
+        calls: collections.abc.Iterable[tuple[str | SHVPath, str, SHVType]],
+        window: int = 8,
+        user_id: str | None = None,
+        query_timeout: float | None = None,
+        retry_timeout: float | None = None,
+    ) -> collections.abc.AsyncIterator[tuple[int, SHVType | RpcError]]:
+        """Perform multiple calls with bounded number of requests in flight.
+
+        Only up to ``window`` calls is performed at the same time. The next
+        call is started only once some of them is finished. This prevents
+        flooding of the peer as well as of the link and thus should be
+        preferred over :func:`asyncio.gather` of :meth:`call`.
+
+        Results are provided in order calls finish, not in order they were
+        specified. The index of the call in ``calls`` is provided with result.
+
+        .. code-block:: python
+
+            calls = [(path, "get", None) for path in paths]
+            async for i, value in client.call_many(calls):
+                print(f"{paths[i]}: {value}")
+
+        :param calls: Iterable with path, method and parameter for every call.
+          It is consumed only as calls are started.
+        :param window: Maximum number of calls in flight.
+        :param user_id: User ID passed to every :meth:`call`.
+        :param query_timeout: Query timeout passed to every :meth:`call`.
+        :param retry_timeout: Retry timeout passed to every :meth:`call`.
+        :return: Asynchronous iterator over tuples with index of the call and
+          its result. :class:`shv.rpcdef.RpcError` is provided as a result if
+          call failed with it.
+        :raise ValueError: when ``window`` is less than one.
+        :raise EOFError: when client disconnected and thus request can't be
+          sent or response received.
+        """
+        if window < 1:
+            raise ValueError(f"Window must be at least 1 but is {window}")
+        calls_iter = enumerate(calls)
+        tasks: dict[asyncio.Task[SHVType], int] = {}
+        finished: collections.deque[asyncio.Task[SHVType]] = collections.deque()
+        ready = asyncio.Event()
+
+        def done(task: asyncio.Task[SHVType]) -> None:
+            finished.append(task)
+            ready.set()
+
+        def fill() -> None:
+            while len(tasks) < window and (call := next(calls_iter, None)) is not None:
+                i, (path, method, param) = call
+                task = asyncio.create_task(
+                    self.call(
+                        path,
+                        method,
+                        param,
+                        user_id=user_id,
+                        query_timeout=query_timeout,
+                        retry_timeout=retry_timeout,
+                    )
+                )
+                task.add_done_callback(done)
+                tasks[task] = i
+
+        try:
+            fill()
+            while tasks:
+                await ready.wait()
+                ready.clear()
+                results: list[tuple[int, SHVType | RpcError]] = []
+                while finished:
+                    task = finished.popleft()
+                    i = tasks.pop(task)
+                    try:
+                        results.append((i, task.result()))
+                    except RpcError as exc:
+                        results.append((i, exc))
+                fill()
+                for res in results:
+                    yield res
+        finally:
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.wait(tasks)
+
     async def ping(self) -> None:
         """Ping the peer to check the connection."""
         await self.call(
@@ -380,25 +470,46 @@ class SHVBase:
         empty bandwidth. Simply if there are no messages to be sent through
         :meth:`_send` then we can use :meth:`_idle_message` to generate idle
         messages.
+
+        All messages queued at the time are sent in a single batch (up to
+        :attr:`SEND_BATCH_MAX` messages) with :meth:`RpcClient.send_encoded`.
+        Every message is encoded on its own and thus message that can't be
+        encoded fails only its own send.
         """
         while True:
             await self.__send_semaphore.acquire()
-            if self.__send_queue:
+            msgs: list[RpcMessage] = []
+            parts: list[tuple[bytearray, bytes | bytearray | memoryview]] = []
+            futures: list[asyncio.Future] = []
+            while self.__send_queue and len(msgs) < self.SEND_BATCH_MAX:
                 msg, future = self.__send_queue.popleft()
-            else:
-                res = self._idle_message()
-                if res is None:
+                try:
+                    parts.append(self.client.encode(msg))
+                except Exception as exc:
+                    future.set_exception(exc)
                     continue
-                msg, future = res, None
+                msgs.append(msg)
+                futures.append(future)
+            while len(msgs) < self.SEND_BATCH_MAX and (
+                (res := self._idle_message()) is not None
+            ):
+                try:
+                    parts.append(self.client.encode(res))
+                except Exception as exc:
+                    logger.warning("Idle message encode failed", exc_info=exc)
+                    continue
+                msgs.append(res)
+            if not msgs:
+                continue
             try:
-                await self.client.send(msg)
+                await self.client.send_encoded(msgs, parts)
             except Exception as exc:
-                if future is None:
+                if not futures:
                     logger.warning("Idle send failed", exc_info=exc)
-                else:
+                for future in futures:
                     future.set_exception(exc)
             else:
-                if future is not None:
+                for future in futures:
                     future.set_result(None)
 
     async def _send(self, msg: RpcMessage) -> None:
@@ -432,8 +543,10 @@ class SHVBase:
         at the moment. These are commonly messages not directly requested by
         other side such as signals or some of the delayed responses.
         """
-        for _, request in self._requests.values():
-            if request._progress_dirty:
+        while self._progress_dirty:
+            request = self._progress_dirty.popleft()
+            key = (request._msg.request_id, *request._msg.caller_ids)
+            if request._progress_dirty and key in self._requests:
                 request._progress_dirty = False
                 return request._msg.make_response_delay(request._progress)
         return None
@@ -442,11 +555,35 @@ class SHVBase:
         """Notify internal implementation that idle message could be generated."""
         self.__send_semaphore.release()
 
+    def _decode_body(self, msg: RpcMessage) -> bool:
+        """Decode body of the received message.
+
+        The body of the received message is decoded only once it is accessed
+        and this ensures that it is valid before message is handled.
+
+        :param msg: Received message.
+        :return: ``True`` if body is valid and ``False`` if message should be
+          dropped.
+        """
+        try:
+            _ = msg.value  # Decode the body received lazily as ChainPack
+        except ValueError as exc:
+            logger.info(
+                "%s: Dropped message with invalid body: %s",
+                self.client,
+                msg.meta,
+                exc_info=exc,
+            )
+            return False
+        return True
+
     async def _message(self, msg: RpcMessage) -> None:
         """Handle every received message.
 
         :param msg: Received message.
         """
+        if not self._decode_body(msg):
+            return
         match msg.type:
             case RpcMessage.Type.REQUEST:
                 key = (msg.request_id, *msg.caller_ids)
@@ -456,11 +593,11 @@ class SHVBase:
             case RpcMessage.Type.REQUEST_ABORT:
                 await self.__method_call(msg)
             case RpcMessage.Type.RESPONSE | RpcMessage.Type.RESPONSE_ERROR:
-                if (queue := self._responses.pop(msg.request_id, None)) is not None:
-                    await queue.put(msg)
+                if (pending := self._responses.pop(msg.request_id, None)) is not None:
+                    pending.put(msg)
             case RpcMessage.Type.RESPONSE_DELAY:
-                if (queue := self._responses.get(msg.request_id)) is not None:
-                    await queue.put(msg)
+                if (pending := self._responses.get(msg.request_id)) is not None:
+                    pending.put(msg)
             case RpcMessage.Type.SIGNAL:
                 await self._got_signal(self.Signal(msg))
 
@@ -693,6 +830,7 @@ class SHVBase:
             self._progress = value
             if not self._progress_dirty:
                 self._progress_dirty = True
+                self._shvbase._progress_dirty.append(self)
                 self._shvbase._idle_message_ready()
 
         def ri_match(self, ri: str) -> bool:
@@ -746,3 +884,113 @@ class SHVBase:
         def ri_match(self, ri: str) -> bool:
             """Check if signal matches given RI."""
             return rpcri_match(ri, self.path, self.source, self.signal)
+
+
+class _TimerWheel:
+    """Timeouts of multiple futures served by a single loop's timer.
+
+    Timeouts are rounded up to :attr:`resolution` and all futures with timeout
+    in the same slot expire together. This is cheaper than having a timer for
+    every single wait when there is a lot of them.
+
+    :param resolution: Resolution of timeouts in seconds.
+    """
+
+    def __init__(self, resolution: float = 0.01) -> None:
+        self.resolution = resolution
+        """Resolution of timeouts in seconds."""
+        self._slots: dict[int, set[asyncio.Future]] = {}
+        self._heap: list[int] = []
+        self._handle: asyncio.TimerHandle | None = None
+        self._handle_slot = 0
+
+    def add(self, future: asyncio.Future, timeout: float) -> int:
+        """Add timeout for the given future.
+
+        :param future: Future that gets :class:`TimeoutError` on timeout.
+        :param timeout: Timeout in seconds.
+        :return: Slot that needs to be passed to :meth:`remove`.
+        """
+        loop = future.get_loop()
+        slot = math.ceil((loop.time() + timeout) / self.resolution)
+        if (futures := self._slots.get(slot)) is None:
+            futures = self._slots[slot] = set()
+            heapq.heappush(self._heap, slot)
+            if self._handle is None or slot < self._handle_slot:
+                if self._handle is not None:
+                    self._handle.cancel()
+                self._schedule(loop, slot)
+        futures.add(future)
+        return slot
+
+    def remove(self, future: asyncio.Future, slot: int) -> None:
+        """Remove timeout for the given future.
+
+        :param future: Future timeout was added for.
+        :param slot: Slot returned by :meth:`add`.
+        """
+        if (futures := self._slots.get(slot)) is not None:
+            futures.discard(future)
+
+    def _schedule(self, loop: asyncio.AbstractEventLoop, slot: int) -> None:
+        self._handle = loop.call_at(slot * self.resolution, self._expire, loop)
+        self._handle_slot = slot
+
+    def _expire(self, loop: asyncio.AbstractEventLoop) -> None:
+        now = max(self._handle_slot, math.floor(loop.time() / self.resolution))
+        self._handle = None
+        while self._heap and self._heap[0] <= now:
+            for future in self._slots.pop(heapq.heappop(self._heap)):
+                if not future.done():
+                    future.set_exception(TimeoutError())
+        if self._heap:
+            self._schedule(loop, self._heap[0])
+
+
+class _PendingCall:
+    """Call waiting for the response messages.
+
+    The messages are passed directly to the waiting future. They are queued
+    only if they are received before the previous one was consumed.
+    """
+
+    __slots__ = ("future", "msgs")
+
+    def __init__(self) -> None:
+        self.future: asyncio.Future[RpcMessage | None] | None = None
+        self.msgs: collections.deque[RpcMessage | None] = collections.deque()
+
+    def put(self, msg: RpcMessage | None) -> None:
+        """Pass message to the call.
+
+        :param msg: Received message or ``None`` on communication reset.
+        """
+        if self.future is not None and not self.future.done():
+            self.future.set_result(msg)
+        else:
+            self.msgs.append(msg)
+
+    async def get(
+        self,
+        timers: _TimerWheel,
+        timeout: float,  # noqa ASYNC109
+    ) -> RpcMessage | None:
+        """Get the next message.
+
+        :param timers: Timer wheel used for timeout.
+        :param timeout: Timeout in seconds.
+        :return: Received message or ``None`` on communication reset.
+        :raise TimeoutError: when no message is received in time.
+        """
+        if self.msgs:
+            return self.msgs.popleft()
+        if timeout <= 0:
+            raise TimeoutError
+        future: asyncio.Future[RpcMessage | None]
+        future = self.future = asyncio.get_running_loop().create_future()
+        slot = timers.add(future, timeout)
+        try:
+            return await future
+        finally:
+            timers.remove(future, slot)
+            self.future = None
@@ -0,0 +1,161 @@
+"""Queue of messages to be sent with priority classes."""
+
+from __future__ import annotations
+
+import collections
+import collections.abc
+import enum
+import typing
+
+from ..rpcmessage import RpcMessage
+
+
+class RpcSendQueue:
+    """Bounded queue of messages to be sent with priority classes.
+
+    Messages are split to the priority classes based on their type. Every
+    class has its own bounded queue and its own policy of what should be
+    dropped when it is full. Messages are taken from the class with the
+    highest priority first and thus flood of signals can't delay responses.
+
+    Signals with name ending with ``chng`` can be coalesced. The new signal
+    replaces the one with the same path, signal name and source that is still
+    in the queue. The queue position of the original signal is preserved. Only
+    the latest value is thus delivered to the slow consumer but it is
+    delivered as soon as possible.
+
+    :param sizes: Maximum number of messages queued in every priority class
+      (``None`` for unbounded). Classes not specified use :attr:`SIZES`.
+    :param policies: Drop policies for priority classes. Classes not specified
+      use :attr:`DropPolicy.OLDEST`.
+    :param coalesce: If ``chng`` signals should be coalesced.
+    """
+
+    class Priority(enum.IntEnum):
+        """Priority class of the message (lower value is sent sooner)."""
+
+        RESPONSE = 0
+        """Responses and request aborts."""
+        REQUEST = 1
+        """Requests."""
+        SIGNAL = 2
+        """Signals."""
+
+    class DropPolicy(enum.Enum):
+        """Policy applied when queue of the priority class is full."""
+
+        OLDEST = enum.auto()
+        """Drop the oldest queued message to make space for the new one."""
+        NEWEST = enum.auto()
+        """Drop the new message."""
+
+    SIZES: typing.Final[collections.abc.Mapping[Priority, int | None]] = {
+        Priority.RESPONSE: None,
+        Priority.REQUEST: 64,
+        Priority.SIGNAL: 64,
+    }
+    """The default maximum numbers of queued messages.
+
+    Responses are never dropped in default. Their number is limited by number
+    of requests in flight anyway.
+    """
+
+    def __init__(
+        self,
+        sizes: collections.abc.Mapping[RpcSendQueue.Priority, int | None] | None = None,
+        policies: collections.abc.Mapping[
+            RpcSendQueue.Priority, RpcSendQueue.DropPolicy
+        ]
+        | None = None,
+        coalesce: bool = True,
+    ) -> None:
+        self._sizes = [
+            (sizes or {}).get(prio, self.SIZES[prio]) for prio in self.Priority
+        ]
+        self._policies = [
+            (policies or {}).get(prio, self.DropPolicy.OLDEST) for prio in self.Priority
+        ]
+        self._queues: list[collections.deque[list]] = [
+            collections.deque() for _ in self.Priority
+        ]
+        self._chng: dict[tuple[str, str, str], list] = {}
+        self.coalesce = coalesce
+        """If ``chng`` signals are coalesced."""
+        self.dropped: dict[RpcSendQueue.Priority, int] = dict.fromkeys(self.Priority, 0)
+        """Number of dropped messages for every priority class."""
+        self.coalesced = 0
+        """Number of signals that replaced the already queued ones."""
+        self.nbytes = 0
+        """Estimated number of bytes of all queued messages.
+
+        This is sum of :attr:`shv.rpcmessage.RpcMessage.raw_size` and thus only
+        messages that are forwarded without being decoded are counted.
+        """
+
+    @classmethod
+    def priority(cls, msg: RpcMessage) -> RpcSendQueue.Priority:
+        """Get priority class of the message.
+
+        :param msg: The message.
+        :return: Priority class the message belongs to.
+        """
+        match msg.type:
+            case RpcMessage.Type.REQUEST:
+                return cls.Priority.REQUEST
+            case RpcMessage.Type.SIGNAL:
+                return cls.Priority.SIGNAL
+        return cls.Priority.RESPONSE
+
+    def push(self, msg: RpcMessage) -> bool:
+        """Add message to the queue.
+
+        :param msg: Message to be queued.
+        :return: ``False`` if message was dropped right away and ``True``
+          otherwise.
+        """
+        prio = self.priority(msg)
+        key = None
+        if (
+            self.coalesce
+            and prio is self.Priority.SIGNAL
+            and msg.signal_name.endswith("chng")
+        ):
+            key = (msg.path, msg.signal_name, msg.source)
+            if (entry := self._chng.get(key)) is not None:
+                self.nbytes += msg.raw_size - entry[2]
+                entry[0] = msg
+                entry[2] = msg.raw_size
+                self.coalesced += 1
+                return True
+        queue = self._queues[prio]
+        if (size := self._sizes[prio]) is not None and len(queue) >= size:
+            self.dropped[prio] += 1
+            if self._policies[prio] is self.DropPolicy.NEWEST:
+                return False
+            self._forget(queue.popleft())
+        entry = [msg, key, msg.raw_size]
+        queue.append(entry)
+        self.nbytes += entry[2]
+        if key is not None:
+            self._chng[key] = entry
+        return True
+
+    def pop(self) -> RpcMessage | None:
+        """Take the message with the highest priority from the queue.
+
+        :return: Message or ``None`` if queue is empty.
+        """
+        for queue in self._queues:
+            if queue:
+                entry = queue.popleft()
+                self._forget(entry)
+                return typing.cast(RpcMessage, entry[0])
+        return None
+
+    def _forget(self, entry: list) -> None:
+        self.nbytes -= entry[2]
+        if entry[1] is not None and self._chng.get(entry[1]) is entry:
+            del self._chng[entry[1]]
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self._queues)
@@ -9,9 +9,10 @@ import logging
 import time
 import typing
 
-from ..rpcdef.errors import RpcMethodCallExceptionError, RpcMethodNotFoundError
+from ..path import PathTree
+from ..rpcdef.errors import RpcError
 from ..rpcri import rpcri_match
-from ..value import SHVMapType, SHVType, shvmeta, shvmeta_eq
+from ..value import SHVMapType, SHVType, is_shvmap, shvmeta, shvmeta_eq
 from .base import SHVBase
 from .client import SHVClient
 
@@ -27,14 +28,27 @@ class SHVValueClient(SHVClient, collections.abc.Mapping):
     from logs (logs fetching has to be performed explicitly) or with prop_get.
 
     To access subscribed value you can index this object with SHV path to it.
+
+    Every change of the cached value is stamped with a new :attr:`version` and
+    :meth:`changes` provides a way to get only values changed since some
+    version.
     """
 
+    SNAPSHOT_WINDOW: int = 8
+    """Maximum number of calls in flight performed by :meth:`get_snapshot`."""
+
     def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None:  # noqa ANNN401
         super().__init__(*args, **kwargs)  # notype
-        self._cache: dict[str, tuple[float, SHVType]] = {}
-        self._handlers: dict[
-            str, collections.abc.Callable[[SHVValueClient, str, SHVType], None]
-        ] = {}
+        self._cache: dict[str, tuple[float, SHVType, int]] = {}
+        self._version = 0
+        self._ls_cache: dict[str, list[str]] = {}
+        self._dir_cache: dict[str, bool] = {}
+        self._snapshots: set[str] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self._cache_tree: PathTree[str] = PathTree()
+        self._handlers: PathTree[
+            list[collections.abc.Callable[[SHVValueClient, str, SHVType], None]]
+        ] = PathTree()
         self._futures: dict[str, list[asyncio.Future]] = {}
 
     def __getitem__(self, key: str) -> SHVType:
@@ -53,32 +67,85 @@ class SHVValueClient(SHVClient, collections.abc.Mapping):
         """
         if signal.signal.endswith("chng") and signal.source == "get":
             await self._value_update(signal.path, signal.param)
+        elif signal.signal == "lsmod" and signal.source == "ls":
+            self._nodes_cache_clean(signal.path, signal.param)
 
     async def _value_update(self, path: str, value: SHVType) -> None:
         """Handle value change (``*chng`` signal associated with ``get`` method)."""
-        handler = self._get_handler(path)
-        if handler is not None and not shvmeta_eq(self.get(path, None), value):
-            handler(self, path, value)
+        handlers = self._get_handlers(path)
+        if handlers and not shvmeta_eq(self.get(path, None), value):
+            for handler in handlers:
+                handler(self, path, value)
         for future in self._futures.pop(path, []):
             future.set_result(value)
         if self.is_subscribed(path):
             # Theoretically we should get only paths we subscribed for but user might
             # invoke subscribe on its own which could break our cache logic and thus
             # just guard against it here.
-            self._cache[path] = (time.time(), value)
+            if (old := self._cache.get(path)) is not None and shvmeta_eq(old[1], value):
+                self._cache[path] = (time.time(), value, old[2])
+            else:
+                # The cache is kept sorted by version for changes
+                if self._cache.pop(path, None) is None:
+                    self._cache_tree.set(path, path)
+                self._version += 1
+                self._cache[path] = (time.time(), value, self._version)
+
+    @property
+    def version(self) -> int:
+        """Version of the latest change of the cached values.
+
+        The version is increased with every change of any cached value and thus
+        it can be used with :meth:`changes` to get only changed values.
+        """
+        return self._version
+
+    def changes(self, since: int = 0) -> collections.abc.Iterator[tuple[str, SHVType]]:
+        """Iterate over cached values changed after the given version.
 
-    def _get_handler(
+        This iterates only over changed values and not over all of them and
+        thus it is cheap even with a big cache. Be aware that removal from cache
+        is not reported.
+
+        .. code-block:: python
+
+            version = client.version
+            ...
+            for path, value in client.changes(version):
+                print(f"{path}: {value}")
+            version = client.version
+
+        :param since: The version values were changed after. This is commonly
+          the :attr:`version` from the previous call.
+        :return: Iterator over paths and values in order they were changed.
+        """
+        res = []
+        for path, (_, value, version) in reversed(self._cache.items()):
+            if version <= since:
+                break
+            res.append((path, value))
+        return reversed(res)
+
+    def _get_handlers(
         self, path: str
-    ) -> collections.abc.Callable[[SHVValueClient, str, SHVType], None] | None:
-        """Get the handler for the longest path match."""
-        split_key = path.split("/")
-        paths = (
-            "/".join(split_key[: len(split_key) - i]) for i in range(len(split_key) + 1)
-        )
-        return next(
-            (self._handlers[path] for path in paths if path in self._handlers),
-            None,
-        )
+    ) -> collections.abc.Sequence[
+        collections.abc.Callable[[SHVValueClient, str, SHVType], None]
+    ]:
+        """Get the handlers for the longest path match."""
+        return self._handlers.closest(path) or ()
+
+    def subtree(self, path: str = "") -> collections.abc.Iterator[tuple[str, SHVType]]:
+        """Iterate over cached values for the path and all paths bellow it.
+
+        Only the cached paths in the subtree are visited and thus this is cheap
+        even with a big cache. The order of the paths is not defined.
+
+        :param path: SHV path to the subtree. The empty path is for all cached
+          values.
+        :return: Iterator over paths and values.
+        """
+        for pth in self._cache_tree.values(path):
+            yield pth, self._cache[pth][1]
 
     async def prop_get(self, path: str, max_age: float = 0.0) -> SHVType:
         """Get value from the property associated with the node on given path.
@@ -175,6 +242,7 @@ class SHVValueClient(SHVClient, collections.abc.Mapping):
         self,
         path: str,
         callback: collections.abc.Callable[[SHVValueClient, str, SHVType], None] | None,
+        append: bool = False,
     ) -> None:
         """Register callback handler called when value change is reported.
 
@@ -183,21 +251,41 @@ class SHVValueClient(SHVClient, collections.abc.Mapping):
         the device if this signal is sent really only on value change or if it is sent
         more often.
 
-        The default implementation of handler lookup (:meth:`_get_handler`) is that the
-        most matching callback path is selected and callback for it called. This way you
-        can get all notifications delivered to a single handler if you use empty string
-        as the path.
+        The default implementation of handler lookup (:meth:`_get_handlers`) is that the
+        most matching callback path is selected and callbacks for it called. This way
+        you can get all notifications delivered to a single handler if you use empty
+        string as the path.
 
         :param path: SHV path to the node (includes its children) change is expected on.
         :param callback: Function called when change notification is received. You can
-            pass ``None`` to remove any existing callback. Note that there can be only
-            one callback registered for a single path and thus a different callback
-            replaces the previous one.
+            pass ``None`` to remove all existing callbacks for this path.
+        :param append: Add callback to the callbacks already registered for this path
+            instead of replacing them. Callbacks are called in order they were added.
         """
         if callback is None:
             self._handlers.pop(path)
+        elif append and (handlers := self._handlers.get(path)) is not None:
+            handlers.append(callback)
         else:
-            self._handlers[path] = callback
+            self._handlers.set(path, [callback])
+
+    def on_change_remove(
+        self,
+        path: str,
+        callback: collections.abc.Callable[[SHVValueClient, str, SHVType], None],
+    ) -> None:
+        """Remove a single callback handler registered with :meth:`on_change`.
+
+        :param path: SHV path callback was registered for.
+        :param callback: Function to be removed.
+        :raise ValueError: if callback is not registered for the path.
+        """
+        handlers = self._handlers.get(path)
+        if handlers is None:
+            raise ValueError(f"No callback registered for: {path}")
+        handlers.remove(callback)
+        if not handlers:
+            self._handlers.pop(path)
 
     async def wait_for_change(self, path: str) -> SHVType:
         """Provide a way to await for the future change signal.
@@ -213,6 +301,37 @@ class SHVValueClient(SHVClient, collections.abc.Mapping):
         self._futures[path].append(future)
         return await future
 
+    async def subscribe(self, ri: str, snapshot: bool = False) -> bool:
+        """Perform subscribe for signals on given path.
+
+        :param ri: SHV RPC RI for subscription to be added.
+        :param snapshot: Fetch all subscribed property values with
+          :meth:`get_snapshot` right after subscribe and on every reconnect.
+        """
+        res = await super().subscribe(ri)
+        if snapshot:
+            self._snapshots.add(ri)
+            await self.get_snapshot(_rpcri_root(ri))
+        return res
+
+    async def _post_login(self) -> None:
+        await super()._post_login()
+        self._ls_cache.clear()
+        self._dir_cache.clear()
+        if self._snapshots:
+            # Calls are postponed until login is finished and thus we can't wait
+            task = asyncio.create_task(self._restore_snapshots())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _restore_snapshots(self) -> None:
+        try:
+            await self.get_snapshot(
+                *(_rpcri_root(ri) for ri in self._snapshots), update=True
+            )
+        except (EOFError, RpcError) as exc:
+            logger.warning("%s: Snapshot failed: %s", self.client, exc)
+
     async def unsubscribe(self, sub: str, clean_cache: bool = True) -> bool:
         """Perform unsubscribe for signals on given path.
 
@@ -223,6 +342,7 @@ class SHVValueClient(SHVClient, collections.abc.Mapping):
         :return: ``True`` in case such subscribe was located and ``False`` otherwise.
         """
         res = await super().unsubscribe(sub)
+        self._snapshots.discard(sub)
         if res and clean_cache:
             self.clean_cache()
         return res
@@ -251,7 +371,9 @@ class SHVValueClient(SHVClient, collections.abc.Mapping):
         There is commonly no need to call this method unless you call
         :meth:`unsubscribe` with ``wipe_cache=False``.
         """
-        self._cache = {k: v for k, v in self._cache.items() if self.is_subscribed(k)}
+        for path in [k for k in self._cache if not self.is_subscribed(k)]:
+            del self._cache[path]
+            self._cache_tree.pop(path)
 
     async def log_snapshot(self, path: str) -> None:
         """Get snapshot of the logs.
@@ -287,24 +409,71 @@ class SHVValueClient(SHVClient, collections.abc.Mapping):
         """Get snapshot of data on subscribed paths using get methods.
 
         This provides a way for you to initialize cache without logs. It
-        iterates over SHV tree and calls any get method it encounters.
+        iterates over SHV tree and calls any get method it encounters. The SHV
+        tree is walked level by level and results of ``ls`` and ``dir`` are
+        cached for the subsequent snapshots until client is reconnected or
+        ``lsmod`` signal is received (subscribe for ``**:ls:lsmod`` to receive
+        it). Calls are performed with up to
+        :attr:`SNAPSHOT_WINDOW` calls in flight.
 
         :param paths: Paths to be snapshoted. If none is provide the
           subscriptions are used instead.
         :param update: If already cached values should be updated or just
           skipped.
         """
-        pths: list[str] = list(paths) if paths else [""]
-        # TODO we can skip paths that are outside of our subscriptions
-        while pths:
-            pth = pths.pop()
-            try:
-                pths.extend(
-                    f"{pth}{'/' if pth else ''}{name}" for name in await self.ls(pth)
-                )
-            except (RpcMethodNotFoundError, RpcMethodCallExceptionError):
-                pass  # ls might not be present which is not an issue
-            if not self.is_subscribed(pth) or (not update and pth in self._cache):
-                continue
-            if await self.dir_exists(pth, "get"):
-                self._cache[pth] = (time.time(), await self.prop_get(pth))
+        level = list(paths or (_rpcri_root(ri) for ri in self._subscribes))
+        getters: list[str] = []
+        while level:
+            calls: list[tuple[str, str, SHVType]] = [
+                (pth, "ls", None) for pth in level if pth not in self._ls_cache
+            ]
+            candidates = [
+                pth
+                for pth in level
+                if self.is_subscribed(pth) and (update or pth not in self._cache)
+            ]
+            calls.extend(
+                (pth, "dir", "get") for pth in candidates if pth not in self._dir_cache
+            )
+            async for i, res in self.call_many(calls, self.SNAPSHOT_WINDOW):
+                pth, method, _ = calls[i]
+                if method == "ls":
+                    self._ls_cache[pth] = (
+                        [v for v in res if isinstance(v, str)]
+                        if isinstance(res, collections.abc.Sequence)
+                        else []
+                    )
+                else:
+                    # Non-empty list or mapping is backward compatibility
+                    self._dir_cache[pth] = not isinstance(res, RpcError) and bool(res)
+            getters.extend(pth for pth in candidates if self._dir_cache[pth])
+            level = [
+                f"{pth}{'/' if pth else ''}{name}"
+                for pth in level
+                for name in self._ls_cache[pth]
+            ]
+        async for i, res in self.call_many(
+            ((pth, "get", None) for pth in getters), self.SNAPSHOT_WINDOW
+        ):
+            if not isinstance(res, RpcError):
+                await self._value_update(getters[i], res)
+
+    def _nodes_cache_clean(self, path: str, nodes: SHVType) -> None:
+        """Remove ``ls`` and ``dir`` cache for nodes reported by ``lsmod``."""
+        self._ls_cache.pop(path, None)
+        for node in nodes if is_shvmap(nodes) else ():
+            npath = f"{path}{'/' if path else ''}{node}"
+            prefix = f"{npath}/"
+            for cache in (self._ls_cache, self._dir_cache):
+                for pth in [p for p in cache if p == npath or p.startswith(prefix)]:
+                    del cache[pth]
+
+
+def _rpcri_root(ri: str) -> str:
+    """Get the path of the node that covers all paths RPC RI can match."""
+    res = []
+    for node in ri.partition(":")[0].split("/"):
+        if any(c in node for c in "*?["):
+            break
+        res.append(node)
+    return "/".join(res)
@@ -7,14 +7,17 @@ import enum
 import time
 import typing
 
-from .chainpack import ChainPackWriter
+from .chainpack import ChainPack, ChainPackBufferReader, ChainPackBufferWriter
 from .cpon import CponWriter
 from .path import SHVPath
 from .rpcdef.access import RpcAccess
 from .rpcdef.errors import RpcError, RpcErrorCode
 from .value import (
     SHVIMap,
+    SHVMeta,
+    SHVMetaType,
     SHVType,
+    SHVUInt,
     is_shvlist,
     shvmeta_eq,
 )
@@ -55,13 +58,114 @@ class RpcMessage:
     def __init__(self, rpc_val: SHVIMap | None = None) -> None:
         if rpc_val is None:
             rpc_val = SHVIMap()
-        self.value: SHVIMap = rpc_val
+        self._value: SHVIMap | None = rpc_val
+        self._meta: SHVMetaType = {}
+        self._body: bytes | bytearray | memoryview = b""
+        self._body_keys: tuple[int, ...] = ()
+        self._meta_raw: dict[
+            int | str, tuple[SHVType, bytes | bytearray | memoryview]
+        ] = {}
+
+    @classmethod
+    def from_chainpack(cls, data: bytes | bytearray | memoryview) -> RpcMessage:
+        """Create message from its ChainPack representation.
+
+        Only the meta of the message is decoded right away. The body (the
+        parameter, result or error) is kept as ChainPack and it is decoded only
+        once it is accessed. Messages that are only routed (which is the common
+        case for brokers) are thus never decoded completely and
+        :meth:`to_chainpack` copies the body as it is. The same applies to the
+        meta entries that were not modified (only the modified entries are
+        encoded again).
+
+        :param data: ChainPack data with the message.
+        :return: The new message instance.
+        :raise ValueError: when data do not contain valid ChainPack or IMap.
+        """
+        # Memoryview is used to not copy the data when they are sliced
+        reader = ChainPackBufferReader(memoryview(data))
+        meta: SHVMetaType = {}
+        meta_raw: dict[int | str, tuple[SHVType, bytes | bytearray | memoryview]] = {}
+        if reader.peek() == ChainPack.Schema.CP_MetaMap:
+            reader.pos += 1
+            while reader.peek() != ChainPack.Schema.CP_TERM:
+                start = reader.pos
+                key = reader.read()
+                if not isinstance(key, str | int) or isinstance(key, SHVUInt):
+                    raise ValueError(f"Invalid Meta key: {key!r}")
+                meta[key] = reader.read()
+                meta_raw[key] = (meta[key], reader.data[start : reader.pos])
+            reader.pos += 1
+        start = reader.pos
+        if reader.peek() != ChainPack.Schema.CP_IMap:
+            raise ValueError("RPC message must be IMap")
+        reader.pos += 1
+        keys = []
+        while reader.peek() != ChainPack.Schema.CP_TERM:
+            key = reader.read()
+            if not isinstance(key, int) or isinstance(key, SHVUInt):
+                raise ValueError(f"Invalid IMap key: {key!r}")
+            keys.append(key)
+            reader.skip()
+        reader.pos += 1
+        res = cls()
+        res._value = None
+        res._meta = meta
+        res._meta_raw = meta_raw
+        res._body = reader.data[start : reader.pos]
+        res._body_keys = tuple(keys)
+        return res
+
+    @property
+    def value(self) -> SHVIMap:
+        """The whole message as SHV value.
+
+        Be aware that access to this property decodes the body of the message
+        created with :meth:`from_chainpack` and thus it can raise
+        :exc:`ValueError` if body is not valid.
+        """
+        if self._value is None:
+            body = ChainPackBufferReader(self._body).read()
+            self._value = typing.cast(SHVIMap, SHVMeta.new(body, self._meta))
+            self._body = b""
+            self._meta_raw = {}
+        return self._value
+
+    @value.setter
+    def value(self, value: SHVIMap) -> None:
+        self._value = value
+        self._body = b""
+        self._meta_raw = {}
+
+    @property
+    def meta(self) -> SHVMetaType:
+        """Meta of the message.
+
+        This is the same as ``value.meta`` but it doesn't cause the body
+        decoding.
+        """
+        return self._meta if self._value is None else self._value.meta
+
+    @property
+    def raw_size(self) -> int:
+        """Size of the ChainPack data of the not yet decoded message body.
+
+        This is size of the body of the message created with
+        :meth:`from_chainpack` that is sent without being encoded again. It is
+        ``0`` if body was decoded. It can be used to estimate size of the
+        message without encoding it.
+        """
+        return len(self._body)
+
+    def _keys(self) -> collections.abc.Collection[int]:
+        """Keys of the body without the body decoding."""
+        return self._body_keys if self._value is None else self._value.keys()
 
     def __eq__(self, other: object) -> bool:
         return isinstance(other, RpcMessage) and shvmeta_eq(self.value, other.value)
 
     def __repr__(self) -> str:
-        return f"<RpcMessage {self.value.meta!r}: {self.value!r}>"
+        return f"<RpcMessage {self.meta!r}: {self.value!r}>"
 
     class Tag(enum.IntEnum):
         """Tags in Meta for RPC message."""
@@ -107,11 +211,11 @@ class RpcMessage:
     def is_valid(self) -> bool:
         """Check if message is valid RPC message."""
         return (
-            isinstance(self.value, SHVIMap)  # Must be IMap
-            and len(self.value) <= 1  # Only at most one Key is allowed
+            isinstance(self._value, SHVIMap | None)  # Must be IMap
+            and len(self._keys()) <= 1  # Only at most one Key is allowed
             and self.type is not None
-            and self.value.meta.get(self.Tag.META_TYPE_ID, 1) == 1
-            and self.value.meta.get(self.Tag.META_TYPE_NAMESPACE_ID, 0) == 0
+            and self.meta.get(self.Tag.META_TYPE_ID, 1) == 1
+            and self.meta.get(self.Tag.META_TYPE_NAMESPACE_ID, 0) == 0
             and isinstance(self._request_id, int | None)
             and isinstance(self._path, str)
             and isinstance(self._signal_name, str)  # Also covers method
@@ -133,19 +237,21 @@ class RpcMessage:
     @property
     def type(self) -> Type | None:
         """The message type or ``None`` if unknown."""
-        if self.Tag.REQUEST_ID in self.value.meta:
-            if self.Tag.METHOD in self.value.meta:
-                if self.Key.ABORT in self.value:
+        meta = self.meta
+        keys = self._keys()
+        if self.Tag.REQUEST_ID in meta:
+            if self.Tag.METHOD in meta:
+                if self.Key.ABORT in keys:
                     return self.Type.REQUEST_ABORT
-                if not self.value or self.Key.PARAM in self.value:
+                if not keys or self.Key.PARAM in keys:
                     return self.Type.REQUEST
-            elif self.Key.ERROR in self.value:
+            elif self.Key.ERROR in keys:
                 return self.Type.RESPONSE_ERROR
-            elif self.Key.DELAY in self.value:
+            elif self.Key.DELAY in keys:
                 return self.Type.RESPONSE_DELAY
-            elif not self.value or self.Key.RESULT in self.value:
+            elif not keys or self.Key.RESULT in keys:
                 return self.Type.RESPONSE
-        elif not self.value or self.Key.PARAM in self.value:
+        elif not keys or self.Key.PARAM in keys:
             return self.Type.SIGNAL
         return None
 
@@ -195,7 +301,7 @@ class RpcMessage:
 
     @property
     def _request_id(self) -> SHVType:
-        return self.value.meta.get(self.Tag.REQUEST_ID)
+        return self.meta.get(self.Tag.REQUEST_ID)
 
     @property
     def request_id(self) -> int:
@@ -209,9 +315,9 @@ class RpcMessage:
     def request_id(self, rqid: int | None) -> None:
         """Set given request identifier to this message."""
         if rqid is None:
-            self.value.meta.pop(self.Tag.REQUEST_ID, None)
+            self.meta.pop(self.Tag.REQUEST_ID, None)
         else:
-            self.value.meta[self.Tag.REQUEST_ID] = rqid
+            self.meta[self.Tag.REQUEST_ID] = rqid
 
     def new_request_id(self) -> int:
         """Set new request ID.
@@ -223,7 +329,7 @@ class RpcMessage:
 
     @property
     def _path(self) -> SHVType:
-        return self.value.meta.get(self.Tag.SHV_PATH, "")
+        return self.meta.get(self.Tag.SHV_PATH, "")
 
     @property
     def path(self) -> str:
@@ -237,9 +343,9 @@ class RpcMessage:
     def path(self, path: str) -> None:
         """Set given path as SHV path for this message."""
         if path:
-            self.value.meta[self.Tag.SHV_PATH] = path
+            self.meta[self.Tag.SHV_PATH] = path
         else:
-            self.value.meta.pop(self.Tag.SHV_PATH, None)
+            self.meta.pop(self.Tag.SHV_PATH, None)
 
     @property
     def shvpath(self) -> SHVPath:
@@ -254,7 +360,7 @@ class RpcMessage:
     @property
     def method(self) -> str:
         """SHV method name for this message."""
-        res = self.value.meta.get(self.Tag.METHOD)
+        res = self.meta.get(self.Tag.METHOD)
         if not isinstance(res, str):
             raise ValueError(f"Invalid Method type: {type(res)}")
         return res
@@ -263,13 +369,13 @@ class RpcMessage:
     def method(self, method: str) -> None:
         """Set SHV method name for this message."""
         if method:
-            self.value.meta[self.Tag.METHOD] = method
+            self.meta[self.Tag.METHOD] = method
         else:
-            self.value.meta.pop(self.Tag.METHOD, None)
+            self.meta.pop(self.Tag.METHOD, None)
 
     @property
     def _signal_name(self) -> SHVType:
-        return self.value.meta.get(self.Tag.METHOD, "chng")
+        return self.meta.get(self.Tag.METHOD, "chng")
 
     @property
     def signal_name(self) -> str:
@@ -284,11 +390,11 @@ class RpcMessage:
         """Set SHV signal name for this message."""
         # Note: we always set it because old implementations were dropping
         # messages without method name.
-        self.value.meta[self.Tag.SIGNAL] = signal
+        self.meta[self.Tag.SIGNAL] = signal
 
     @property
     def _source(self) -> SHVType:
-        return self.value.meta.get(self.Tag.SOURCE, "get")
+        return self.meta.get(self.Tag.SOURCE, "get")
 
     @property
     def source(self) -> str:
@@ -302,13 +408,13 @@ class RpcMessage:
     def source(self, source: str) -> None:
         """Set SHV signal source method name for this message."""
         if source and source != "get":
-            self.value.meta[self.Tag.SOURCE] = source
+            self.meta[self.Tag.SOURCE] = source
         else:
-            self.value.meta.pop(self.Tag.SOURCE, None)
+            self.meta.pop(self.Tag.SOURCE, None)
 
     @property
     def _caller_ids(self) -> SHVType:
-        return self.value.meta.get(self.Tag.CALLER_IDS, None)
+        return self.meta.get(self.Tag.CALLER_IDS, None)
 
     @property
     def caller_ids(self) -> collections.abc.Sequence[int]:
@@ -327,15 +433,15 @@ class RpcMessage:
     def caller_ids(self, cids: collections.abc.Sequence[int]) -> None:
         """Set caller identifiers associated with this message."""
         if not cids:
-            self.value.meta.pop(self.Tag.CALLER_IDS, None)
+            self.meta.pop(self.Tag.CALLER_IDS, None)
         elif len(cids) == 1:
-            self.value.meta[self.Tag.CALLER_IDS] = cids[0]
+            self.meta[self.Tag.CALLER_IDS] = cids[0]
         else:
-            self.value.meta[self.Tag.CALLER_IDS] = cids
+            self.meta[self.Tag.CALLER_IDS] = cids
 
     @property
     def _access(self) -> SHVType:
-        return self.value.meta.get(self.Tag.ACCESS, "")
+        return self.meta.get(self.Tag.ACCESS, "")
 
     @property
     def access(self) -> collections.abc.Sequence[str]:
@@ -351,13 +457,13 @@ class RpcMessage:
     def access(self, access: collections.abc.Sequence[str]) -> None:
         """Set granted access sequence."""
         if access:
-            self.value.meta[self.Tag.ACCESS] = ",".join(access)
+            self.meta[self.Tag.ACCESS] = ",".join(access)
         else:
-            self.value.meta.pop(self.Tag.ACCESS, None)
+            self.meta.pop(self.Tag.ACCESS, None)
 
     @property
     def _access_level(self) -> SHVType:
-        return self.value.meta.get(self.Tag.ACCESS_LEVEL)
+        return self.meta.get(self.Tag.ACCESS_LEVEL)
 
     @property
     def rpc_access(self) -> RpcAccess | None:
@@ -376,14 +482,14 @@ class RpcMessage:
     def rpc_access(self, access: RpcAccess | None) -> None:
         """Set access level with :class:`shv.rpcdef.RpcAccess`."""
         if access is not None:
-            self.value.meta[self.Tag.ACCESS] = RpcAccess.tostr(access)
-            self.value.meta[self.Tag.ACCESS_LEVEL] = access.value
+            self.meta[self.Tag.ACCESS] = RpcAccess.tostr(access)
+            self.meta[self.Tag.ACCESS_LEVEL] = access.value
         else:
-            self.value.meta.pop(self.Tag.ACCESS, None)
+            self.meta.pop(self.Tag.ACCESS, None)
 
     @property
     def _user_id(self) -> SHVType:
-        res = self.value.meta.get(self.Tag.USER_ID, None)
+        res = self.meta.get(self.Tag.USER_ID, None)
         if isinstance(res, dict):  # Note: backward compatibility
             res = f"{res.get('brokerId')}:{res.get('shvUser')}"
         return res
@@ -400,13 +506,13 @@ class RpcMessage:
     def user_id(self, value: str | None) -> None:
         """Set User's ID."""
         if value is not None:
-            self.value.meta[self.Tag.USER_ID] = value
+            self.meta[self.Tag.USER_ID] = value
         else:
-            self.value.meta.pop(self.Tag.USER_ID, None)
+            self.meta.pop(self.Tag.USER_ID, None)
 
     @property
     def _repeat(self) -> SHVType:
-        return self.value.meta.get(self.Tag.REPEAT, False)
+        return self.meta.get(self.Tag.REPEAT, False)
 
     @property
     def repeat(self) -> bool:
@@ -420,9 +526,9 @@ class RpcMessage:
     def repeat(self, value: bool | None) -> None:
         """Set repeat."""
         if value is not None:
-            self.value.meta[self.Tag.REPEAT] = value
+            self.meta[self.Tag.REPEAT] = value
         else:
-            self.value.meta.pop(self.Tag.REPEAT, None)
+            self.meta.pop(self.Tag.REPEAT, None)
 
     @property
     def param(self) -> SHVType:
@@ -514,7 +620,52 @@ class RpcMessage:
 
     def to_chainpack(self) -> bytes:
         """Convert message to Chainpack."""
-        return ChainPackWriter.pack(self.value)
+        writer = ChainPackBufferWriter()
+        self.write_chainpack(writer)
+        return bytes(writer.buffer)
+
+    def write_chainpack(self, writer: ChainPackBufferWriter) -> None:
+        """Write message in Chainpack to the given writer.
+
+        Compared to :meth:`to_chainpack` this allows message to be appended to
+        the existing buffer. The not yet decoded body of the message created
+        with :meth:`from_chainpack` is copied without being decoded.
+
+        :param writer: ChainPack writer used to write the message.
+        """
+        writer.buffer += self.write_chainpack_head(writer)
+
+    def write_chainpack_head(
+        self, writer: ChainPackBufferWriter
+    ) -> bytes | bytearray | memoryview:
+        """Write message in Chainpack to the given writer except its raw body.
+
+        This is variant of :meth:`write_chainpack` that doesn't copy the not
+        yet decoded body of the message created with :meth:`from_chainpack`.
+        The body is instead returned and it is up to the caller to send it
+        right after the data written to the writer. This allows transport
+        layer to forward the body without copying it.
+
+        :param writer: ChainPack writer used to write the message.
+        :return: ChainPack data that must follow the data written to the
+          writer. This is empty if the message body was decoded.
+        """
+        if self._value is not None:
+            writer.write(self._value)
+            return b""
+        if self._meta:
+            buffer = writer.buffer
+            buffer.append(ChainPack.Schema.CP_MetaMap)
+            for key, value in self._meta.items():
+                raw = self._meta_raw.get(key)
+                # Only immutable values can be compared by identity
+                if raw is not None and raw[0] is value and isinstance(value, int | str):
+                    buffer += raw[1]
+                else:
+                    writer.write(key)
+                    writer.write(value)
+            buffer.append(ChainPack.Schema.CP_TERM)
+        return self._body
 
     @classmethod
     def request(
@@ -6,7 +6,10 @@ This is implemented according to the `SHV standard documentation
 
 from __future__ import annotations
 
+import collections.abc
 import fnmatch
+import functools
+import re
 
 from .value import SHVType
 
@@ -16,6 +19,9 @@ def rpcri_match(ri: str, path: str, method: str, signal: str | None = None) -> b
 
     This can use used to match method or signal against RI.
 
+    This uses :func:`rpcri_compile` and thus RI is parsed only on the first
+    use.
+
     :param ri: RPC RI that should be used to match method or signal.
     :param path: SHV Path that that RI should match.
     :param method: SHV RPC method name that RI should match.
@@ -25,22 +31,7 @@ def rpcri_match(ri: str, path: str, method: str, signal: str | None = None) -> b
     :return: ``True`` if RI matches the provided method or signal and ``False``
       otherwise.
     """
-    parts = ri.split(":")
-    match len(parts):
-        case 2:
-            return (
-                signal is None
-                and shvpath_match(parts[0], path)
-                and fnmatch.fnmatchcase(method, parts[1])
-            )
-        case 3:
-            return (
-                signal is not None
-                and shvpath_match(parts[0], path)
-                and fnmatch.fnmatchcase(method, parts[1])
-                and fnmatch.fnmatchcase(signal, parts[2])
-            )
-    return False
+    return rpcri_compile(ri).match(path, method, signal)
 
 
 def rpcri_relative_to(ri: str, path: str) -> str | None:
@@ -80,24 +71,53 @@ def rpcri_legacy_subscription(ri: str) -> SHVType:
     return res
 
 
-def __pth_match(path: str, pattern: list[str]) -> int | None:
+_NodeMatch = collections.abc.Callable[[str], object]
+"""Function that checks if node (or method or signal name) matches pattern."""
+
+
+def _is_pattern(pattern: str) -> bool:
+    return "*" in pattern or "?" in pattern or "[" in pattern
+
+
+def _node_match(pattern: str) -> _NodeMatch:
+    """Provide matcher for the single glob pattern.
+
+    The patterns without wildcards are compared as strings and the rest is
+    compiled to the regular expression (the same way :mod:`fnmatch` does it).
+    """
+    if _is_pattern(pattern):
+        return re.compile(fnmatch.translate(pattern)).match
+    return pattern.__eq__
+
+
+@functools.lru_cache(maxsize=4096)
+def _shvpath_compile(pattern: str) -> tuple[_NodeMatch | None, ...]:
+    """Compile path pattern to node matchers where ``None`` stands for ``**``."""
+    return tuple(
+        None if node == "**" else _node_match(node) for node in pattern.split("/")
+    )
+
+
+def _pth_match(
+    path: str, pattern: collections.abc.Sequence[_NodeMatch | None]
+) -> int | None:
     i = 0
     pth = path.split("/")
     for y, node in enumerate(pth):
         if i >= len(pattern):
             return None
-        if pattern[i] == "**":
+        if (ptn := pattern[i]) is None:
             if len(pattern) == i + 1:
                 return i + 1  # Matches everything so just return
-            if pattern[i + 1] == "**":
+            if (nptn := pattern[i + 1]) is None:
                 i += 1
-            elif fnmatch.fnmatchcase(node, pattern[i + 1]):
+            elif nptn(node):
                 i += 2
             continue
-        if not fnmatch.fnmatchcase(node, pattern[i]):
+        if not ptn(node):
             return None
         i += 1
-        if i < len(pattern) and pattern[i] == "**" and y == len(pth) - 1:
+        if i < len(pattern) and pattern[i] is None and y == len(pth) - 1:
             # Last node in path and next pattern is ** then match it.
             i += 1
     return i
@@ -110,8 +130,8 @@ def shvpath_match(pattern: str, path: str) -> bool:
     :param path: SHV Path.
     :return: ``True`` if the whole path matches the pattern and ``False`` otherwise.
     """
-    ptn = pattern.split("/")
-    res = __pth_match(path, ptn)
+    ptn = _shvpath_compile(pattern)
+    res = _pth_match(path, ptn)
     return res is not None and len(ptn) == res
 
 
@@ -125,10 +145,249 @@ def shvpath_tail(pattern: str, path: str) -> str | None:
     """
     if not path:  # Emptry string is root and everything is relative to the root
         return pattern
-    ptn = pattern.split("/")
-    res = __pth_match(path, ptn)
-    if len(ptn) == res and ptn[-1] == "**":
+    ptn = _shvpath_compile(pattern)
+    res = _pth_match(path, ptn)
+    if len(ptn) == res and ptn[-1] is None:
         res -= 1
     if res is None or len(ptn) == res:
         return None
-    return "/".join(ptn[res:])
+    return "/".join(pattern.split("/")[res:])
+
+
+class CompiledRpcRI:
+    """RPC RI prepared for the repeated matching.
+
+    The RI is split to its parts only once. Parts with wildcards are compiled
+    to regular expressions and the rest is compared as plain strings. Use
+    :func:`rpcri_compile` to get cached instance instead of creating a new
+    one.
+
+    :param ri: RPC RI to be compiled.
+    """
+
+    __slots__ = ("_method", "_path", "_signal", "ri")
+
+    def __init__(self, ri: str) -> None:
+        self.ri = ri
+        """The RPC RI this was compiled from."""
+        parts = ri.split(":")
+        self._path = _shvpath_compile(parts[0])
+        self._method = _node_match(parts[1]) if len(parts) in {2, 3} else None
+        self._signal = _node_match(parts[2]) if len(parts) == 3 else None
+
+    def __repr__(self) -> str:
+        return f"<CompiledRpcRI {self.ri!r}>"
+
+    def match(self, path: str, method: str, signal: str | None = None) -> bool:
+        """Check if given path or method matches this RPC RI.
+
+        The arguments are the same as for :func:`rpcri_match`.
+
+        :param path: SHV Path that that RI should match.
+        :param method: SHV RPC method name that RI should match.
+        :param signal: SHV RPC signal name that RI should match or ``None`` to
+          match method.
+        :return: ``True`` if RI matches the provided method or signal and
+          ``False`` otherwise.
+        """
+        if self._method is None or not self._method(method):
+            return False
+        if signal is None:
+            if self._signal is not None:
+                return False
+        elif self._signal is None or not self._signal(signal):
+            return False
+        return self.match_path(path)
+
+    def match_path(self, path: str) -> bool:
+        """Check if given path matches path pattern of this RPC RI.
+
+        :param path: SHV Path that that RI should match.
+        :return: ``True`` if path matches and ``False`` otherwise.
+        """
+        res = _pth_match(path, self._path)
+        return res is not None and len(self._path) == res
+
+
+@functools.lru_cache(maxsize=4096)
+def rpcri_compile(ri: str) -> CompiledRpcRI:
+    """Get the compiled RPC RI.
+
+    The compiled RIs are cached and thus repeated calls for the same RI are
+    cheap.
+
+    :param ri: RPC RI to be compiled.
+    :return: Compiled RPC RI.
+    """
+    return CompiledRpcRI(ri)
+
+
+class RpcRIIndex:
+    """Index of RPC RIs for signals that allows fast lookup of matching ones.
+
+    This is an alternative to calling :func:`rpcri_match` for every RI when
+    there is a lot of them. The RIs are stored in the tree based on their path
+    nodes and only the branches that can match the signal's path are visited.
+
+    RIs that are not for signals (they do not have three parts) are ignored
+    because they can't ever match a signal.
+    """
+
+    class _Node:
+        """Node in the tree for a single path node pattern."""
+
+        __slots__ = ("anydepth", "children", "loop", "match", "patterns", "ris")
+
+        def __init__(self, loop: bool = False, match: _NodeMatch | None = None) -> None:
+            self.loop = loop
+            """Node is for ``**`` and thus can match any number of nodes."""
+            self.match = match
+            """Matcher of the path node if this node is in parent's patterns."""
+            self.children: dict[str, RpcRIIndex._Node] = {}
+            """Children for the path nodes without wildcards."""
+            self.patterns: dict[str, RpcRIIndex._Node] = {}
+            """Children for the path nodes with wildcards except ``**``."""
+            self.anydepth: RpcRIIndex._Node | None = None
+            """Child for ``**``."""
+            self.ris: dict[
+                str, tuple[_NodeMatch, _NodeMatch, CompiledRpcRI | None]
+            ] = {}
+            """RIs ending in this node with method and signal matcher.
+
+            The last item is the compiled RI if its path contains ``**`` and
+            thus path needs to be checked with :meth:`CompiledRpcRI.match_path`.
+            """
+
+        def __bool__(self) -> bool:
+            return bool(self.children or self.patterns or self.anydepth or self.ris)
+
+    def __init__(self) -> None:
+        self._root = self._Node()
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    @staticmethod
+    def _parse(ri: str) -> tuple[list[str], str, str, bool] | None:
+        parts = ri.split(":")
+        if len(parts) != 3:
+            return None
+        path, method, signal = parts
+        return path.split("/"), method, signal, "**" in path
+
+    def add(self, ri: str) -> None:
+        """Add RI to the index.
+
+        :param ri: RPC RI to be added.
+        """
+        if (parsed := self._parse(ri)) is None:
+            return
+        nodes, method, signal, anydepth = parsed
+        node = self._root
+        for pnode in nodes:
+            if pnode == "**":
+                if node.anydepth is None:
+                    node.anydepth = self._Node(loop=True)
+                node = node.anydepth
+            else:
+                children = node.patterns if _is_pattern(pnode) else node.children
+                if (child := children.get(pnode)) is None:
+                    child = children[pnode] = self._Node(
+                        match=_node_match(pnode) if children is node.patterns else None
+                    )
+                node = child
+        if ri not in node.ris:
+            self._len += 1
+        node.ris[ri] = (
+            _node_match(method),
+            _node_match(signal),
+            rpcri_compile(ri) if anydepth else None,
+        )
+
+    def remove(self, ri: str) -> None:
+        """Remove RI from the index.
+
+        Nothing is done if RI is not in the index.
+
+        :param ri: RPC RI to be removed.
+        """
+        if (parsed := self._parse(ri)) is None:
+            return
+        trail: list[tuple[RpcRIIndex._Node, str]] = []
+        node: RpcRIIndex._Node | None = self._root
+        for pnode in parsed[0]:
+            assert node is not None
+            trail.append((node, pnode))
+            if pnode == "**":
+                node = node.anydepth
+            else:
+                children = node.patterns if _is_pattern(pnode) else node.children
+                node = children.get(pnode)
+            if node is None:
+                return
+        assert node is not None
+        if node.ris.pop(ri, None) is None:
+            return
+        self._len -= 1
+        # Remove no longer used nodes
+        for parent, pnode in reversed(trail):
+            if node:
+                break
+            if pnode == "**":
+                parent.anydepth = None
+            else:
+                children = parent.patterns if _is_pattern(pnode) else parent.children
+                del children[pnode]
+            node = parent
+
+    def match(
+        self, path: str, method: str, signal: str
+    ) -> collections.abc.Iterator[str]:
+        """Iterate over RIs that match the given signal.
+
+        The result is the same as if :func:`rpcri_match` would be called for
+        every RI in the index.
+
+        :param path: SHV path of the signal.
+        :param method: SHV RPC method name of the signal (its source).
+        :param signal: SHV RPC signal name.
+        :return: Iterator over matching RIs.
+        """
+        nodes = self._closure((self._root,))
+        for pnode in path.split("/"):
+            nnodes: list[RpcRIIndex._Node] = []
+            for node in nodes:
+                if node.loop:
+                    nnodes.append(node)
+                if (child := node.children.get(pnode)) is not None:
+                    nnodes.append(child)
+                nnodes.extend(
+                    child
+                    for child in node.patterns.values()
+                    if child.match is not None and child.match(pnode)
+                )
+            if not nnodes:
+                return
+            nodes = self._closure(nnodes)
+        for node in nodes:
+            for ri, (mmatch, smatch, cri) in node.ris.items():
+                if (
+                    mmatch(method)
+                    and smatch(signal)
+                    and (cri is None or cri.match_path(path))
+                ):
+                    yield ri
+
+    @staticmethod
+    def _closure(
+        nodes: collections.abc.Iterable[RpcRIIndex._Node],
+    ) -> list[RpcRIIndex._Node]:
+        """Add nodes reachable over ``**`` matching no path node at all."""
+        res: dict[int, RpcRIIndex._Node] = {}
+        for node in nodes:
+            nnode: RpcRIIndex._Node | None = node
+            while nnode is not None and id(nnode) not in res:
+                res[id(nnode)] = nnode
+                nnode = nnode.anydepth
+        return list(res.values())
@@ -9,9 +9,19 @@ from .stream import (
     RpcProtocolSerialCRC,
     RpcTransportProtocol,
 )
-from .tcp import RpcClientTCP, RpcServerTCP
+from .tcp import (
+    RpcClientTCP,
+    RpcClientTCPBuffered,
+    RpcServerTCP,
+    RpcServerTCPBuffered,
+)
 from .tty import RpcClientTTY, RpcServerTTY
-from .unix import RpcClientUnix, RpcServerUnix
+from .unix import (
+    RpcClientUnix,
+    RpcClientUnixBuffered,
+    RpcServerUnix,
+    RpcServerUnixBuffered,
+)
 from .url import connect_rpc_client, create_rpc_server, init_rpc_client
 from .ws import RpcClientWebSockets, RpcServerWebSockets, RpcServerWebSocketsUnix
 
@@ -21,8 +31,10 @@ __all__ = [
     "RpcClientCAN",
     "RpcClientPipe",
     "RpcClientTCP",
+    "RpcClientTCPBuffered",
     "RpcClientTTY",
     "RpcClientUnix",
+    "RpcClientUnixBuffered",
     "RpcClientWebSockets",
     "RpcProtocolBlock",
     "RpcProtocolSerial",
@@ -30,8 +42,10 @@ __all__ = [
     "RpcServer",
     "RpcServerCAN",
     "RpcServerTCP",
+    "RpcServerTCPBuffered",
     "RpcServerTTY",
     "RpcServerUnix",
+    "RpcServerUnixBuffered",
     "RpcServerWebSockets",
     "RpcServerWebSocketsUnix",
     "RpcTransportProtocol",
@@ -1,15 +1,14 @@
 """Common base for RPC clients and servers."""
 
 import abc
+import collections.abc
 import enum
 import logging
 import time
 import typing
 
-from ..chainpack import ChainPack
-from ..cpon import CponWriter
+from ..chainpack import ChainPack, ChainPackBufferWriter
 from ..rpcmessage import RpcMessage
-from ..value import SHVIMap
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +32,12 @@ class RpcClient(abc.ABC):
 
         The initial value is time of the RpcClient creation.
         """
+        self.send_batches = 0
+        """Number of batches sent so far (non-empty :meth:`send_encoded` calls)."""
+        self.send_messages = 0
+        """Number of messages sent in all batches so far."""
+        self.send_batch_max = 0
+        """The biggest number of messages sent in a single batch so far."""
 
     @classmethod
     async def connect(cls, *args: typing.Any, **kwargs: typing.Any) -> typing.Self:  # noqa ANN401
@@ -60,15 +65,100 @@ class RpcClient(abc.ABC):
         :param msg: Message to be sent
         :raise EOFError: when client is not connected.
         """
-        await self._send(bytearray((ChainPack.ProtocolType,)) + msg.to_chainpack())
+        await self.send_many((msg,))
+
+    async def send_many(self, msgs: collections.abc.Sequence[RpcMessage]) -> None:
+        """Send multiple SHV RPC Messages as a single batch.
+
+        Messages are still sent one by one as separate messages but transport
+        can combine them to a single write operation.
+
+        :param msgs: Messages to be sent
+        :raise EOFError: when client is not connected.
+        """
+        await self.send_encoded(msgs, [self.encode(msg) for msg in msgs])
+
+    @staticmethod
+    def encode(msg: RpcMessage) -> tuple[bytearray, bytes | bytearray | memoryview]:
+        """Encode SHV RPC Message to be sent with :meth:`send_encoded`.
+
+        :param msg: Message to be encoded.
+        :return: Message encoded in two parts (the second one is the body of the
+          received message that is sent without copying it).
+        :raise ValueError: when message can't be encoded.
+        """
+        writer = ChainPackBufferWriter(bytearray((ChainPack.ProtocolType,)))
+        return writer.buffer, msg.write_chainpack_head(writer)
+
+    async def send_encoded(
+        self,
+        msgs: collections.abc.Sequence[RpcMessage],
+        parts: collections.abc.Sequence[
+            tuple[bytearray, bytes | bytearray | memoryview]
+        ],
+    ) -> None:
+        """Send multiple SHV RPC Messages encoded with :meth:`encode` as a batch.
+
+        This allows encoding of every message separately and thus message that
+        can't be encoded doesn't affect the rest of the batch.
+
+        :param msgs: Messages to be sent
+        :param parts: Encoded messages in the same order as ``msgs``.
+        :raise EOFError: when client is not connected.
+        """
+        if not msgs:
+            return
+        await self._send_many(parts)
         self.last_send = time.monotonic()
+        self.send_batches += 1
+        self.send_messages += len(msgs)
+        self.send_batch_max = max(self.send_batch_max, len(msgs))
         if logger.isEnabledFor(logging.DEBUG):
-            logger.debug("%s => %s", self, msg.to_string())
+            for msg in msgs:
+                logger.debug("%s => %s", self, msg.to_string())
+
+    @property
+    def send_batch_mean(self) -> float:
+        """Average number of messages sent in a single batch."""
+        return self.send_messages / self.send_batches if self.send_batches else 0.0
 
     @abc.abstractmethod
     async def _send(self, msg: bytes) -> None:
         """Child's implementation of message sending."""
 
+    async def _send_parts(
+        self, head: bytearray, body: bytes | bytearray | memoryview
+    ) -> None:
+        """Child's implementation of message sending with message in two parts.
+
+        This is used to send received messages without copying their body.
+        The default implementation joins parts and calls :meth:`_send`.
+
+        :param head: The first part of the message.
+        :param body: The rest of the message.
+        """
+        await self._send(b"".join((head, body)))
+
+    async def _send_many(
+        self,
+        msgs: collections.abc.Sequence[
+            tuple[bytearray, bytes | bytearray | memoryview]
+        ],
+    ) -> None:
+        """Child's implementation of batch sending.
+
+        The default implementation sends messages one by one with
+        :meth:`_send_parts` or :meth:`_send` if there is no body.
+
+        :param msgs: Sequence of messages in two parts, as they are passed to
+          :meth:`_send_parts`.
+        """
+        for head, body in msgs:
+            if body:
+                await self._send_parts(head, body)
+            else:
+                await self._send(bytes(head))
+
     async def receive(self) -> RpcMessage | Control:
         """Read next received RPC message or wait for next to be received.
 
@@ -82,20 +172,15 @@ class RpcClient(abc.ABC):
             if len(data) > 1:
                 if data[0] == ChainPack.ProtocolType:
                     try:
-                        shvdata = ChainPack.unpack(data[1:])
+                        msg = RpcMessage.from_chainpack(memoryview(data)[1:])
                     except ValueError as exc:
                         logger.debug("<= Invalid ChainPack", exc_info=exc)
                     else:
-                        if isinstance(shvdata, SHVIMap):
-                            if (msg := RpcMessage(shvdata)).is_valid():
-                                if logger.isEnabledFor(logging.DEBUG):
-                                    logger.debug("%s <= %s", self, msg.to_string())
-                                return msg
-                        if logger.isEnabledFor(logging.DEBUG):
-                            logger.debug(
-                                "<= Invalid RPC message: %s",
-                                CponWriter.pack(shvdata).decode("UTF-8"),
-                            )
+                        if msg.is_valid():
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug("%s <= %s", self, msg.to_string())
+                            return msg
+                        logger.debug("<= Invalid RPC message: %r", msg.meta)
             elif len(data) == 1 and data[0] == 0:
                 logger.debug("%s <= Control message RESET", self)
                 return self.Control.RESET
@@ -0,0 +1,408 @@
+"""Common base for clients based on :class:`asyncio.BufferedProtocol`."""
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import collections.abc
+import logging
+import typing
+import weakref
+
+from .abc import RpcClient, RpcServer
+from .stream import RpcProtocolBlock, RpcTransportProtocol
+
+logger = logging.getLogger(__name__)
+
+
+class RpcStreamProtocol(asyncio.BufferedProtocol):
+    """Asyncio protocol splitting received data to SHV RPC messages.
+
+    This is an alternative to the Asyncio streams used by
+    :class:`shv.rpctransport.stream.RpcClientStream`. The data are received
+    directly to the reusable buffer and complete messages are split from them
+    right in :meth:`buffer_updated` without any coroutine being involved.
+    Messages are sent directly with the transport and drain is awaited only
+    if transport paused writing. Reading is paused once there is more than
+    :attr:`RECEIVE_HIGH_WATER` bytes of received messages queued and resumed
+    once they are all received with :meth:`receive`.
+
+    :param protocol: Stream communication protocol. It must implement
+      :meth:`RpcTransportProtocol.decode`.
+    :param connection_made_cb: Function called when connection is made.
+    :raise ValueError: If protocol doesn't support decode.
+    """
+
+    BUFFER_SIZE: int = 1 << 16
+    """Size of the buffer data are received to."""
+    RECEIVE_HIGH_WATER: int = 1 << 18
+    """Number of bytes in queued received messages when reading is paused."""
+
+    def __init__(
+        self,
+        protocol: type[RpcTransportProtocol] = RpcProtocolBlock,
+        connection_made_cb: collections.abc.Callable[[RpcStreamProtocol], None]
+        | None = None,
+    ) -> None:
+        if protocol.decode(b"") is None:
+            raise ValueError(f"Decode not supported by {protocol.__name__}")
+        self.protocol = protocol
+        """Stream communication protocol."""
+        self.transport: asyncio.Transport | None = None
+        """The transport for this protocol."""
+        self._connection_made_cb = connection_made_cb
+        self._loop = asyncio.get_running_loop()
+        self._rbuf = memoryview(bytearray(self.BUFFER_SIZE))
+        self._data = bytearray()
+        self._msgs: collections.deque[bytes] = collections.deque()
+        self._msgs_size = 0
+        self._reading_paused = False
+        self._eof = False
+        self._waiter: asyncio.Future[None] | None = None
+        self._paused = False
+        self._drain_waiters: collections.deque[asyncio.Future[None]] = (
+            collections.deque()
+        )
+        self._closed: asyncio.Future[None] = self._loop.create_future()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:  # noqa: D102
+        self.transport = typing.cast(asyncio.Transport, transport)
+        if self._connection_made_cb is not None:
+            self._connection_made_cb(self)
+
+    def get_buffer(self, sizehint: int) -> memoryview:  # noqa: D102
+        return self._rbuf
+
+    def buffer_updated(self, nbytes: int) -> None:  # noqa: D102
+        if self._data:
+            self._data += self._rbuf[:nbytes]
+            res = self.protocol.decode(self._data)
+            assert res is not None
+            msgs, size = res
+            del self._data[:size]
+        else:
+            # Decode directly from the buffer and keep only the incomplete tail
+            with self._rbuf[:nbytes] as data:
+                res = self.protocol.decode(data)
+                assert res is not None
+                msgs, size = res
+                self._data += data[size:]
+        if msgs:
+            self._msgs.extend(msgs)
+            self._msgs_size += sum(len(msg) for msg in msgs)
+            self._wakeup()
+            if (
+                self._msgs_size > self.RECEIVE_HIGH_WATER
+                and not self._reading_paused
+                and self.transport is not None
+                and not self.transport.is_closing()
+            ):
+                self._reading_paused = True
+                self.transport.pause_reading()
+
+    def eof_received(self) -> bool:  # noqa: D102
+        self._eof = True
+        self._wakeup()
+        return False
+
+    def connection_lost(self, exc: Exception | None) -> None:  # noqa: D102
+        self._eof = True
+        self._wakeup()
+        while self._drain_waiters:
+            if not (waiter := self._drain_waiters.popleft()).done():
+                waiter.set_exception(ConnectionResetError("Connection lost"))
+        if not self._closed.done():
+            self._closed.set_result(None)
+
+    def pause_writing(self) -> None:  # noqa: D102
+        self._paused = True
+
+    def resume_writing(self) -> None:  # noqa: D102
+        self._paused = False
+        while self._drain_waiters:
+            if not (waiter := self._drain_waiters.popleft()).done():
+                waiter.set_result(None)
+
+    def _wakeup(self) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    async def _drain(self) -> None:
+        if self.transport is None or self.transport.is_closing():
+            raise EOFError("Not connected")
+        if self._paused:
+            waiter = self._loop.create_future()
+            self._drain_waiters.append(waiter)
+            try:
+                await waiter
+            except ConnectionError as exc:
+                raise EOFError from exc
+
+    async def receive(self) -> bytes:
+        """Receive the next message.
+
+        :return: Bytes of complete message.
+        :raise EOFError: when EOF is encountered.
+        """
+        while not self._msgs:
+            if self._eof:
+                raise EOFError
+            self._waiter = self._loop.create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        msg = self._msgs.popleft()
+        self._msgs_size -= len(msg)
+        if self._reading_paused and not self._msgs:
+            self._reading_paused = False
+            if self.transport is not None and not self.transport.is_closing():
+                self.transport.resume_reading()
+        return msg
+
+    async def send(self, msg: bytes) -> None:
+        """Send a single message.
+
+        :param msg: Bytes of a complete message to be sent.
+        :raise EOFError: when transport is closed.
+        """
+        await self._write([self.protocol.annotate(msg)])
+
+    async def send_many(
+        self,
+        msgs: collections.abc.Sequence[
+            tuple[bytearray, bytes | bytearray | memoryview]
+        ],
+    ) -> None:
+        """Send multiple messages in two parts with a single write.
+
+        :param msgs: Sequence of messages in two parts.
+        :raise EOFError: when transport is closed.
+        """
+        await self._write([
+            b for head, body in msgs for b in self.protocol.annotate_parts(head, body)
+        ])
+
+    async def _write(self, data: list[bytes | bytearray | memoryview]) -> None:
+        if self.transport is None or self.transport.is_closing():
+            raise EOFError("Not connected")
+        # The split write is required by TCP to detect disconnect (see
+        # RpcTransportProtocol.asyncio_send).
+        self.transport.write(data[0][0:1])
+        data[0] = data[0][1:]
+        self.transport.writelines(data)
+        await self._drain()
+
+    @property
+    def closing(self) -> bool:
+        """If transport is closed or is being closed."""
+        return self.transport is None or self.transport.is_closing()
+
+    def close(self) -> None:
+        """Close the transport."""
+        if self.transport is not None:
+            self.transport.close()
+
+    async def wait_closed(self) -> None:
+        """Wait for the connection being lost."""
+        if self.transport is not None:
+            await self._closed
+
+
+class RpcClientBuffered(RpcClient):
+    """RPC connection to some SHV peer over :class:`RpcStreamProtocol`."""
+
+    def __init__(self, protocol: type[RpcTransportProtocol] = RpcProtocolBlock) -> None:
+        super().__init__()
+        self._stream: RpcStreamProtocol | None = None
+        self.protocol = protocol
+        """Stream communication protocol."""
+
+    async def _send(self, msg: bytes) -> None:
+        if self._stream is None:
+            raise EOFError("Not connected")
+        await self._stream.send(msg)
+
+    async def _send_many(
+        self,
+        msgs: collections.abc.Sequence[
+            tuple[bytearray, bytes | bytearray | memoryview]
+        ],
+    ) -> None:
+        if self._stream is None:
+            raise EOFError("Not connected")
+        await self._stream.send_many(msgs)
+
+    async def _receive(self) -> bytes:
+        if self._stream is None:
+            raise EOFError("Not connected")
+        try:
+            return await self._stream.receive()
+        except EOFError:
+            self._stream.close()
+            raise
+
+    async def reset(self) -> None:
+        """Reset or establish the connection.
+
+        This method not only resets the existing connection but primarilly
+        estableshes the new one.
+        """
+        if not self.connected:
+            self._stream = await self._open_connection()
+            logger.debug("%s: Connected", self)
+        else:
+            await super().reset()
+
+    @abc.abstractmethod
+    async def _open_connection(self) -> RpcStreamProtocol:
+        pass
+
+    def _protocol_factory(self) -> RpcStreamProtocol:
+        return RpcStreamProtocol(self.protocol)
+
+    @property
+    def connected(self) -> bool:
+        """Check if client is still connected."""
+        return self._stream is not None and not self._stream.closing
+
+    def _disconnect(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+
+    async def wait_disconnect(self) -> None:
+        """Wait for the client's disconnection."""
+        if self._stream is not None:
+            await self._stream.wait_closed()
+
+
+class RpcServerBuffered(RpcServer):
+    """RPC server listenting for SHV connections with :class:`RpcStreamProtocol`."""
+
+    def __init__(
+        self,
+        client_connected_cb: collections.abc.Callable[
+            [RpcClient], collections.abc.Awaitable[None] | None
+        ],
+        protocol: type[RpcTransportProtocol] = RpcProtocolBlock,
+    ) -> None:
+        self.client_connected_cb = client_connected_cb
+        """Callbact that is called when new client is connected."""
+        self.protocol = protocol
+        """Stream communication protocol."""
+        self._server: asyncio.Server | None = None
+        self._clients: weakref.WeakSet[RpcServerBuffered.Client] = weakref.WeakSet()
+        self._tasks: set[asyncio.Task] = set()
+
+    @abc.abstractmethod
+    async def _create_server(self) -> asyncio.Server:
+        """Create the server instance."""
+
+    def _protocol_factory(self) -> RpcStreamProtocol:
+        return RpcStreamProtocol(self.protocol, self._client_connect)
+
+    def is_serving(self) -> bool:
+        """Check if server is accepting new SHV connections."""
+        return self._server is not None and self._server.is_serving()
+
+    async def listen(self) -> None:
+        """Start accepting new SHV connections."""
+        if self._server is None:
+            self._server = await self._create_server()
+        if not self._server.is_serving():
+            await self._server.start_serving()
+            logger.debug("%s: Listening for clients", self)
+
+    async def listen_forever(self) -> None:
+        """Listen and block the calling coroutine until cancelation."""
+        if self._server is None:
+            self._server = await self._create_server()
+        await self._server.serve_forever()
+
+    def _client_connect(self, stream: RpcStreamProtocol) -> None:
+        client = self.Client(stream, self)
+        logger.debug("%s: New client %s", self, client)
+        self._clients.add(client)
+        res = self.client_connected_cb(client)
+        if isinstance(res, collections.abc.Awaitable):
+            task = asyncio.ensure_future(res)
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def close(self) -> None:  # noqa D102
+        if self.is_serving():
+            logger.debug("%s: No longer listening for clients", self)
+        if self._server is not None:
+            self._server.close()
+
+    async def wait_closed(self) -> None:  # noqa D102
+        if self._server is not None:
+            await self._server.wait_closed()
+
+    def terminate(self) -> None:  # noqa D102
+        self.close()
+        for client in self._clients:
+            client.disconnect()
+
+    async def wait_terminated(self) -> None:  # noqa D102
+        await self.wait_closed()
+        res = await asyncio.gather(
+            *(c.wait_disconnect() for c in self._clients),
+            return_exceptions=True,
+        )
+        excs = [v for v in res if isinstance(v, BaseException)]
+        if excs:
+            if len(excs) == 1:
+                raise excs[0]
+            raise BaseExceptionGroup("", excs)
+
+    class Client(RpcClient):
+        """RPC client for Asyncio's protocol server connection."""
+
+        def __init__(
+            self, stream: RpcStreamProtocol, server: RpcServerBuffered
+        ) -> None:
+            super().__init__()
+            self._stream = stream
+            self._server = server
+            self.protocol = server.protocol
+            """Stream communication protocol."""
+
+        @property
+        def server(self) -> RpcServerBuffered:
+            """Access to the associated server."""
+            return self._server
+
+        def _extra_info(self, name: str) -> typing.Any:  # noqa: ANN401
+            assert self._stream.transport is not None
+            return self._stream.transport.get_extra_info(name)
+
+        async def _send(self, msg: bytes) -> None:
+            await self._stream.send(msg)
+
+        async def _send_many(
+            self,
+            msgs: collections.abc.Sequence[
+                tuple[bytearray, bytes | bytearray | memoryview]
+            ],
+        ) -> None:
+            await self._stream.send_many(msgs)
+
+        async def _receive(self) -> bytes:
+            try:
+                return await self._stream.receive()
+            except EOFError:
+                self._stream.close()
+                raise
+
+        @property
+        def connected(self) -> bool:
+            """Check if client is still connected."""
+            return not self._stream.closing
+
+        def _disconnect(self) -> None:
+            self._stream.close()
+
+        async def wait_disconnect(self) -> None:
+            """Wait for the client's disconnection."""
+            await self._stream.wait_closed()
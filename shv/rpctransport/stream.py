@@ -11,7 +11,7 @@ import logging
 import typing
 import weakref
 
-from ..chainpack import ChainPack
+from ..chainpack import ChainPack, ChainPackBufferReader
 from .abc import RpcClient, RpcServer
 
 logger = logging.getLogger(__name__)
@@ -41,6 +41,57 @@ class RpcTransportProtocol(abc.ABC):
         writer.write(data[1:])
         await writer.drain()
 
+    @classmethod
+    def annotate_parts(
+        cls, head: bytearray, body: bytes | bytearray | memoryview
+    ) -> list[bytes | bytearray | memoryview]:
+        """Variation on :meth:`annotate` with message in two parts.
+
+        The default implementation joins parts. Protocols that do not need to
+        modify the message content should return the body as it is.
+
+        :param head: The first part of the message.
+        :param body: The rest of the message.
+        :return: List of bytes that concatenated form the annotated message.
+        """
+        return [cls.annotate(b"".join((head, body)))]
+
+    @classmethod
+    async def asyncio_send_parts(
+        cls,
+        writer: asyncio.StreamWriter,
+        head: bytearray,
+        body: bytes | bytearray | memoryview,
+    ) -> None:
+        """Variation on :meth:`asyncio_send` with message in two parts.
+
+        :param head: The first part of the message.
+        :param body: The rest of the message.
+        """
+        await cls.asyncio_send_many(writer, ((head, body),))
+
+    @classmethod
+    async def asyncio_send_many(
+        cls,
+        writer: asyncio.StreamWriter,
+        msgs: collections.abc.Sequence[
+            tuple[bytearray, bytes | bytearray | memoryview]
+        ],
+    ) -> None:
+        """Variation on :meth:`asyncio_send_parts` for multiple messages.
+
+        All messages are annotated and written together and drain is awaited
+        only once for all of them.
+
+        :param msgs: Sequence of messages in two parts.
+        """
+        data = [b for head, body in msgs for b in cls.annotate_parts(head, body)]
+        # The split write is required by TCP (see asyncio_send)
+        writer.write(data[0][0:1])
+        data[0] = data[0][1:]
+        writer.writelines(data)
+        await writer.drain()
+
     @classmethod
     @abc.abstractmethod
     async def receive(
@@ -65,6 +116,23 @@ class RpcTransportProtocol(abc.ABC):
 
         return await cls.receive(read)
 
+    @classmethod
+    def decode(
+        cls, data: bytes | bytearray | memoryview
+    ) -> tuple[list[bytes], int] | None:
+        """Split all complete messages from the received data.
+
+        This is an alternative to :meth:`receive` that allows reading of the
+        stream in chunks (see :class:`RpcStreamReader`). The default
+        implementation returns ``None`` signaling that it is not supported by
+        the protocol.
+
+        :param data: Received data.
+        :return: List of complete messages and number of bytes of data they
+          span (the rest of data is the beginning of the next message).
+        """
+        return None
+
 
 class RpcProtocolBlock(RpcTransportProtocol):
     """SHV RPC Stream protocol."""
@@ -73,6 +141,12 @@ class RpcProtocolBlock(RpcTransportProtocol):
     def annotate(cls, msg: bytes) -> bytes:  # noqa: D102
         return ChainPack.pack_uint_data(len(msg)) + msg
 
+    @classmethod
+    def annotate_parts(  # noqa: D102
+        cls, head: bytearray, body: bytes | bytearray | memoryview
+    ) -> list[bytes | bytearray | memoryview]:
+        return [ChainPack.pack_uint_data(len(head) + len(body)) + head, body]
+
     @classmethod
     async def receive(  # noqa: D102
         cls,
@@ -88,6 +162,27 @@ class RpcProtocolBlock(RpcTransportProtocol):
             else:
                 return await read(size)
 
+    @classmethod
+    def decode(  # noqa: D102
+        cls, data: bytes | bytearray | memoryview
+    ) -> tuple[list[bytes], int]:
+        res = []
+        pos = 0
+        with memoryview(data) as mdata:
+            reader = ChainPackBufferReader(mdata)
+            while True:
+                reader.pos = pos
+                try:
+                    size = reader.read_uint_data()
+                except ValueError:
+                    break
+                end = reader.pos + size
+                if end > len(mdata):
+                    break
+                res.append(bytes(mdata[reader.pos : end]))
+                pos = end
+        return res, pos
+
 
 class _RpcProtocolSerial(RpcTransportProtocol):
     """SHV RPC Serial protocol."""
@@ -129,7 +224,8 @@ class _RpcProtocolSerial(RpcTransportProtocol):
         # Warning: ESC must be first in the list so we first replace all occurances of
         # ESC before we insert more of them.
         for b in (cls.ESC, cls.STX, cls.ETX, cls.ATX):
-            data = data.replace(bytes((b,)), bytes((cls.ESC, cls.ESCRMAP[b])))
+            if b in data:
+                data = data.replace(bytes((b,)), bytes((cls.ESC, cls.ESCRMAP[b])))
         return data
 
     @classmethod
@@ -143,7 +239,7 @@ class _RpcProtocolSerial(RpcTransportProtocol):
                 pass
             data = bytearray()
             while (b := (await read(1))[0]) not in {cls.ETX, cls.ATX}:
-                data += bytes((b,))
+                data.append(b)
             if b == cls.ATX:
                 continue
             if use_crc:
@@ -155,6 +251,40 @@ class _RpcProtocolSerial(RpcTransportProtocol):
                     continue
             return cls.deescape(data)
 
+    @classmethod
+    def decode(cls, data: bytes | bytearray | memoryview) -> tuple[list[bytes], int]:
+        if isinstance(data, memoryview):
+            data = bytes(data)  # Search for the delimiters requires bytes
+        res: list[bytes] = []
+        pos = 0
+        with memoryview(data) as mdata:
+            while (start := data.find(cls.STX, pos)) >= 0:
+                end = data.find(cls.ETX, start + 1)
+                abort = data.find(cls.ATX, start + 1, len(data) if end < 0 else end)
+                if abort >= 0:
+                    pos = abort + 1
+                    continue
+                if end < 0:
+                    return res, start
+                pos = end + 1
+                if cls.uses_crc():
+                    # CRC can be escaped and thus its size depends on its content
+                    siz = 4
+                    while pos + siz <= len(data) and siz < (
+                        nsiz := 4 + data.count(cls.ESC, pos, pos + siz)
+                    ):
+                        siz = nsiz
+                    if pos + siz > len(data):
+                        return res, start
+                    crc32 = int.from_bytes(
+                        cls.deescape(bytes(mdata[pos : pos + siz])), "big"
+                    )
+                    pos += siz
+                    if crc32 != binascii.crc32(mdata[start + 1 : end]):
+                        continue
+                res.append(cls.deescape(bytes(mdata[start + 1 : end])))
+        return res, len(data)
+
     @classmethod
     def deescape(cls, data: bytes) -> bytes:
         """Reverse escape operation on bytes as defined for serial protocol.
@@ -163,6 +293,8 @@ class _RpcProtocolSerial(RpcTransportProtocol):
           modify in place).
         :return: The modified data.
         """
+        if cls.ESC not in data:
+            return data
         for b in (cls.STX, cls.ETX, cls.ATX, cls.ESC):
             data = data.replace(bytes((cls.ESC, cls.ESCRMAP[b])), bytes((b,)))
         return data
@@ -198,6 +330,56 @@ class RpcProtocolSerialCRC(_RpcProtocolSerial):
         return await cls._receive(read, True)
 
 
+class RpcStreamReader:
+    """Reader of the messages from :class:`asyncio.StreamReader`.
+
+    Protocols that implement :meth:`RpcTransportProtocol.decode` are read in
+    chunks and all complete messages in the read data are split at once
+    without awaiting for every single part of the message. Other protocols are
+    read with :meth:`RpcTransportProtocol.asyncio_receive`.
+
+    :param reader: The stream reader.
+    :param protocol: Stream communication protocol.
+    """
+
+    CHUNK_SIZE: int = 1 << 16
+    """Maximum number of bytes read from the stream at once."""
+
+    def __init__(
+        self, reader: asyncio.StreamReader, protocol: type[RpcTransportProtocol]
+    ) -> None:
+        self.reader = reader
+        """The stream reader messages are read from."""
+        self.protocol = protocol
+        """Stream communication protocol."""
+        self._buffer = bytearray()
+        self._msgs: collections.deque[bytes] = collections.deque()
+
+    async def receive(self) -> bytes:
+        """Receive the next message.
+
+        :return: Bytes of complete message.
+        :raise EOFError: when EOF is encountered.
+        """
+        while not self._msgs:
+            res = self.protocol.decode(self._buffer)
+            if res is None:
+                return await self.protocol.asyncio_receive(self.reader)
+            msgs, size = res
+            del self._buffer[:size]
+            if msgs:
+                self._msgs.extend(msgs)
+                break
+            try:
+                data = await self.reader.read(self.CHUNK_SIZE)
+            except ConnectionError as exc:
+                raise EOFError from exc
+            if not data:
+                raise EOFError
+            self._buffer += data
+        return self._msgs.popleft()
+
+
 class RpcClientStream(RpcClient):
     """RPC connection to some SHV peer over data stream."""
 
@@ -205,6 +387,7 @@ class RpcClientStream(RpcClient):
         super().__init__()
         self._reader: asyncio.StreamReader | None = None
         self._writer: asyncio.StreamWriter | None = None
+        self._stream: RpcStreamReader | None = None
         self.protocol = protocol
         """Stream communication protocol."""
 
@@ -216,11 +399,26 @@ class RpcClientStream(RpcClient):
         except ConnectionError as exc:
             raise EOFError from exc
 
+    async def _send_many(
+        self,
+        msgs: collections.abc.Sequence[
+            tuple[bytearray, bytes | bytearray | memoryview]
+        ],
+    ) -> None:
+        if self._writer is None:
+            raise EOFError("Not connected")
+        try:
+            await self.protocol.asyncio_send_many(self._writer, msgs)
+        except ConnectionError as exc:
+            raise EOFError from exc
+
     async def _receive(self) -> bytes:
         if self._reader is None:
             raise EOFError("Not connected")
+        if self._stream is None or self._stream.reader is not self._reader:
+            self._stream = RpcStreamReader(self._reader, self.protocol)
         try:
-            return await self.protocol.asyncio_receive(self._reader)
+            return await self._stream.receive()
         except EOFError:
             if self._writer is not None:
                 self._writer.close()
@@ -289,7 +487,9 @@ class RpcServerStream(RpcServer):
         """Start accepting new SHV connections."""
         if self._server is None:
             self._server = await self._create_server()
-        await self._server.start_serving()
+        if not self._server.is_serving():
+            await self._server.start_serving()
+            logger.debug("%s: Listening for clients", self)
 
     async def listen_forever(self) -> None:
         """Listen and block the calling coroutine until cancelation."""
@@ -301,12 +501,15 @@ class RpcServerStream(RpcServer):
         self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
     ) -> None:
         client = self.Client(reader, writer, self)
+        logger.debug("%s: New client %s", self, client)
         self._clients.add(client)
         res = self.client_connected_cb(client)
         if isinstance(res, collections.abc.Awaitable):
             await res
 
     def close(self) -> None:  # noqa D102
+        if self.is_serving():
+            logger.debug("%s: No longer listening for clients", self)
         if self._server is not None:
             self._server.close()
 
@@ -346,21 +549,36 @@ class RpcServerStream(RpcServer):
             self._server = server
             self.protocol = server.protocol
             """Stream communication protocol."""
+            self._stream = RpcStreamReader(reader, self.protocol)
 
         @property
         def server(self) -> RpcServerStream:
             """Access to the associated server."""
             return self._server
 
+        def _extra_info(self, name: str) -> typing.Any:  # noqa: ANN401
+            return self._writer.get_extra_info(name)
+
         async def _send(self, msg: bytes) -> None:
             try:
                 await self.protocol.asyncio_send(self._writer, msg)
             except ConnectionError as exc:
                 raise EOFError from exc
 
+        async def _send_many(
+            self,
+            msgs: collections.abc.Sequence[
+                tuple[bytearray, bytes | bytearray | memoryview]
+            ],
+        ) -> None:
+            try:
+                await self.protocol.asyncio_send_many(self._writer, msgs)
+            except ConnectionError as exc:
+                raise EOFError from exc
+
         async def _receive(self) -> bytes:
             try:
-                return await self.protocol.asyncio_receive(self._reader)
+                return await self._stream.receive()
             except EOFError:
                 self._writer.close()
                 raise
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import collections.abc
-import logging
 import ssl
+import typing
 
-from .abc import RpcClient
+from .abc import RpcClient, RpcServer
+from .buffered import RpcClientBuffered, RpcServerBuffered, RpcStreamProtocol
 from .stream import (
     RpcClientStream,
     RpcProtocolBlock,
@@ -16,10 +17,60 @@ from .stream import (
     RpcTransportProtocol,
 )
 
-logger = logging.getLogger(__name__)
 
+def _location(location: str) -> str:
+    return f"[{location}]" if ":" in location else location
 
-class RpcClientTCP(RpcClientStream):
+
+class _RpcClientTCP(RpcClient):
+    """Naming shared by TCP/IP clients."""
+
+    location: str
+    port: int
+    ssl: ssl.SSLContext | None
+    protocol: type[RpcTransportProtocol]
+
+    def __str__(self) -> str:
+        proto = "tcp" if self.ssl is None else "ssl"
+        if self.protocol is RpcProtocolSerial:
+            proto += "s"
+        return f"{proto}:{_location(self.location)}:{self.port}"
+
+    @property
+    def secure(self) -> bool:
+        return self.ssl is not None
+
+
+class _RpcServerTCP(RpcServer):
+    """Naming shared by TCP/IP servers."""
+
+    location: str | None
+    port: int
+    ssl: ssl.SSLContext | None
+    protocol: type[RpcTransportProtocol]
+
+    def __str__(self) -> str:
+        proto = "tcp" if self.ssl is None else "ssl"
+        if self.protocol is RpcProtocolSerial:
+            proto += "s"
+        location = "localhost" if self.location is None else _location(self.location)
+        return f"server.{proto}:{location}:{self.port}"
+
+    class Client(RpcClient):
+        """Naming shared by TCP/IP server clients."""
+
+        _extra_info: collections.abc.Callable[[str], typing.Any]
+
+        def __str__(self) -> str:
+            peername = self._extra_info("peername")
+            return f"tcp:{_location(peername[0])}:{peername[1]}"
+
+        @property
+        def secure(self) -> bool:
+            return self._extra_info("sslcontext") is not None
+
+
+class RpcClientTCP(_RpcClientTCP, RpcClientStream):
     """RPC connection to some SHV peer over TCP/IP."""
 
     def __init__(
@@ -34,24 +85,13 @@ class RpcClientTCP(RpcClientStream):
         self.port = port
         self.ssl = ssl
 
-    def __str__(self) -> str:
-        proto = "tcp" if self.ssl is None else "ssl"
-        if self.protocol is RpcProtocolSerial:
-            proto += "s"
-        location = f"[{self.location}]" if ":" in self.location else self.location
-        return f"{proto}:{location}:{self.port}"
-
     async def _open_connection(
         self,
     ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
         return await asyncio.open_connection(self.location, self.port, ssl=self.ssl)
 
-    @property
-    def secure(self) -> bool:  # noqa: D102
-        return self.ssl is not None
-
 
-class RpcServerTCP(RpcServerStream):
+class RpcServerTCP(_RpcServerTCP, RpcServerStream):
     """RPC server listenting for SHV connections in TCP/IP."""
 
     def __init__(
@@ -63,24 +103,18 @@ class RpcServerTCP(RpcServerStream):
         port: int = 3755,
         protocol: type[RpcTransportProtocol] = RpcProtocolBlock,
         ssl: ssl.SSLContext | None = None,
+        reuse_port: bool = False,
     ) -> None:
         super().__init__(client_connected_cb, protocol)
         self.location = location
         self.port = port
         self.ssl = ssl
+        self.reuse_port = reuse_port
+        """Allow multiple servers (processes) to listen on the same port.
 
-    def __str__(self) -> str:
-        proto = "tcp" if self.ssl is None else "ssl"
-        if self.protocol is RpcProtocolSerial:
-            proto += "s"
-        location = (
-            "locahost"
-            if self.location is None
-            else f"[{self.location}]"
-            if ":" in self.location
-            else self.location
-        )
-        return f"server.{proto}:{location}:{self.port}"
+        This sets ``SO_REUSEPORT`` socket option and connections are
+        distributed between servers by the kernel.
+        """
 
     async def _create_server(self) -> asyncio.Server:
         # Note: The hack for '::' here is to allow really bind to all
@@ -90,41 +124,78 @@ class RpcServerTCP(RpcServerStream):
             host=None if self.location == "::" else self.location,
             port=self.port,
             ssl=self.ssl,
+            reuse_port=self.reuse_port or None,
         )
 
-    async def listen(self) -> None:  # noqa: D102
-        was_listening = self.is_serving()
-        await super().listen()
-        if not was_listening:
-            logger.debug("%s: Listening for clients", self)
+    class Client(_RpcServerTCP.Client, RpcServerStream.Client):
+        """RPC client for TCP server connection."""
+
 
-    def close(self) -> None:  # noqa: D102
-        was_listening = self.is_serving()
-        super().close()
-        if was_listening and (self._server is None or not self._server.is_serving()):
-            logger.debug("%s: No longer listening for clients", self)
+class RpcClientTCPBuffered(_RpcClientTCP, RpcClientBuffered):
+    """RPC connection to some SHV peer over TCP/IP with :class:`asyncio.BufferedProtocol`.
 
-    async def _client_connect(
-        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    This is an alternative to :class:`RpcClientTCP` that doesn't use Asyncio
+    streams (see :class:`shv.rpctransport.buffered.RpcStreamProtocol`).
+    """
+
+    def __init__(
+        self,
+        location: str = "localhost",
+        port: int = 3755,
+        protocol: type[RpcTransportProtocol] = RpcProtocolBlock,
+        ssl: ssl.SSLContext | None = None,
     ) -> None:
-        peername = writer.get_extra_info("peername")
-        location = f"[{peername[0]}]" if ":" in peername[0] else peername[0]
-        logger.debug("%s: New client %s:%d", self, location, peername[1])
-        await super()._client_connect(reader, writer)
+        super().__init__(protocol)
+        self.location = location
+        self.port = port
+        self.ssl = ssl
 
-    class Client(RpcServerStream.Client):
-        """RPC client for TCP server connection."""
+    async def _open_connection(self) -> RpcStreamProtocol:
+        _, protocol = await asyncio.get_running_loop().create_connection(
+            self._protocol_factory, self.location, self.port, ssl=self.ssl
+        )
+        return protocol
 
-        def __str__(self) -> str:
-            assert isinstance(self._server, RpcServerTCP)
-            proto = "tcp" if self._server.ssl is None else "ssl"
-            if self.protocol is RpcProtocolSerial:
-                proto += "s"
-            peername = self._writer.get_extra_info("peername")
-            location = f"[{peername[0]}]" if ":" in peername[0] else peername[0]
-            return f"tcp:{location}:{peername[1]}"
 
-        @property
-        def secure(self) -> bool:  # noqa: D102
-            assert isinstance(self._server, RpcServerTCP)
-            return self._server.ssl is not None
+class RpcServerTCPBuffered(_RpcServerTCP, RpcServerBuffered):
+    """RPC server listenting for SHV connections in TCP/IP with :class:`asyncio.BufferedProtocol`.
+
+    This is an alternative to :class:`RpcServerTCP` that doesn't use Asyncio
+    streams (see :class:`shv.rpctransport.buffered.RpcStreamProtocol`).
+    """
+
+    def __init__(
+        self,
+        client_connected_cb: collections.abc.Callable[
+            [RpcClient], collections.abc.Awaitable[None] | None
+        ],
+        location: str | None = None,
+        port: int = 3755,
+        protocol: type[RpcTransportProtocol] = RpcProtocolBlock,
+        ssl: ssl.SSLContext | None = None,
+        reuse_port: bool = False,
+    ) -> None:
+        super().__init__(client_connected_cb, protocol)
+        self.location = location
+        self.port = port
+        self.ssl = ssl
+        self.reuse_port = reuse_port
+        """Allow multiple servers (processes) to listen on the same port.
+
+        This sets ``SO_REUSEPORT`` socket option and connections are
+        distributed between servers by the kernel.
+        """
+
+    async def _create_server(self) -> asyncio.Server:
+        # Note: The hack for '::' here is to allow really bind to all
+        # interfaces as that is what this should do and not just loopback.
+        return await asyncio.get_running_loop().create_server(
+            self._protocol_factory,
+            host=None if self.location == "::" else self.location,
+            port=self.port,
+            ssl=self.ssl,
+            reuse_port=self.reuse_port or None,
+        )
+
+    class Client(_RpcServerTCP.Client, RpcServerBuffered.Client):
+        """RPC client for TCP server connection."""
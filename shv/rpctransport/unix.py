@@ -2,9 +2,10 @@
 
 import asyncio
 import collections.abc
-import logging
+import typing
 
-from .abc import RpcClient
+from .abc import RpcClient, RpcServer
+from .buffered import RpcClientBuffered, RpcServerBuffered, RpcStreamProtocol
 from .stream import (
     RpcClientStream,
     RpcProtocolSerial,
@@ -12,10 +13,34 @@ from .stream import (
     RpcTransportProtocol,
 )
 
-logger = logging.getLogger(__name__)
 
+class _RpcClientUnix(RpcClient):
+    """Naming shared by Unix socket clients."""
 
-class RpcClientUnix(RpcClientStream):
+    location: str
+
+    def __str__(self) -> str:
+        return f"unix:{self.location}"
+
+
+class _RpcServerUnix(RpcServer):
+    """Naming shared by Unix socket servers."""
+
+    location: str
+
+    def __str__(self) -> str:
+        return f"server.unix:{self.location}"
+
+    class Client(RpcClient):
+        """Naming shared by Unix socket server clients."""
+
+        _extra_info: collections.abc.Callable[[str], typing.Any]
+
+        def __str__(self) -> str:
+            return f"unix:{self._extra_info('peername')}"
+
+
+class RpcClientUnix(_RpcClientUnix, RpcClientStream):
     """RPC connection to some SHV peer over Unix domain named socket."""
 
     def __init__(
@@ -26,16 +51,13 @@ class RpcClientUnix(RpcClientStream):
         super().__init__(protocol)
         self.location = location
 
-    def __str__(self) -> str:
-        return f"unix:{self.location}"
-
     async def _open_connection(
         self,
     ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
         return await asyncio.open_unix_connection(self.location)
 
 
-class RpcServerUnix(RpcServerStream):
+class RpcServerUnix(_RpcServerUnix, RpcServerStream):
     """RPC server listenting for SHV connections on Unix domain named socket."""
 
     def __init__(
@@ -49,32 +71,57 @@ class RpcServerUnix(RpcServerStream):
         super().__init__(client_connected_cb, protocol)
         self.location = location
 
-    def __str__(self) -> str:
-        return f"server.unix:{self.location}"
-
     async def _create_server(self) -> asyncio.Server:
         return await asyncio.start_unix_server(self._client_connect, path=self.location)
 
-    async def listen(self) -> None:  # noqa: D102
-        was_listening = self.is_serving()
-        await super().listen()
-        if not was_listening:
-            logger.debug("%s: Listening for clients", self)
+    class Client(_RpcServerUnix.Client, RpcServerStream.Client):
+        """RPC client for Unix server connection."""
+
+
+class RpcClientUnixBuffered(_RpcClientUnix, RpcClientBuffered):
+    """RPC connection to some SHV peer over Unix socket with :class:`asyncio.BufferedProtocol`.
 
-    def close(self) -> None:  # noqa: D102
-        was_listening = self.is_serving()
-        super().close()
-        if was_listening and (self._server is None or self._server.is_serving()):
-            logger.debug("%s: No longer listening for clients", self)
+    This is an alternative to :class:`RpcClientUnix` that doesn't use Asyncio
+    streams (see :class:`shv.rpctransport.buffered.RpcStreamProtocol`).
+    """
 
-    async def _client_connect(
-        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    def __init__(
+        self,
+        location: str = "shv.sock",
+        protocol: type[RpcTransportProtocol] = RpcProtocolSerial,
     ) -> None:
-        logger.debug("%s: New client %s", self, writer.get_extra_info("peername"))
-        await super()._client_connect(reader, writer)
+        super().__init__(protocol)
+        self.location = location
 
-    class Client(RpcServerStream.Client):
-        """RPC client for Unix server connection."""
+    async def _open_connection(self) -> RpcStreamProtocol:
+        _, protocol = await asyncio.get_running_loop().create_unix_connection(
+            self._protocol_factory, self.location
+        )
+        return protocol
 
-        def __str__(self) -> str:
-            return f"unix:{self._writer.get_extra_info('peername')}"
+
+class RpcServerUnixBuffered(_RpcServerUnix, RpcServerBuffered):
+    """RPC server listenting on Unix socket with :class:`asyncio.BufferedProtocol`.
+
+    This is an alternative to :class:`RpcServerUnix` that doesn't use Asyncio
+    streams (see :class:`shv.rpctransport.buffered.RpcStreamProtocol`).
+    """
+
+    def __init__(
+        self,
+        client_connected_cb: collections.abc.Callable[
+            [RpcClient], collections.abc.Awaitable[None] | None
+        ],
+        location: str = "shv.sock",
+        protocol: type[RpcTransportProtocol] = RpcProtocolSerial,
+    ) -> None:
+        super().__init__(client_connected_cb, protocol)
+        self.location = location
+
+    async def _create_server(self) -> asyncio.Server:
+        return await asyncio.get_running_loop().create_unix_server(
+            self._protocol_factory, path=self.location
+        )
+
+    class Client(_RpcServerUnix.Client, RpcServerBuffered.Client):
+        """RPC client for Unix server connection."""
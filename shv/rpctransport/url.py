@@ -6,9 +6,19 @@ from ..rpcurl import RpcProtocol, RpcUrl
 from .abc import RpcClient, RpcServer
 from .can import RpcClientCAN, RpcServerCAN
 from .stream import RpcProtocolBlock, RpcProtocolSerial
-from .tcp import RpcClientTCP, RpcServerTCP
+from .tcp import (
+    RpcClientTCP,
+    RpcClientTCPBuffered,
+    RpcServerTCP,
+    RpcServerTCPBuffered,
+)
 from .tty import RpcClientTTY, RpcServerTTY
-from .unix import RpcClientUnix, RpcServerUnix
+from .unix import (
+    RpcClientUnix,
+    RpcClientUnixBuffered,
+    RpcServerUnix,
+    RpcServerUnixBuffered,
+)
 from .ws import RpcClientWebSockets, RpcServerWebSockets, RpcServerWebSocketsUnix
 
 
@@ -20,23 +30,21 @@ def init_rpc_client(url: RpcUrl | str) -> RpcClient:
     """
     if isinstance(url, str):
         url = RpcUrl.parse(url)
+    tcp = RpcClientTCPBuffered if url.buffered else RpcClientTCP
+    unix = RpcClientUnixBuffered if url.buffered else RpcClientUnix
     match url.protocol:
         case RpcProtocol.TCP:
-            return RpcClientTCP(url.location, url.port, RpcProtocolBlock)
+            return tcp(url.location, url.port, RpcProtocolBlock)
         case RpcProtocol.TCPS:
-            return RpcClientTCP(url.location, url.port, RpcProtocolSerial)
+            return tcp(url.location, url.port, RpcProtocolSerial)
         case RpcProtocol.SSL:
-            return RpcClientTCP(
-                url.location, url.port, RpcProtocolBlock, url.ssl_client()
-            )
+            return tcp(url.location, url.port, RpcProtocolBlock, url.ssl_client())
         case RpcProtocol.SSLS:
-            return RpcClientTCP(
-                url.location, url.port, RpcProtocolSerial, url.ssl_client()
-            )
+            return tcp(url.location, url.port, RpcProtocolSerial, url.ssl_client())
         case RpcProtocol.UNIX:
-            return RpcClientUnix(url.location, RpcProtocolBlock)
+            return unix(url.location, RpcProtocolBlock)
         case RpcProtocol.UNIXS:
-            return RpcClientUnix(url.location, RpcProtocolSerial)
+            return unix(url.location, RpcProtocolSerial)
         case RpcProtocol.TTY:
             return RpcClientTTY(url.location, url.baudrate)
         case RpcProtocol.WS:
@@ -66,49 +74,66 @@ async def create_rpc_server(
         [RpcClient], collections.abc.Awaitable[None] | None
     ],
     url: RpcUrl | str,
+    reuse_port: bool = False,
 ) -> RpcServer:
     """Create server listening on given URL.
 
     :param client_connected_cb: function called for every new client connected.
     :param url: RPC URL specifying where server should listen.
+    :param reuse_port: Allow multiple servers to listen on the same port. This
+      applies only to TCP/IP based servers.
     """
     res: RpcServer
     if isinstance(url, str):
         url = RpcUrl.parse(url)
+    tcp = RpcServerTCPBuffered if url.buffered else RpcServerTCP
+    unix = RpcServerUnixBuffered if url.buffered else RpcServerUnix
     match url.protocol:
         case RpcProtocol.TCP:
-            res = RpcServerTCP(
-                client_connected_cb, url.location, url.port, RpcProtocolBlock
+            res = tcp(
+                client_connected_cb,
+                url.location,
+                url.port,
+                RpcProtocolBlock,
+                reuse_port=reuse_port,
             )
         case RpcProtocol.TCPS:
-            res = RpcServerTCP(
-                client_connected_cb, url.location, url.port, RpcProtocolSerial
+            res = tcp(
+                client_connected_cb,
+                url.location,
+                url.port,
+                RpcProtocolSerial,
+                reuse_port=reuse_port,
             )
         case RpcProtocol.SSL:
-            res = RpcServerTCP(
+            res = tcp(
                 client_connected_cb,
                 url.location,
                 url.port,
                 RpcProtocolBlock,
                 url.ssl_server(),
+                reuse_port,
             )
         case RpcProtocol.SSLS:
-            res = RpcServerTCP(
+            res = tcp(
                 client_connected_cb,
                 url.location,
                 url.port,
                 RpcProtocolSerial,
                 url.ssl_server(),
+                reuse_port,
             )
         case RpcProtocol.UNIX:
-            res = RpcServerUnix(client_connected_cb, url.location, RpcProtocolBlock)
+            res = unix(client_connected_cb, url.location, RpcProtocolBlock)
         case RpcProtocol.UNIXS:
-            res = RpcServerUnix(client_connected_cb, url.location, RpcProtocolSerial)
+            res = unix(client_connected_cb, url.location, RpcProtocolSerial)
         case RpcProtocol.TTY:
             res = RpcServerTTY(client_connected_cb, url.location, url.baudrate)
         case RpcProtocol.WS:
             if url.port != -1:
-                res = RpcServerWebSockets(client_connected_cb, url.location, url.port)
+                res = RpcServerWebSockets(
+                    client_connected_cb, url.location, url.port, reuse_port
+                )
             else:
                 res = RpcServerWebSocketsUnix(client_connected_cb, url.location)
         case RpcProtocol.CAN:
@@ -253,6 +253,7 @@ class RpcServerWebSockets(_RpcServerWebSockets):
     :param location: Hostname or IP address this server should listen on. The
       default ``None`` listens on all addresses.
     :param port: The port servers listens on.
+    :param reuse_port: Allow multiple servers to listen on the same port.
     """
 
     def __init__(
@@ -262,12 +263,15 @@ class RpcServerWebSockets(_RpcServerWebSockets):
         ],
         location: str | None = None,
         port: int = 8001,
+        reuse_port: bool = False,
     ) -> None:
         super().__init__(client_connected_cb)
         self.location = location
         """Host websockets server should listen on."""
         self.port = port
         """Port websocket server should listen on."""
+        self.reuse_port = reuse_port
+        """Allow multiple servers to listen on the same port (``SO_REUSEPORT``)."""
 
     async def _create_server(self) -> websockets.asyncio.server.Server:
         return await websockets.asyncio.server.serve(
@@ -275,6 +279,7 @@ class RpcServerWebSockets(_RpcServerWebSockets):
             self.location,
             self.port,
             subprotocols=[subprotocol],
+            reuse_port=self.reuse_port or None,
         )
 
     def __str__(self) -> str:
@@ -95,6 +95,14 @@ class RpcUrl:
     client and ``false`` for server and thus default is ``None``.
     """
 
+    # TCP/IP and Unix sockets
+    buffered: bool = False
+    """Use transport based on :class:`asyncio.BufferedProtocol`.
+
+    This selects alternative implementation of the transport that doesn't use
+    Asyncio streams. It is supported for TCP/IP and Unix domain sockets.
+    """
+
     # TTY
     baudrate: int = 115200
     """Baudrate used for some of the link protocols."""
@@ -285,6 +293,21 @@ class RpcUrl:
                     self.verify = False
                 else:
                     raise ValueError(f"Invalid for verify: {opts[0]}")
+        if self.protocol in {
+            RpcProtocol.TCP,
+            RpcProtocol.TCPS,
+            RpcProtocol.SSL,
+            RpcProtocol.SSLS,
+            RpcProtocol.UNIX,
+            RpcProtocol.UNIXS,
+        }:
+            if opts := pqs.pop("buffered", []):
+                if opts[0] in {"true", "t", "y"}:
+                    self.buffered = True
+                elif opts[0] in {"false", "f", "n"}:
+                    self.buffered = False
+                else:
+                    raise ValueError(f"Invalid for buffered: {opts[0]}")
         if self.protocol is RpcProtocol.TTY:
             if opts := pqs.pop("baudrate", []):
                 self.baudrate = int(opts[0])
@@ -378,6 +401,8 @@ class RpcUrl:
                     yield f"password={urllib.parse.quote(self.login.password)}"
                 else:
                     raise NotImplementedError  # pragma: no cover
+        if self.buffered != type(self).buffered:
+            yield f"buffered={'true' if self.buffered else 'false'}"
         if self.baudrate != type(self).baudrate:
             yield f"baudrate={self.baudrate}"
         if self.can_address != type(self).can_address:
@@ -1,11 +1,14 @@
 """Check our own implementation of the broker."""
 
+import asyncio
 import dataclasses
 
 import pytest
 
 from shv import shvmeta
+from shv.chainpack import ChainPack
 from shv.rpcapi.client import SHVClient
+from shv.rpcapi.valueclient import SHVValueClient
 from shv.rpcdef import (
     RpcAccess,
     RpcDir,
@@ -158,6 +161,11 @@ async def test_empty_call(client, path, method, param, result):
                 "role": "admin",
                 # "idleTime": indeterministic
                 "idleTimeMax": 180000,
+                "sendQueue": 0,
+                "sendQueueBytes": 0,
+                "congested": False,
+                "throttled": 0,
+                "throttledTime": 0,
             },
         ),
         (
@@ -174,6 +182,11 @@ async def test_empty_call(client, path, method, param, result):
                 "role": "admin",
                 # "idleTime": indeterministic
                 "idleTimeMax": 180000,
+                "sendQueue": 0,
+                "sendQueueBytes": 0,
+                "congested": False,
+                "throttled": 0,
+                "throttledTime": 0,
             },
         ),
     ),
@@ -219,6 +232,11 @@ async def test_with_example_ls(client, example_device, path, nodes):
                 "role": "test-browse",
                 # "idleTime": indeterministic
                 "idleTimeMax": 180000,
+                "sendQueue": 0,
+                "sendQueueBytes": 0,
+                "congested": False,
+                "throttled": 0,
+                "throttledTime": 0,
             },
         ),
         (
@@ -233,6 +251,11 @@ async def test_with_example_ls(client, example_device, path, nodes):
                 "role": "test-browse",
                 # "idleTime": indeterministic
                 "idleTimeMax": 180000,
+                "sendQueue": 0,
+                "sendQueueBytes": 0,
+                "congested": False,
+                "throttled": 0,
+                "throttledTime": 0,
             },
         ),
     ),
@@ -248,6 +271,15 @@ async def test_mounted_client_info(client, example_device, param, result):
     assert shvmeta(res) == shvmeta(result)
 
 
+async def test_throttle(shvbroker, example_device, client):
+    """Check that client is throttled when its peer is congested."""
+    shvbroker.client_on_path("test/device")[0].SEND_QUEUE_LIMIT = 1
+    assert await client.ls("test/device") == [".app", "numberOfTracks", "track"]
+    res = await client.call(".broker/currentClient", "info")
+    assert res["throttled"] == 1
+    assert not res["congested"]
+
+
 async def test_subscribe(client, example_device):
     sub = "test/device/track/**:*:*"
     assert await client.subscribe(sub) is True
@@ -268,6 +300,23 @@ async def test_with_example_set(example_device, value_client):
     assert value_client["test/device/track/1"] == [1, 2]
 
 
+async def test_signal_shared(shvbroker, example_device, value_client, url_test):
+    """Check that signal delivered to multiple clients is encoded only once."""
+    client = await SHVValueClient.connect(url_test)
+    for c in (client, value_client):
+        await c.subscribe("test/device/track/**:*:*")
+    saved = shvbroker.signal_encodes_saved
+    changes = [
+        asyncio.create_task(c.wait_for_change("test/device/track/1"))
+        for c in (client, value_client)
+    ]
+    await asyncio.sleep(0)  # Let tasks to register waiting for change
+    await value_client.prop_set("test/device/track/1", [1, 2])
+    assert await asyncio.gather(*changes) == [[1, 2], [1, 2]]
+    assert shvbroker.signal_encodes_saved == saved + 1
+    await client.disconnect()
+
+
 async def test_with_example_reset(example_device, client):
     """Perform reset on example device to check user's ID."""
     await client.call("test/device/track", "reset")
@@ -304,6 +353,22 @@ async def test_invalid_login_null(shvbroker, url):
         raise (await client.receive()).error
 
 
+async def test_invalid_login_body(shvbroker, url):
+    """Check that login with invalid body is dropped and client is still served."""
+    client = await RpcClientTCP.connect(url.location, url.port)
+    await client.send(RpcMessage.request("", "hello"))
+    await client.receive()
+    login = RpcMessage.request("", "login", {"login": {"user": "invalid"}})
+    await client._send(
+        bytes((ChainPack.ProtocolType,))
+        + login.to_chainpack().replace(b"invalid", b"inv\xfflid")
+    )
+    msg = RpcMessage.request("", "hello")
+    await client.send(msg)
+    assert (await client.receive()).request_id == msg.request_id
+    client.disconnect()
+
+
 async def test_double_mount(shvbroker, url):
     nurl = dataclasses.replace(
         url, login=dataclasses.replace(url.login, opt_device_mount_point="test/client")
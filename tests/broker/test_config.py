@@ -5,6 +5,7 @@ import pytest
 from shv.broker import RpcBrokerConfig
 from shv.rpcdef import RpcAccess
 from shv.rpclogin import RpcLogin, RpcLoginType
+from shv.rpcmessage import RpcMessage
 from shv.rpcurl import RpcProtocol, RpcUrl
 
 
@@ -76,9 +77,22 @@ def test_subconfig(subconfig):
         users=[
             RpcBrokerConfig.User("admin", "admin!234", ["admin"]),
         ],
+        coalesce_signals=False,
+        signal_queue_size=16,
+        workers=2,
+        loop=RpcBrokerConfig.EventLoop.ASYNCIO,
     )
 
 
+def test_send_queue(config, subconfig):
+    assert config.send_queue().coalesce
+    queue = subconfig.send_queue()
+    assert not queue.coalesce
+    for i in range(20):
+        queue.push(RpcMessage.signal("test", value=i))
+    assert len(queue) == 16
+
+
 def test_login_valid_admin(config):
     role = config.login(RpcLogin("admin", "admin!123"), "nonce")
     assert role is not None
@@ -185,3 +199,15 @@ def test_autosetup(mntfmt, existing, expected):
     autosetup = RpcBrokerConfig.Autosetup(set(), mount_point=mntfmt)
     user = RpcBrokerConfig.User("admin", "admin!123", ["r1", "r2"])
     assert autosetup.generate_mount_point(existing, "devid", user) == expected
+
+
+def test_access_cache_clear():
+    role = RpcBrokerConfig.Role("r", access={RpcAccess.BROWSE: {"**:ls", "**:*:*"}})
+    config = RpcBrokerConfig(roles=[role])
+    assert config.access_level(["r"], "test", "ls") == RpcAccess.BROWSE
+    assert config.access_level(["r"], "test", "get") is None
+    role.access[RpcAccess.COMMAND] = {"test/**:get"}
+    assert config.access_level(["r"], "test", "get") is None  # Cached
+    config.access_cache_clear()
+    assert config.access_level(["r"], "test", "get") == RpcAccess.COMMAND
+    assert config.access_level(["r"], "test", "ls") == RpcAccess.BROWSE
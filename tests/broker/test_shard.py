@@ -0,0 +1,132 @@
+"""Check broker split to multiple workers."""
+
+import asyncio
+import dataclasses
+
+import pytest
+
+from example_device import ExampleDevice
+from shv import broker
+from shv.rpcapi.client import SHVClient
+from shv.rpcapi.valueclient import SHVValueClient
+from shv.rpcdef import RpcMethodCallExceptionError
+from shv.rpcurl import RpcUrl
+
+WORKERS = 3
+
+
+@pytest.fixture(name="ports")
+def fixture_ports(unused_tcp_port_factory):
+    return [unused_tcp_port_factory() for _ in range(WORKERS)]
+
+
+@pytest.fixture(name="shards")
+async def fixture_shards(config, ports, tmp_path):
+    res = []
+    for i, port in enumerate(ports):
+        conf = broker.RpcBrokerConfig(
+            listen=[RpcUrl("localhost", port)],
+            roles=config.roles.values(),
+            users=config.users.values(),
+        )
+        b = broker.RpcBroker(conf, broker.RpcBroker.Shard(i, WORKERS, tmp_path))
+        await b.start_serving()
+        res.append(b)
+    yield res
+    for b in res:
+        await b.terminate()
+
+
+def shard_url(url, port):
+    return dataclasses.replace(url, port=port)
+
+
+async def wait_for(predicate):
+    async with asyncio.timeout(1):
+        while not predicate():  # noqa: ASYNC110
+            await asyncio.sleep(0.01)
+
+
+async def test_clients(shards, url, ports):
+    clients = [await SHVClient.connect(shard_url(url, port)) for port in ports]
+    ids = [(await c.call(".broker/currentClient", "info"))["clientId"] for c in clients]
+    assert [cid % WORKERS for cid in ids] == list(range(WORKERS))
+    for client in clients:
+        assert sorted(await client.call(".broker", "clients")) == sorted(ids)
+        assert await client.ls(".broker/client") == [str(cid) for cid in ids]
+    await clients[1].disconnect()
+    await wait_for(lambda: ids[1] not in shards[0].client_ids())
+    assert sorted(await clients[0].call(".broker", "clients")) == [ids[0], ids[2]]
+    await clients[0].disconnect()
+    await clients[2].disconnect()
+
+
+async def test_remote_device(shards, url, url_test_device, ports):
+    device = await ExampleDevice.connect(shard_url(url_test_device, ports[1]))
+    client = await SHVValueClient.connect(shard_url(url, ports[2]))
+    await wait_for(lambda: "test/device" in shards[2].mount_points())
+    assert await client.call(".broker", "mounts") == ["test/device"]
+    assert await client.ls("") == [".app", ".broker", "test"]
+    assert await client.ls("test/device") == [".app", "numberOfTracks", "track"]
+    info = await client.call(".broker", "mountedClientInfo", "test/device")
+    assert info["deviceId"] == "example"
+    assert info["clientId"] % WORKERS == 1
+    res = await client.call(".broker", "clientInfo", info["clientId"])
+    assert res["mountPoint"] == "test/device"
+    cpath = f".broker/client/{info['clientId']}/track/1"
+    assert await client.call(cpath, "get") == [0]
+
+    await client.subscribe("test/device/track/**:*:chng")
+    change = asyncio.create_task(client.wait_for_change("test/device/track/1"))
+    await asyncio.sleep(0.1)  # Subscription propagation to the other worker
+    await client.prop_set("test/device/track/1", [1, 2])
+    assert await change == [1, 2]
+
+    await device.disconnect()
+    await wait_for(lambda: not list(shards[2].mount_points()))
+    await client.disconnect()
+
+
+async def test_double_mount(shards, url_test_device, ports):
+    device = await ExampleDevice.connect(shard_url(url_test_device, ports[1]))
+    await wait_for(lambda: "test/device" in shards[0].mount_points())
+    with pytest.raises(RpcMethodCallExceptionError):
+        await ExampleDevice.connect(shard_url(url_test_device, ports[0]))
+    await device.disconnect()
+
+
+async def test_mount_conflict(shards, url_test_device, ports):
+    """Mount conflict of clients mounted at the same time to multiple workers."""
+    devices = await asyncio.gather(
+        *(ExampleDevice.connect(shard_url(url_test_device, port)) for port in ports),
+        return_exceptions=True,
+    )
+    await asyncio.sleep(0.1)
+    mounted = {cid for b in shards if (cid := b._mounts.get("test/device")) is not None}
+    assert len(mounted) == 1
+    assert all(list(b.mount_points()) == ["test/device"] for b in shards)
+    for device in devices:
+        if isinstance(device, ExampleDevice):
+            await device.disconnect()
+
+
+async def test_reuse_port(config, url, port, tmp_path):
+    shards = []
+    for i in range(WORKERS):
+        conf = broker.RpcBrokerConfig(
+            listen=[RpcUrl("localhost", port)],
+            roles=config.roles.values(),
+            users=config.users.values(),
+        )
+        shards.append(
+            broker.RpcBroker(conf, broker.RpcBroker.Shard(i, WORKERS, tmp_path))
+        )
+        await shards[-1].start_serving()
+    clients = [await SHVClient.connect(url) for _ in range(8)]
+    await wait_for(lambda: len(list(shards[0].client_ids())) == len(clients))
+    for client in clients:
+        assert len(await client.call(".broker", "clients")) == len(clients)
+    for client in clients:
+        await client.disconnect()
+    for b in shards:
+        await b.terminate()
@@ -6,7 +6,13 @@ import decimal
 import pytest
 
 from shv import SHVIMap, SHVMap, SHVMeta, SHVUInt, shvmeta
-from shv.chainpack import ChainPackReader, ChainPackWriter
+from shv.chainpack import (
+    ChainPack,
+    ChainPackBufferReader,
+    ChainPackBufferWriter,
+    ChainPackReader,
+    ChainPackWriter,
+)
 
 # You can get chainpack using this shell command:
 #   echo 'null' | cp2cp --ip --oc \
@@ -98,8 +104,60 @@ def test_reader(chainpack, data):
     assert shvmeta(obj) == shvmeta(data)
 
 
+@pytest.mark.parametrize(
+    "chainpack,data",
+    [
+        *DATA,
+        (b"\x8efoo\x00", "foo"),
+        (b"\x8ef\\\\o\\0\x00", "f\\o\0"),
+    ],
+)
+def test_buffer_reader(chainpack, data):
+    obj = ChainPackBufferReader(memoryview(b"\x00" + chainpack), 1).read()
+    assert obj == data
+    assert shvmeta(obj) == shvmeta(data)
+
+
+@pytest.mark.parametrize(
+    "chainpack",
+    [d[0] for d in DATA] + [b"\x8efoo\x00", b"\x8ef\\\\o\\0\x00"],
+)
+def test_buffer_reader_skip(chainpack):
+    reader = ChainPackBufferReader(chainpack + b"\x80")
+    reader.skip()
+    assert reader.pos == len(chainpack)
+    assert reader.peek() == ChainPack.Schema.CP_Null
+
+
+def test_buffer_reader_meta():
+    reader = ChainPackBufferReader(b"\x8bAB\xffC")
+    assert reader.read_meta() == {1: 2}
+    assert reader.read_meta() == {}
+    assert reader.read() == 3
+    assert reader.peek() == -1
+
+
 def test_reader_uint():
     assert isinstance(ChainPackReader.unpack(b"\x01"), SHVUInt)
+    assert isinstance(ChainPack.unpack(b"\x01"), SHVUInt)
+
+
+@pytest.mark.parametrize(
+    "chainpack",
+    (
+        b"",
+        b"\x88AB",
+        b"\x86\x05foo",
+        b"\x83\x00\x00",
+        b"\x81\xf0\x7f",
+        b"\x89\x86\x03foo\xff",
+        b"\x89\x01A\xff",
+        b"\x87",
+    ),
+)
+def test_buffer_reader_invalid(chainpack):
+    with pytest.raises(ValueError):
+        ChainPack.unpack(chainpack)
 
 
 @pytest.mark.parametrize(
@@ -114,6 +172,47 @@ def test_writer(chainpack, data):
     assert res == chainpack
 
 
+@pytest.mark.parametrize(
+    "chainpack,data",
+    [
+        *DATA,
+        (b"A", SHVMeta.new(1)),
+        (b"\x88AB\xff", (1, 2)),
+        (b"\x8a\xff", {}),
+        (b"\x82\xf1\x00\xff\xff\xff\xff", SHVMeta.new(2**32 - 1)),
+    ],
+)
+def test_buffer_writer(chainpack, data):
+    res = ChainPackBufferWriter.pack(data)
+    assert res == chainpack
+
+
+@pytest.mark.parametrize("value", (2**i + d for i in range(130) for d in (-1, 0)))
+def test_buffer_writer_int(value):
+    for v in (value, -value):
+        assert ChainPackBufferWriter.pack(v) == ChainPackWriter.pack(v)
+    assert ChainPackBufferWriter.pack(SHVUInt(value)) == ChainPackWriter.pack(
+        SHVUInt(value)
+    )
+
+
+def test_buffer_writer_invalid():
+    with pytest.raises(ValueError):
+        ChainPackBufferWriter.pack({1: 2, "a": 3})
+    with pytest.raises(ValueError):
+        ChainPackBufferWriter.pack(SHVMap({1: "a"}))
+    with pytest.raises(ValueError):
+        ChainPackBufferWriter.pack(SHVIMap({"a": 1}))
+    with pytest.raises(ValueError):
+        ChainPackBufferWriter.pack(object())  # type: ignore
+
+
+def test_buffer_writer_cstring():
+    obj = ChainPackBufferWriter()
+    obj.write_cstring("foo")
+    assert obj.buffer == b"\x8efoo\x00"
+
+
 def test_writer_cstring():
     obj = ChainPackWriter()
     obj.write_cstring("foo")
@@ -0,0 +1,383 @@
+"""Check history recording and getLog implementation."""
+
+import asyncio
+import dataclasses
+import datetime
+
+import pytest
+
+from shv.chainpack import ChainPack
+from shv.history import (
+    HistoryColumns,
+    HistoryLog,
+    HistoryReader,
+    HistoryRecord,
+    SHVHistory,
+    msec_to_datetime,
+)
+from shv.rpcapi import SHVBase
+from shv.rpcdef import RpcAccess, RpcInvalidParamError
+from shv.rpcmessage import RpcMessage
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+T0 = 1_700_000_000_000
+
+
+def record(i: int, msec: int | None = None) -> HistoryRecord:
+    return HistoryRecord(
+        timestamp=msec_to_datetime(T0 + i if msec is None else msec),
+        path=f"test/node{i % 3}",
+        value=i,
+    )
+
+
+@pytest.fixture(name="log")
+def fixture_log(tmp_path):
+    log = HistoryLog(tmp_path, segment_size=4096)
+    log.INDEX_STEP = 256
+    for i in range(1000):
+        log.append(record(i))
+    yield log
+    log.close()
+
+
+def test_segments(log, tmp_path):
+    log.flush()
+    assert len(list(tmp_path.glob("*.chainpack"))) > 1
+    assert log.size == sum(p.stat().st_size for p in tmp_path.glob("*.chainpack"))
+    assert log.paths == {"test/node0", "test/node1", "test/node2"}
+
+
+def test_records_all(log):
+    assert [r.value for r in log.records()] == list(range(1000))
+
+
+@pytest.mark.parametrize(
+    "since,until,result",
+    (
+        (100, 200, range(100, 200)),
+        (0, 1, range(0, 1)),
+        (-10, 5, range(0, 5)),
+        (995, 2000, range(995, 1000)),
+        (200, 100, range(199, 99, -1)),
+        (5, -10, range(4, -1, -1)),
+        (2000, 995, range(999, 994, -1)),
+        (500, 500, range(0)),
+        (2000, 3000, range(0)),
+    ),
+)
+def test_records_range(log, since, until, result):
+    assert [
+        r.value
+        for r in log.records(msec_to_datetime(T0 + since), msec_to_datetime(T0 + until))
+    ] == list(result)
+
+
+def test_records_open_range(log):
+    assert [r.value for r in log.records(since=msec_to_datetime(T0 + 990))] == list(
+        range(990, 1000)
+    )
+    assert [r.value for r in log.records(until=msec_to_datetime(T0 + 10))] == list(
+        range(10)
+    )
+
+
+def test_records_path(log):
+    assert [
+        r.value
+        for r in log.records(
+            msec_to_datetime(T0 + 20), msec_to_datetime(T0 + 10), "test/node1"
+        )
+    ] == [19, 16, 13, 10]
+    assert not list(log.records(path="test/node"))
+
+
+def test_timestamp_monotonic(tmp_path):
+    log = HistoryLog(tmp_path)
+    log.append(record(0, T0 + 10))
+    log.append(record(1, T0))
+    assert [r.timestamp for r in log.records()] == [msec_to_datetime(T0 + 10)] * 2
+    log.close()
+
+
+def test_reopen(log, tmp_path):
+    log.close()
+    log = HistoryLog(tmp_path, segment_size=4096)
+    log.append(record(1000))
+    assert [r.value for r in log.records()] == list(range(1001))
+    assert log.paths == {"test/node0", "test/node1", "test/node2"}
+    log.close()
+
+
+def test_recover(log, tmp_path):
+    log.close()
+    segment = sorted(tmp_path.glob("*.chainpack"))[-1]
+    with segment.open("ab") as file:
+        file.write(b"\x8a\x41")  # Partial record
+    sorted(tmp_path.glob("*.index"))[-1].unlink()
+    log = HistoryLog(tmp_path, segment_size=4096)
+    assert [r.value for r in log.records()] == list(range(1000))
+    assert [
+        r.value
+        for r in log.records(msec_to_datetime(T0 + 999), msec_to_datetime(T0 + 990))
+    ] == list(range(998, 989, -1))
+    log.append(record(1000))
+    assert [r.value for r in log.records()][-2:] == [999, 1000]
+    log.close()
+
+
+def test_max_size(tmp_path):
+    log = HistoryLog(tmp_path, segment_size=1024, max_size=4096)
+    for i in range(1000):
+        log.append(record(i))
+    assert log.size <= 4096 + 1024
+    assert [r.value for r in log.records()][-1] == 999
+    log.close()
+
+
+def test_reader(tmp_path):
+    log = HistoryLog(tmp_path)
+    for i in range(10):
+        log.append(record(i))
+    log.append(HistoryRecord(msec_to_datetime(T0 + 10), "test/node0x", value=10))
+    log.append(HistoryRecord(msec_to_datetime(T0 + 11), "test", value=b"x" * 10000))
+    log.close()
+    with HistoryReader(next(tmp_path.glob("*.chainpack"))) as reader:
+        cursors = list(reader)
+        assert [c.msec for c in cursors] == list(range(T0, T0 + 12))
+        assert cursors[3].path == "test/node0"
+        assert cursors[3].timestamp == msec_to_datetime(T0 + 3)
+        assert cursors[3].record() == record(3)
+        assert bytes(cursors[3].raw) == ChainPack.pack(record(3).to_shv())
+        assert [
+            c.record().value
+            for c in reader.records(
+                msec_to_datetime(T0 + 1), msec_to_datetime(T0 + 10), "test/node0"
+            )
+        ] == [3, 6, 9]
+        assert [c.path for c in reader.records(path="test")] == [
+            c.path for c in cursors
+        ]
+        del cursors
+
+
+def test_reader_list(tmp_path):
+    path = tmp_path / "records.chainpack"
+    path.write_bytes(ChainPack.pack([record(i).to_shv() for i in range(5)]))
+    with HistoryReader(path) as reader:
+        assert [c.record() for c in reader] == [record(i) for i in range(5)]
+
+
+@pytest.mark.parametrize(
+    "data",
+    (
+        b"\x8a\x41\x8d",
+        b"\x8a\x42\x86\x01a\xff",
+        b"\x8b\xff",
+    ),
+)
+def test_reader_invalid(tmp_path, data):
+    path = tmp_path / "invalid.chainpack"
+    path.write_bytes(data)
+    with HistoryReader(path) as reader, pytest.raises(ValueError):
+        list(reader)
+
+
+def test_reader_empty(tmp_path):
+    path = tmp_path / "empty.chainpack"
+    path.touch()
+    with HistoryReader(path) as reader:
+        assert not list(reader)
+
+
+def test_record_getlog():
+    rec = dataclasses.replace(record(4), signal="fchng", user_id="foo")
+    assert rec.to_getlog("test") == {
+        1: rec.timestamp,
+        3: "node1",
+        4: "fchng",
+        6: 4,
+        7: "foo",
+    }
+    assert rec.to_getlog("test/node1") == {1: rec.timestamp, 4: "fchng", 6: 4, 7: "foo"}
+    assert HistoryRecord.from_shv(rec.to_shv()) == rec
+
+
+def test_record_from_getlog():
+    rec = dataclasses.replace(record(4), signal="fchng", user_id="foo")
+    assert HistoryRecord.from_getlog(rec.to_getlog("test"), "test") == rec
+    assert HistoryRecord.from_getlog(rec.to_getlog(), "") == rec
+    assert HistoryRecord.from_getlog({1: rec.timestamp, 2: 0, 6: 4}, "", rec) == rec
+
+
+requires_numpy = pytest.mark.skipif(numpy is None, reason="numpy not installed")
+
+
+@pytest.fixture(name="columns")
+def fixture_columns():
+    columns = HistoryColumns()
+    columns.extend(record(i) for i in range(6))
+    columns.add(HistoryRecord(msec_to_datetime(T0 + 6), "test/str", value="a"))
+    columns.add(HistoryRecord(msec_to_datetime(T0 + 7), "test/str", value=None))
+    columns.add(HistoryRecord(msec_to_datetime(T0 + 8), "test/str", value="b"))
+    columns.add(HistoryRecord(msec_to_datetime(T0 + 9), "test/str", value="a"))
+    columns.add(HistoryRecord(msec_to_datetime(T0 + 6), "test/float", value=1))
+    columns.add(HistoryRecord(msec_to_datetime(T0 + 7), "test/float", value=None))
+    columns.add(HistoryRecord(msec_to_datetime(T0 + 8), "test/float", value=0.5))
+    columns.add(HistoryRecord(msec_to_datetime(T0 + 9), "test/any", value=[1]))
+    return columns
+
+
+@requires_numpy
+def test_columns(columns):
+    assert len(columns) == 14
+    assert set(columns.paths) == {
+        "test/node0",
+        "test/node1",
+        "test/node2",
+        "test/str",
+        "test/float",
+        "test/any",
+    }
+    node1 = columns.columns("test/node1")
+    epoch = T0 - ChainPack.SHV_EPOCH_SEC * 1000
+    assert node1["timestamp"].dtype == numpy.int64
+    assert node1["timestamp"].tolist() == [epoch + 1, epoch + 4]
+    assert node1["value"].dtype == numpy.int64
+    assert node1["value"].tolist() == [1, 4]
+    assert node1["signal"].tolist() == [0, 0]
+    assert node1["signal_dict"].tolist() == ["chng"]
+    assert node1["user_id"].tolist() == [-1, -1]
+    assert node1["user_id_dict"].tolist() == []
+    string = columns.columns("test/str")
+    assert string["value"].dtype == numpy.int32
+    assert string["value"].tolist() == [0, -1, 1, 0]
+    assert string["value_dict"].tolist() == ["a", "b"]
+    flt = columns.columns("test/float")
+    assert flt["value"].dtype == numpy.float64
+    assert numpy.array_equal(flt["value"], [1.0, numpy.nan, 0.5], equal_nan=True)
+    assert columns.columns("test/any")["value_dict"].tolist() == ["[1]"]
+
+
+@requires_numpy
+def test_columns_mixed():
+    columns = HistoryColumns()
+    for i, value in enumerate((1, "1", None, [1], "[1]", True)):
+        columns.add(HistoryRecord(msec_to_datetime(T0 + i), "test", value=value))
+    res = columns.columns("test")
+    assert res["value"].tolist() == [0, 1, -1, 2, 3, 4]
+    assert res["value_dict"].tolist() == ["1", '"1"', "[1]", '"[1]"', "true"]
+
+
+@requires_numpy
+def test_columns_getlog():
+    columns = HistoryColumns()
+    rec = dataclasses.replace(record(4), source="val", user_id="foo")
+    columns.add_getlog([rec.to_getlog("test"), {1: rec.timestamp, 2: 0, 6: 5}], "test")
+    columns.add_history_records([record(1).to_shv()])
+    assert set(columns.paths) == {"test/node1"}
+    assert columns.columns("test/node1")["value"].tolist() == [4, 5, 1]
+    assert columns.columns("test/node1")["user_id"].tolist() == [0, 0, -1]
+    with pytest.raises(ValueError):
+        columns.add_getlog([{1: rec.timestamp, 2: 1}])
+
+
+@requires_numpy
+def test_columns_save(columns, tmp_path):
+    columns.save_npz(tmp_path / "columns.npz")
+    with numpy.load(tmp_path / "columns.npz") as npz:
+        assert npz["test/str:value_dict"].tolist() == ["a", "b"]
+        assert npz["test/node0:value"].tolist() == [0, 3]
+    columns.save_columns(tmp_path / "columns")
+    value = numpy.load(tmp_path / "columns" / "test" / "node2" / "value.npy")
+    assert value.tolist() == [2, 5]
+
+
+@requires_numpy
+def test_columns_keep(columns):
+    timestamps = columns.columns("test/node1")["timestamp"]
+    columns.add(record(7))
+    assert len(timestamps) == 2
+    assert len(columns.columns("test/node1")["timestamp"]) == 3
+
+
+@requires_numpy
+@pytest.mark.parametrize("path", ("../../escape", "/abs", "test//node", "test/."))
+def test_columns_save_invalid(columns, tmp_path, path):
+    columns.add(HistoryRecord(msec_to_datetime(T0 + 10), path, value=1))
+    with pytest.raises(ValueError):
+        columns.save_columns(tmp_path / "a" / "b")
+    assert not any(tmp_path.rglob("*.npy"))
+
+
+@pytest.fixture(name="history")
+async def fixture_history(shvbroker, url, tmp_path):
+    url = dataclasses.replace(
+        url,
+        login=dataclasses.replace(
+            url.login, options={"device": {"deviceId": "history"}}
+        ),
+    )
+    log = HistoryLog(tmp_path)
+    history = await SHVHistory.connect(url, log)
+    await history.subscribe("test/**:*:*")
+    yield history
+    await history.disconnect()
+    log.close()
+
+
+async def test_getlog(client, value_client, history, example_device):
+    since = datetime.datetime.now(datetime.UTC)
+    for i in range(1, 4):
+        await value_client.prop_set("test/device/track/1", [i])
+    await value_client.prop_set("test/device/track/2", [4])
+    await asyncio.sleep(0.1)  # Signals are delivered asynchronously
+    res = await client.call(".history/test/device/track", "getLog", {1: since})
+    assert [(r.get(3), r[6]) for r in res] == [
+        ("1", [1]),
+        ("1", [2]),
+        ("1", [3]),
+        ("2", [4]),
+    ]
+    res = await client.call(
+        ".history/test/device/track/1",
+        "getLog",
+        {1: datetime.datetime.now(datetime.UTC), 2: since, 3: 2},
+    )
+    assert [r[6] for r in res] == [[3], [2]]
+    res = await client.call(
+        ".history/test/device", "getLog", {1: since, 4: "track/2:*:chng"}
+    )
+    assert [(r[3], r[6]) for r in res] == [("track/2", [4])]
+
+
+async def test_getlog_invalid(client, history):
+    with pytest.raises(RpcInvalidParamError):
+        await client.call(".history", "getLog", {3: -1})
+
+
+async def test_getlog_yield(history):
+    history.GETLOG_YIELD_STEP = 1
+    for i in range(10):
+        await history._got_signal(SHVBase.Signal(RpcMessage.signal("test/a", value=i)))
+    task = asyncio.create_task(history._getlog("test", None, RpcAccess.READ))
+    await asyncio.sleep(0)
+    await history._got_signal(SHVBase.Signal(RpcMessage.signal("test/a", value=10)))
+    assert len(history._pending) == 1
+    assert [r[6] for r in await task] == list(range(10))
+    assert [r.value for r in history.log.records()] == list(range(11))
+
+
+async def test_history_ls_dir(client, value_client, history, example_device):
+    await value_client.prop_set("test/device/track/1", [1])
+    await asyncio.sleep(0.1)
+    assert await client.ls(".history") == [".app", "test"]
+    assert await client.ls(".history/test/device") == ["track"]
+    assert await client.dir_exists(".history/test/device/track/1", "getLog")
+    dirs = {d.name: d for d in await client.dir(".history/test")}
+    assert dirs["getLog"].param == "!getLogP"
+    assert dirs["getLog"].access is RpcAccess.READ
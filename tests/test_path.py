@@ -4,7 +4,7 @@ import os
 
 import pytest
 
-from shv.path import SHVPath
+from shv.path import PathTree, SHVPath
 
 
 def test_nospace():
@@ -180,3 +180,88 @@ def test_with_suffix():
     assert SHVPath("some/node.txt.gz").with_suffix(".xz") == "some/node.xz"
     with pytest.raises(ValueError):
         SHVPath().with_suffix(".xz")
+
+
+@pytest.fixture(name="tree")
+def fixture_tree():
+    tree = PathTree()
+    tree.set("test/device", 1)
+    tree.set("test/other/device", 2)
+    tree.set("foo", 3)
+    return tree
+
+
+@pytest.mark.parametrize(
+    "path,result",
+    (
+        ("", None),
+        ("test", None),
+        ("test/dev", None),
+        ("test/device", (1, "")),
+        ("test/device/track/1", (1, "track/1")),
+        ("test/devices", None),
+        ("test/other/device/", (2, "")),
+        ("foo/.app", (3, ".app")),
+    ),
+)
+def test_lookup(tree, path, result):
+    assert tree.lookup(path) == result
+
+
+@pytest.mark.parametrize(
+    "path,is_node,overlaps",
+    (
+        ("", True, True),
+        ("test", True, True),
+        ("test/dev", False, False),
+        ("test/device", True, True),
+        ("test/device/track", False, True),
+        ("test/other", True, True),
+        ("bar", False, False),
+    ),
+)
+def test_is_node(tree, path, is_node, overlaps):
+    assert tree.is_node(path) is is_node
+    assert tree.overlaps(path) is overlaps
+
+
+def test_pop(tree):
+    assert tree.pop("test/other") is None
+    assert tree.pop("test/other/device") == 2
+    assert tree.pop("test/other/device") is None
+    assert not tree.is_node("test/other")
+    assert tree.is_node("test")
+    assert tree.pop("test/device") == 1
+    assert not tree.is_node("test")
+    assert tree.pop("foo") == 3
+    assert not tree.is_node("")
+
+
+@pytest.mark.parametrize(
+    "path,closest,get",
+    (
+        ("", None, None),
+        ("test", None, None),
+        ("test/device", 1, 1),
+        ("test/device/track/1", 1, None),
+        ("test/devices", None, None),
+        ("foo/.app", 3, None),
+    ),
+)
+def test_closest_get(tree, path, closest, get):
+    assert tree.closest(path) == closest
+    assert tree.get(path) == get
+
+
+@pytest.mark.parametrize(
+    "path,values",
+    (
+        ("", {1, 2, 3}),
+        ("test", {1, 2}),
+        ("test/other", {2}),
+        ("test/dev", set()),
+        ("foo/bar", set()),
+    ),
+)
+def test_values(tree, path, values):
+    assert set(tree.values(path)) == values
@@ -0,0 +1,84 @@
+"""Check RpcMessage and its lazy decoding."""
+
+import pytest
+
+from shv.chainpack import ChainPack, ChainPackBufferWriter
+from shv.rpcdef import RpcAccess, RpcMethodNotFoundError
+from shv.rpcmessage import RpcMessage
+
+MESSAGES = [
+    RpcMessage.request("test/device", "ls", cids=[1, 2]),
+    RpcMessage.request("test/device", "set", {"foo": [1, b"\x00\xff", 2.5]}),
+    RpcMessage.request("test/device", "get").make_response(b"x" * 1024),
+    RpcMessage.request("test/device", "get").make_response(),
+    RpcMessage.request("test/device", "get").make_response(RpcMethodNotFoundError()),
+    RpcMessage.request("test/device", "get").make_response_delay(0.5),
+    RpcMessage.request("test/device", "get").make_abort(True),
+    RpcMessage.signal("test/device", value="foo", access=RpcAccess.WRITE),
+]
+
+
+@pytest.mark.parametrize("msg", MESSAGES)
+def test_from_chainpack(msg):
+    data = msg.to_chainpack()
+    lazy = RpcMessage.from_chainpack(data)
+    assert lazy.is_valid()
+    assert lazy.type is msg.type
+    assert lazy.meta == msg.value.meta
+    assert lazy.to_chainpack() == data
+    assert lazy._value is None  # Nothing above should decode body
+    assert lazy == msg
+
+
+@pytest.mark.parametrize("msg", MESSAGES)
+def test_from_chainpack_modified_meta(msg):
+    data = msg.to_chainpack()
+    lazy = RpcMessage.from_chainpack(data)
+    eager = RpcMessage(ChainPack.unpack(data))
+    for m in (lazy, eager):
+        m.caller_ids = [*m.caller_ids, 42]
+        m.path = "other"
+    assert lazy.to_chainpack() == eager.to_chainpack()
+    assert lazy == eager
+
+
+def test_from_chainpack_param():
+    data = MESSAGES[1].to_chainpack()
+    lazy = RpcMessage.from_chainpack(data)
+    assert lazy.param == {"foo": [1, b"\x00\xff", 2.5]}
+    eager = RpcMessage(ChainPack.unpack(data))
+    for m in (lazy, eager):
+        m.param = 42
+    assert lazy.to_chainpack() == eager.to_chainpack()
+
+
+@pytest.mark.parametrize(
+    "data",
+    (
+        b"",
+        ChainPack.pack([1, 2]),
+        ChainPack.pack({"foo": 1}),
+        b"\x8bHA\xff\x8aA\x86\x05foo\xff",
+        b"\x8bHA\xff\x8a\x01A\xff",
+        b"\x8bHA\xff\x8aAB",
+    ),
+)
+def test_from_chainpack_invalid(data):
+    with pytest.raises(ValueError):
+        RpcMessage.from_chainpack(data)
+
+
+def test_write_chainpack_head():
+    data = MESSAGES[2].to_chainpack()
+    lazy = RpcMessage.from_chainpack(data)
+    eager = RpcMessage(ChainPack.unpack(data))
+    for m in (lazy, eager):
+        m.caller_ids = [3]
+    writer = ChainPackBufferWriter()
+    body = lazy.write_chainpack_head(writer)
+    assert isinstance(body, memoryview)
+    assert body.obj is data
+    assert bytes(writer.buffer) + body == eager.to_chainpack()
+    writer = ChainPackBufferWriter()
+    assert eager.write_chainpack_head(writer) == b""
+    assert bytes(writer.buffer) == eager.to_chainpack()
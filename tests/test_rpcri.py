@@ -2,7 +2,14 @@
 
 import pytest
 
-from shv.rpcri import rpcri_legacy_subscription, rpcri_match, rpcri_relative_to
+from shv.rpcri import (
+    CompiledRpcRI,
+    RpcRIIndex,
+    rpcri_compile,
+    rpcri_legacy_subscription,
+    rpcri_match,
+    rpcri_relative_to,
+)
 
 
 @pytest.mark.parametrize(
@@ -32,10 +39,77 @@ from shv.rpcri import rpcri_legacy_subscription, rpcri_match, rpcri_relative_to
         ("**/bar:ls", "foo/bar/boo", "ls", None, False),
         ("**/boo/**:ls", "foo/bar/boo", "ls", None, False),
         ("", "", "ls", None, False),
+        ("foo/b?r:l[st]", "foo/bar", "ls", None, True),
+        ("foo/[!b]ar:ls", "foo/bar", "ls", None, False),
+        ("foo/bar:ls:lsmod:", "foo/bar", "ls", "lsmod", False),
     ),
 )
 def test_rpcri_match(ri, path, method, signal, result):
     assert rpcri_match(ri, path, method, signal) is result
+    assert CompiledRpcRI(ri).match(path, method, signal) is result
+
+
+def test_rpcri_compile():
+    cri = rpcri_compile("test/**:*:*chng")
+    assert cri is rpcri_compile("test/**:*:*chng")
+    assert cri.ri == "test/**:*:*chng"
+    assert cri.match_path("test/device")
+    assert not cri.match_path("other/device")
+
+
+INDEX_RIS = [
+    ":*:*",
+    "**:*:*",
+    "**:*:*chng",
+    "**/**:*:*",
+    "**/bar:*:*",
+    "**/bar/**:get:*",
+    "**/boo:*:lsmod",
+    "*:ls:lsmod",
+    "*/*/boo:*:*",
+    "foo/**:*:*",
+    "foo/b?r/*:*:chng",
+    "foo/bar/boo:get:chng",
+    "foo/bar/boo:ls",
+    "foo/[bf]ar:*:*",
+    "foo:*:*",
+]
+
+
+@pytest.mark.parametrize(
+    "path,method,signal",
+    (
+        ("", "ls", "lsmod"),
+        ("foo", "get", "chng"),
+        ("foo", "get", "fchng"),
+        ("foo/bar", "ls", "lsmod"),
+        ("foo/bar/boo", "get", "chng"),
+        ("foo/bar/boo", "ls", "lsmod"),
+        ("foo/far/boo", "set", "chng"),
+        ("one/two/three", "get", "chng"),
+        ("foo/bar/boo/bar", "get", "chng"),
+    ),
+)
+def test_rpcri_index(path, method, signal):
+    index = RpcRIIndex()
+    for ri in INDEX_RIS:
+        index.add(ri)
+    assert len(index) == len(INDEX_RIS) - 1  # The method RI is ignored
+    assert sorted(index.match(path, method, signal)) == sorted(
+        ri for ri in INDEX_RIS if rpcri_match(ri, path, method, signal)
+    )
+
+
+def test_rpcri_index_remove():
+    index = RpcRIIndex()
+    for ri in INDEX_RIS:
+        index.add(ri)
+    for ri in INDEX_RIS:
+        index.remove(ri)
+    index.remove("foo/**:*:*")
+    assert len(index) == 0
+    assert not index._root
+    assert list(index.match("foo/bar/boo", "get", "chng")) == []
 
 
 @pytest.mark.parametrize(
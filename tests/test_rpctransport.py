@@ -25,16 +25,30 @@ from shv.rpctransport import (
     RpcClientCAN,
     RpcClientPipe,
     RpcClientTCP,
+    RpcClientTCPBuffered,
     RpcClientTTY,
     RpcClientUnix,
+    RpcClientUnixBuffered,
     RpcClientWebSockets,
+    RpcProtocolBlock,
+    RpcProtocolSerial,
+    RpcProtocolSerialCRC,
     RpcServerCAN,
     RpcServerTCP,
+    RpcServerTCPBuffered,
     RpcServerTTY,
     RpcServerUnix,
+    RpcServerUnixBuffered,
     RpcServerWebSockets,
     RpcServerWebSocketsUnix,
 )
+from shv.rpctransport.buffered import RpcStreamProtocol
+from shv.rpctransport.stream import RpcStreamReader
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 logger = logging.getLogger(__name__)
 
@@ -89,8 +103,27 @@ class PTYPort:
                     return
 
 
+@pytest.fixture(
+    scope="module",
+    params=(
+        pytest.param("asyncio"),
+        pytest.param(
+            "uvloop",
+            marks=pytest.mark.skipif(uvloop is None, reason="uvloop not installed"),
+        ),
+    ),
+)
+def event_loop_policy(request):
+    """Run all transport tests in asyncio as well as uvloop event loop."""
+    if request.param == "uvloop":
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
 @pytest.fixture(name="pty")
-def fixture_pty():
+def fixture_pty(event_loop_policy):
+    if uvloop is not None and isinstance(event_loop_policy, uvloop.EventLoopPolicy):
+        pytest.skip("TTY is not supported with uvloop")
     with PTYPort.new() as port:
         yield port
 
@@ -108,6 +141,23 @@ class Link:
         await clients[1].send(msg)
         assert await clients[0].receive() == msg
 
+    async def test_send_many(self, clients):
+        msgs = [
+            RpcMessage.request(".app", "ping", rid=1),
+            RpcMessage.signal("test", value=list(range(100))),
+            RpcMessage.from_chainpack(
+                RpcMessage.request("test", "set", 42, rid=2).to_chainpack()
+            ),
+        ]
+        await clients[0].send_many(msgs)
+        await clients[0].send(msgs[0])
+        for msg in (*msgs, msgs[0]):
+            assert await clients[1].receive() == msg
+        assert clients[0].send_batches == 2
+        assert clients[0].send_messages == 4
+        assert clients[0].send_batch_max == 3
+        assert clients[0].send_batch_mean == 2
+
     @pytest.mark.parametrize("a,b", ((0, 1), (1, 0)))
     async def test_reset(self, clients, a, b):
         await clients[a].reset()
@@ -162,6 +212,9 @@ class TestPipe(Link):
 class TestTCP(ServerLink):
     """Check that TCP/IP transport protocol works."""
 
+    SERVER: type[RpcServerTCP | RpcServerTCPBuffered] = RpcServerTCP
+    CLIENT: type[RpcClientTCP | RpcClientTCPBuffered] = RpcClientTCP
+
     @pytest.fixture(name="ssl")
     def fixture_ssl(self):
         return None, None
@@ -169,7 +222,7 @@ class TestTCP(ServerLink):
     @pytest.fixture(name="server")
     async def fixture_server(self, port, ssl):
         queue = asyncio.Queue()
-        server = RpcServerTCP(queue.put, "localhost", port, ssl=ssl[1])
+        server = self.SERVER(queue.put, "localhost", port, ssl=ssl[1])
         await server.listen()
         yield server, queue
         server.close()
@@ -177,7 +230,7 @@ class TestTCP(ServerLink):
 
     @pytest.fixture(name="clients")
     async def fixture_clients(self, server, port, ssl):
-        client = await RpcClientTCP.connect("localhost", port, ssl=ssl[0])
+        client = await self.CLIENT.connect("localhost", port, ssl=ssl[0])
         server_client = await server[1].get()
         yield server_client, client
         client.disconnect()
@@ -186,7 +239,7 @@ class TestTCP(ServerLink):
         await server_client.wait_disconnect()
 
     async def test_before_connect(self, port) -> None:
-        client = RpcClientTCP("localhost", port)
+        client = self.CLIENT("localhost", port)
         with pytest.raises(EOFError):
             await client.receive()
         with pytest.raises(EOFError):
@@ -223,9 +276,31 @@ class TestSSL(TestTCP):
         assert clients[1].secure
 
 
+class TestTCPBuffered(TestTCP):
+    """Check that TCP/IP transport with buffered protocol works."""
+
+    SERVER = RpcServerTCPBuffered
+    CLIENT = RpcClientTCPBuffered
+
+    async def test_big_msg(self, clients):
+        msg = RpcMessage.signal("test", value=bytes(range(256)) * 1024)
+        await clients[1].send(msg)
+        assert await clients[0].receive() == msg
+
+
+class TestSSLBuffered(TestSSL):
+    """Check that TCP/IP SSL transport with buffered protocol works."""
+
+    SERVER = RpcServerTCPBuffered
+    CLIENT = RpcClientTCPBuffered
+
+
 class TestUnix(ServerLink):
     """Check that Unix transport protocol works."""
 
+    SERVER: type[RpcServerUnix | RpcServerUnixBuffered] = RpcServerUnix
+    CLIENT: type[RpcClientUnix | RpcClientUnixBuffered] = RpcClientUnix
+
     @pytest.fixture(name="sockpath")
     def fixture_sockpath(self, tmp_path):
         return tmp_path / "s"
@@ -233,7 +308,7 @@ class TestUnix(ServerLink):
     @pytest.fixture(name="server")
     async def fixture_server(self, sockpath):
         queue = asyncio.Queue()
-        server = RpcServerUnix(queue.put, sockpath)
+        server = self.SERVER(queue.put, sockpath)
         await server.listen()
         yield server, queue
         server.close()
@@ -241,7 +316,7 @@ class TestUnix(ServerLink):
 
     @pytest.fixture(name="clients")
     async def fixture_clients(self, server, sockpath):
-        client = await RpcClientUnix.connect(sockpath)
+        client = await self.CLIENT.connect(sockpath)
         server_client = await server[1].get()
         yield server_client, client
         server_client.disconnect()
@@ -250,6 +325,18 @@ class TestUnix(ServerLink):
         await client.wait_disconnect()
 
 
+class TestUnixBuffered(TestUnix):
+    """Check that Unix transport with buffered protocol works."""
+
+    SERVER = RpcServerUnixBuffered
+    CLIENT = RpcClientUnixBuffered
+
+    async def test_big_msg(self, clients):
+        msg = RpcMessage.signal("test", value=bytes(range(256)) * 1024)
+        await clients[1].send(msg)
+        assert await clients[0].receive() == msg
+
+
 class TestTTY(Link):
     """Check that we can work over TTY port transport protocol."""
 
@@ -430,3 +517,98 @@ class TestCAN(ServerLink):
 
         for local in dynamic:
             await local.deactivate()
+
+
+@pytest.mark.parametrize(
+    "data,msgs,size",
+    (
+        (b"", [], 0),
+        (b"\x03ab", [], 0),
+        (b"\x80", [], 0),
+        (b"\x01a\x02bc\x03d", [b"a", b"bc"], 5),
+        (b"\x80\x80" + 128 * b"x" + b"\x00", [128 * b"x", b""], 131),
+    ),
+)
+def test_block_decode(data, msgs, size):
+    assert RpcProtocolBlock.decode(bytearray(data)) == (msgs, size)
+
+
+@pytest.mark.parametrize(
+    "protocol", (RpcProtocolBlock, RpcProtocolSerial, RpcProtocolSerialCRC)
+)
+async def test_stream_reader(protocol):
+    reader = asyncio.StreamReader()
+    msgs = [b"\x01a", 200 * b"b", b"c"]
+    data = b"".join(protocol.annotate(msg) for msg in msgs)
+    reader.feed_data(data[:3])
+    reader.feed_data(data[3:])
+    reader.feed_eof()
+    stream = RpcStreamReader(reader, protocol)
+    assert [await stream.receive() for _ in msgs] == msgs
+    with pytest.raises(EOFError):
+        await stream.receive()
+
+
+@pytest.mark.parametrize(
+    "protocol,data,msgs,size",
+    (
+        (RpcProtocolSerial, b"", [], 0),
+        (RpcProtocolSerial, b"xx\xa2ab", [], 2),
+        (RpcProtocolSerial, b"\xa2a\xa3x\xa2b\xaa\x02\xa3\xa2c", [b"a", b"b\xa2"], 9),
+        (RpcProtocolSerial, b"\xa2a\xa4\xa2b\xa3", [b"b"], 6),
+        (RpcProtocolSerialCRC, b"\xa2a\xa3\xe8\xb7\xbe", [], 0),
+        (RpcProtocolSerialCRC, b"\xa2a\xa3\xe8\xb7\xbeC\xa2", [b"a"], 7),
+        (RpcProtocolSerialCRC, b"\xa2a\xa3\x00\x00\x00\x00\xa2b", [], 7),
+    ),
+)
+def test_serial_decode(protocol, data, msgs, size):
+    assert protocol.decode(bytearray(data)) == (msgs, size)
+
+
+@pytest.mark.parametrize(
+    "data",
+    (b"", b"abc", b"\xa2\xa3\xa4\xaa", b"a\xaa\x02\xaa"),
+)
+def test_serial_escape(data):
+    escaped = RpcProtocolSerial.escape(data)
+    assert not {0xA2, 0xA3, 0xA4} & set(escaped)
+    assert RpcProtocolSerial.deescape(escaped) == data
+
+
+class _PausableTransport(asyncio.Transport):
+    def __init__(self):
+        super().__init__()
+        self.paused = False
+
+    def is_closing(self):
+        return False
+
+    def pause_reading(self):
+        self.paused = True
+
+    def resume_reading(self):
+        self.paused = False
+
+
+@pytest.mark.parametrize("protocol", (RpcProtocolBlock, RpcProtocolSerial))
+async def test_stream_protocol_backpressure(protocol):
+    """Check that buffered protocol pauses reading with too many queued messages."""
+    stream = RpcStreamProtocol(protocol)
+    transport = _PausableTransport()
+    stream.connection_made(transport)
+    msgs = [i.to_bytes(2, "big") + 1022 * b"x" for i in range(400)]
+    data = b"".join(protocol.annotate(msg) for msg in msgs)
+    pos = 0
+    while pos < len(data) and not transport.paused:
+        buf = stream.get_buffer(-1)
+        chunk = data[pos : pos + min(len(buf), 1000)]
+        buf[: len(chunk)] = chunk
+        stream.buffer_updated(len(chunk))
+        pos += len(chunk)
+    assert transport.paused
+    assert pos < len(data)
+    received = []
+    while stream._msgs:
+        received.append(await stream.receive())
+    assert not transport.paused
+    assert received == msgs[: len(received)]
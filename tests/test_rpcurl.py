@@ -80,6 +80,11 @@ DATA = [
             login=RpcLogin(token="AAAAAAAAAAAAAAAA", login_type=RpcLoginType.TOKEN),
         ),
     ),
+    ("tcp://localhost?buffered=true", RpcUrl("localhost", buffered=True)),
+    (
+        "unixs:/run/shv.sock?buffered=true",
+        RpcUrl("/run/shv.sock", protocol=RpcProtocol.UNIXS, buffered=True),
+    ),
     ("serial:/dev/ttyX", RpcUrl("/dev/ttyX", protocol=RpcProtocol.TTY)),
     (
         "serial:/dev/ttyX?baudrate=1152000",
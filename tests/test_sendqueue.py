@@ -0,0 +1,88 @@
+"""Check the priority send queue."""
+
+from shv.rpcapi import RpcSendQueue
+from shv.rpcmessage import RpcMessage
+
+
+def test_priority():
+    queue = RpcSendQueue()
+    request = RpcMessage.request("test", "get")
+    msgs = [
+        RpcMessage.signal("test", "fchng"),
+        request,
+        request.make_response(42),
+        request.make_abort(True),
+    ]
+    for msg in msgs:
+        assert queue.push(msg)
+    assert len(queue) == 4
+    assert [queue.pop() for _ in range(5)] == [*msgs[2:], msgs[1], msgs[0], None]
+
+
+def test_drop():
+    queue = RpcSendQueue(
+        {RpcSendQueue.Priority.SIGNAL: 2, RpcSendQueue.Priority.REQUEST: 2},
+        {RpcSendQueue.Priority.REQUEST: RpcSendQueue.DropPolicy.NEWEST},
+    )
+    signals = [RpcMessage.signal(f"test/{i}", "fchng") for i in range(3)]
+    requests = [RpcMessage.request(f"test/{i}", "get") for i in range(3)]
+    assert all(queue.push(msg) for msg in signals)
+    assert [queue.push(msg) for msg in requests] == [True, True, False]
+    assert queue.dropped == {
+        RpcSendQueue.Priority.RESPONSE: 0,
+        RpcSendQueue.Priority.REQUEST: 1,
+        RpcSendQueue.Priority.SIGNAL: 1,
+    }
+    assert [queue.pop() for _ in range(4)] == [*requests[:2], *signals[1:]]
+
+
+def test_coalesce():
+    queue = RpcSendQueue()
+    msgs = [
+        RpcMessage.signal("test/a", value=1),
+        RpcMessage.signal("test/b", value=1),
+        RpcMessage.signal("test/a", value=2),
+        RpcMessage.signal("test/a", "fchng", value=3),
+        RpcMessage.signal("test/a", "fchng", value=4),
+        RpcMessage.signal("test/a", "lsmod", value=5),
+        RpcMessage.signal("test/a", "lsmod", value=6),
+    ]
+    for msg in msgs:
+        assert queue.push(msg)
+    assert queue.coalesced == 2
+    assert [queue.pop() for _ in range(5)] == [msgs[2], msgs[1], *msgs[4:]]
+    assert queue.pop() is None
+    assert queue.push(msgs[0])
+    assert queue.pop() is msgs[0]
+
+
+def test_responses_not_dropped():
+    queue = RpcSendQueue()
+    for i in range(1000):
+        assert queue.push(RpcMessage.request("test", "get", rid=i).make_response(i))
+    assert len(queue) == 1000
+    assert queue.pop().result == 0
+
+
+def test_coalesce_disabled():
+    queue = RpcSendQueue(coalesce=False)
+    queue.push(RpcMessage.signal("test", value=1))
+    queue.push(RpcMessage.signal("test", value=2))
+    assert [queue.pop().param for _ in range(2)] == [1, 2]
+    assert queue.coalesced == 0
+
+
+def test_nbytes():
+    queue = RpcSendQueue()
+    msgs = [
+        RpcMessage.from_chainpack(RpcMessage.signal("test", value=i).to_chainpack())
+        for i in range(2)
+    ]
+    queue.push(msgs[0])
+    queue.push(msgs[1])
+    assert queue.nbytes == msgs[1].raw_size > 0
+    queue.push(RpcMessage.request("test", "get"))
+    assert queue.nbytes == msgs[1].raw_size
+    queue.pop()
+    queue.pop()
+    assert queue.nbytes == 0
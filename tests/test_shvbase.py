@@ -2,15 +2,18 @@
 
 import asyncio
 import collections.abc
+import contextlib
 import logging
 
 import pytest
 
 from shv import SHV_VERSION, SHVType
+from shv.chainpack import ChainPack
 from shv.rpcapi import SHVBase
 from shv.rpcdef import (
     RpcDir,
     RpcInvalidParamError,
+    RpcMethodNotFoundError,
     RpcRequestInvalidError,
     RpcTryAgainLaterError,
     RpcUserIDRequiredError,
@@ -28,6 +31,10 @@ class App(SHVBase):
         super().__init__(*args, **kwargs)
         self.event = asyncio.Event()
         self.cancelled = False
+        self.signals: asyncio.Queue[SHVType] = asyncio.Queue()
+
+    async def _got_signal(self, signal: SHVBase.Signal) -> None:
+        await self.signals.put(signal.param)
 
     async def _method_call(self, request: SHVBase.Request) -> SHVType:
         match request.path, request.method:
@@ -77,6 +84,28 @@ async def test_req_ping(con):
     assert await con[1].receive() == msg.make_response()
 
 
+async def test_invalid_body(con):
+    """Check that message with invalid body is dropped."""
+    data = bytes((ChainPack.ProtocolType,)) + RpcMessage.signal(
+        "test", value="invalid"
+    ).to_chainpack().replace(b"invalid", b"inv\xfflid")
+    await con[1]._send(data)
+    await con[1].send(RpcMessage.signal("test", value="valid"))
+    assert await con[0].signals.get() == "valid"
+
+
+async def test_send_invalid(con):
+    """Check that message that can't be encoded doesn't affect other messages."""
+    res = await asyncio.gather(
+        con[0]._send(RpcMessage.signal("test", value=object())),
+        con[0]._send(RpcMessage.signal("test", value="valid")),
+        return_exceptions=True,
+    )
+    assert isinstance(res[0], ValueError)
+    assert res[1] is None
+    assert await con[1].receive() == RpcMessage.signal("test", value="valid")
+
+
 async def test_delay(con):
     """Check that we report progress on our own."""
     msg = RpcMessage.request("test", "delay")
@@ -237,3 +266,44 @@ async def test_call_old(con):
     assert await con[1].receive() == msg
     await con[1].send(msg.make_response(0))
     assert await task == 0
+
+
+async def test_call_concurrent(con):
+    """Check that concurrent calls get their own responses."""
+    peer = SHVBase(con[1], peer_shv_version=SHV_VERSION)
+    res = await asyncio.gather(*(peer.call(".app", "name") for _ in range(100)))
+    assert res == 100 * ["pyshv"]
+    await peer.disconnect()
+
+
+async def test_call_many(con):
+    """Check that we get results for all calls in bounded window."""
+    peer = SHVBase(con[1], peer_shv_version=SHV_VERSION)
+    calls = [*(10 * [(".app", "name", None)]), ("test", "invalid", None)]
+    res = {}
+    async for i, value in peer.call_many(calls, window=3):
+        assert len(peer._responses) <= 3
+        res[i] = value
+    assert sorted(res) == list(range(11))
+    assert all(res[i] == "pyshv" for i in range(10))
+    assert isinstance(res[10], RpcMethodNotFoundError)
+    await peer.disconnect()
+
+
+@pytest.mark.parametrize("window", (0, -1))
+async def test_call_many_invalid_window(con, window):
+    """Check that invalid window is reported instead of no calls performed."""
+    with pytest.raises(ValueError):
+        async for _ in con[0].call_many([(".app", "name", None)], window=window):
+            pass
+
+
+async def test_call_many_break(con):
+    """Check that calls in flight are cancelled if iteration is stopped."""
+    peer = SHVBase(con[1], peer_shv_version=SHV_VERSION)
+    calls = [("test", "delay-event", None), *(10 * [(".app", "name", None)])]
+    async with contextlib.aclosing(peer.call_many(calls, window=4)) as results:
+        async for _ in results:
+            break
+    assert not peer._responses
+    await peer.disconnect()
@@ -4,6 +4,11 @@ import asyncio
 
 import pytest
 
+from example_device import ExampleDevice
+from shv import SHVType
+from shv.rpcapi import SHVBase
+from shv.rpcapi.valueclient import SHVValueClient
+
 
 async def test_prop_cache(value_client, example_device):
     """Check that we correctly cache values in value client."""
@@ -66,6 +71,74 @@ async def test_get_snapshot_lower_subscribe(value_client, example_device):
     assert "test/device/track/2" in value_client
 
 
+async def test_get_snapshot_cached_nodes(value_client, example_device):
+    """Check that get_snapshot reuses ls and dir results."""
+    await value_client.subscribe("test/device/track/*:*:*")
+    await value_client.get_snapshot()
+    assert value_client._ls_cache["test/device/track"] == [str(i) for i in range(1, 9)]
+    assert value_client._dir_cache["test/device/track/1"] is True
+    example_device.tracks["1"] = [7]  # Change without signal
+    await value_client.get_snapshot(update=True)
+    assert value_client["test/device/track/1"] == [7]
+
+
+async def test_get_snapshot_lsmod(shvbroker, url, example_device):
+    """Check that nodes cache is invalidated with lsmod signal."""
+    value_client = await SHVValueClient.connect(url)
+    await value_client.subscribe("test/**:*:*")
+    await value_client.subscribe("**:ls:lsmod")
+    await value_client.get_snapshot("test")
+    assert "test/device/track" in value_client._ls_cache
+    await example_device.disconnect()
+    await asyncio.sleep(0.1)  # Give broker time to send lsmod
+    assert "test" not in value_client._ls_cache
+    assert "test/device/track" not in value_client._ls_cache
+    assert "test/device/track/1" not in value_client._dir_cache
+    await value_client.disconnect()
+
+
+class OldDevice(ExampleDevice):
+    """Device that replies to dir with method name in the older format."""
+
+    async def _method_call(self, request: SHVBase.Request) -> SHVType:
+        res = await super()._method_call(request)
+        if request.method == "dir" and isinstance(request.param, str):
+            return {"name": request.param} if res else None
+        return res
+
+
+async def test_get_snapshot_old_dir(value_client, url_test_device):
+    """Check that get_snapshot works with older reply format for dir."""
+    device = await OldDevice.connect(url_test_device)
+    await value_client.subscribe("test/device/track/*:*:*")
+    await value_client.get_snapshot()
+    assert len(value_client) == 8
+    await device.disconnect()
+
+
+async def test_subscribe_snapshot(value_client, example_device):
+    """Check that subscribe can fetch snapshot."""
+    await value_client.subscribe("test/device/track/**:*:*", snapshot=True)
+    assert len(value_client) == 8
+    assert value_client["test/device/track/3"] == [0, 1, 2]
+
+
+async def test_changes(value_client, example_device):
+    """Check that changes since version are provided."""
+    await value_client.subscribe("test/device/track/*:*:*", snapshot=True)
+    version = value_client.version
+    assert len(list(value_client.changes())) == 8
+    assert not list(value_client.changes(version))
+    await value_client.prop_set("test/device/track/4", [4])
+    await value_client.prop_set("test/device/track/2", [2])
+    await value_client.prop_get("test/device/track/5", 8)  # Unchanged value
+    assert list(value_client.changes(version)) == [
+        ("test/device/track/4", [4]),
+        ("test/device/track/2", [2]),
+    ]
+    assert value_client.version == version + 2
+
+
 async def test_wait_for_change(value_client, example_device):
     """Check that simple wait for change notification works."""
     await value_client.subscribe("test/device/**:*:*")
@@ -126,3 +199,49 @@ async def test_prop_change_timeout(value_client, example_device):
                 "test/device/track/1", get_period=0.2, timeout=1
             )
         )
+
+
+async def test_prop_change_multiple(value_client, example_device):
+    """Check that multiple hooks can be registered for a single path."""
+    res = []
+
+    def hook1(client, path, value):
+        res.append((1, path))
+
+    def hook2(client, path, value):
+        res.append((2, path))
+
+    await value_client.subscribe("test/device/**:*:*")
+    value_client.on_change("test/device", hook1)
+    value_client.on_change("test/device", hook2, append=True)
+    value_client.on_change("test/device/track/4", hook1)
+    await value_client.prop_set("test/device/track/1", [1, 2])
+    await value_client.prop_set("test/device/track/4", [])
+    value_client.on_change_remove("test/device", hook1)
+    await value_client.prop_set("test/device/track/3", [])
+    value_client.on_change_remove("test/device", hook2)
+    await value_client.prop_set("test/device/track/2", [])
+    with pytest.raises(ValueError):
+        value_client.on_change_remove("test/device", hook2)
+
+    assert res == [
+        (1, "test/device/track/1"),
+        (2, "test/device/track/1"),
+        (1, "test/device/track/4"),
+        (2, "test/device/track/3"),
+    ]
+
+
+async def test_subtree(value_client, example_device):
+    """Check iteration over cached values in subtree."""
+    await value_client.subscribe("test/device/**:*:*", snapshot=True)
+    assert dict(value_client.subtree("test/device/track")) == {
+        f"test/device/track/{i}": list(range(i)) for i in range(1, 9)
+    }
+    assert dict(value_client.subtree("test/device/track/2")) == {
+        "test/device/track/2": [0, 1]
+    }
+    assert len(dict(value_client.subtree())) == len(value_client)
+    assert not list(value_client.subtree("test/device/track/20"))
+    await value_client.unsubscribe("test/device/**:*:*")
+    assert not list(value_client.subtree())